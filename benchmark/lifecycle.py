@@ -0,0 +1,303 @@
+import argparse
+import asyncio
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import uuid
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from typing import Awaitable, Callable, Dict, Iterable, List
+
+import httpx
+import orjson
+from sqlalchemy.engine import make_url
+
+SCENARIOS = ["signup_login", "exam_browse", "reservation_burst", "admin_confirm", "admin_confirm_batch"]
+
+
+def configure_database(url: str) -> None:
+    url = make_url(url)
+    os.environ["POSTGRESQL_USER"] = url.username or ""
+    os.environ["POSTGRESQL_PASSWORD"] = url.password or ""
+    os.environ["POSTGRESQL_HOST"] = url.host or "localhost"
+    os.environ["POSTGRESQL_PORT"] = str(url.port or 5432)
+    os.environ["POSTGRESQL_DATABASE"] = url.database
+    os.environ.setdefault("SECRET_KEY", "benchmark-secret")
+    os.environ.setdefault("LOG_LEVEL", "WARNING")
+    os.environ.setdefault("RESERVATION_ALLOCATION_INTERVAL", "0")
+
+
+def migrate(url: str) -> None:
+    from alembic import command
+    from alembic.config import Config
+
+    config = Config("alembic.ini")
+    config.set_main_option("sqlalchemy.url", url)
+    config.attributes["configure_logger"] = False
+    command.upgrade(config, "head")
+
+
+def latency_summary(latencies: List[float]) -> dict:
+    if not latencies:
+        return {"mean_ms": 0.0, "p50_ms": 0.0, "p95_ms": 0.0, "p99_ms": 0.0, "max_ms": 0.0}
+
+    latencies = sorted(latencies)
+    cuts = statistics.quantiles(latencies, n=100, method="inclusive") if len(latencies) > 1 else latencies * 99
+    return {
+        "mean_ms": round(statistics.fmean(latencies) * 1000, 3),
+        "p50_ms": round(cuts[49] * 1000, 3),
+        "p95_ms": round(cuts[94] * 1000, 3),
+        "p99_ms": round(cuts[98] * 1000, 3),
+        "max_ms": round(latencies[-1] * 1000, 3),
+    }
+
+
+class Recorder:
+    def __init__(self):
+        self.latencies: List[float] = []
+        self.statuses: Counter = Counter()
+
+    async def request(self, client: httpx.AsyncClient, method: str, url: str, **kwargs) -> httpx.Response:
+        start = time.perf_counter()
+        response = await client.request(method, url, **kwargs)
+        self.latencies.append(time.perf_counter() - start)
+        self.statuses[response.status_code] += 1
+        return response
+
+    def summary(self, elapsed: float) -> dict:
+        return {
+            "requests": len(self.latencies),
+            "errors": sum(count for status, count in self.statuses.items() if status >= 400),
+            "statuses": {str(status): count for status, count in sorted(self.statuses.items())},
+            "seconds": round(elapsed, 3),
+            "rps": round(len(self.latencies) / elapsed, 1) if elapsed else 0.0,
+            **latency_summary(self.latencies),
+        }
+
+
+async def drive(jobs: Iterable[Callable[[], Awaitable]], concurrency: int) -> float:
+    jobs = iter(jobs)
+
+    async def worker():
+        for job in jobs:
+            await job()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return time.perf_counter() - start
+
+
+class Lifecycle:
+    def __init__(self, client: httpx.AsyncClient, args: argparse.Namespace):
+        self.client = client
+        self.args = args
+        self.prefix = "bench" + uuid.uuid4().hex[:8]
+        self.admin_headers: Dict[str, str] = {}
+        self.user_headers: List[Dict[str, str]] = []
+        self.exam_ids: List[int] = []
+        self.reservation_ids: List[int] = []
+        self.bursts = 0
+
+    def _exam_date(self) -> str:
+        return (datetime.now() + timedelta(days=30)).isoformat()
+
+    async def _signup(self, recorder: Recorder, username: str, role: str = "USER") -> None:
+        await recorder.request(self.client, "POST", "/members/",
+                               json={"username": username, "password": "benchmark", "role": role})
+
+    async def _login(self, recorder: Recorder, username: str) -> Dict[str, str]:
+        response = await recorder.request(self.client, "POST", "/members/login",
+                                          data={"username": username, "password": "benchmark"})
+        return {"Authorization": "Bearer " + response.json()["access_token"]} if response.status_code == 200 else {}
+
+    async def setup(self) -> None:
+        recorder = Recorder()
+        admin = f"{self.prefix}-admin"
+        await self._signup(recorder, admin, role="ADMIN")
+        self.admin_headers = await self._login(recorder, admin)
+
+        for index in range(self.args.exams):
+            response = await recorder.request(self.client, "POST", "/admin/exams/", headers=self.admin_headers, json={
+                "date": self._exam_date(), "description": f"{self.prefix} exam {index}", "max_people": 50000,
+            })
+            self.exam_ids.append(response.json()["id"])
+
+    async def _ensure_users(self) -> None:
+        if self.user_headers:
+            return
+
+        recorder = Recorder()
+        usernames = [f"{self.prefix}-seed{index}" for index in range(self.args.users)]
+        await drive((lambda name=name: self._signup(recorder, name) for name in usernames), self.args.concurrency)
+
+        async def login(name: str):
+            self.user_headers.append(await self._login(recorder, name))
+
+        await drive((lambda name=name: login(name) for name in usernames), self.args.concurrency)
+
+    async def _ensure_backlog(self) -> None:
+        if not self.reservation_ids:
+            await self.reservation_burst()
+
+    async def signup_login(self) -> dict:
+        recorder = Recorder()
+        usernames = [f"{self.prefix}-user{index}" for index in range(self.args.users)]
+        elapsed = await drive((lambda name=name: self._signup(recorder, name) for name in usernames),
+                              self.args.concurrency)
+
+        async def login(name: str):
+            self.user_headers.append(await self._login(recorder, name))
+
+        elapsed += await drive((lambda name=name: login(name) for name in usernames), self.args.concurrency)
+        return recorder.summary(elapsed)
+
+    async def exam_browse(self) -> dict:
+        recorder = Recorder()
+
+        async def browse():
+            response = await recorder.request(self.client, "GET", "/exams/", params={"limit": 20})
+            cursor = response.json().get("next_cursor")
+            if cursor:
+                await recorder.request(self.client, "GET", "/exams/", params={"limit": 20, "cursor": cursor})
+            for exam_id in self.exam_ids[:3]:
+                await recorder.request(self.client, "GET", f"/exams/{exam_id}")
+
+        elapsed = await drive((browse for _ in range(self.args.browse)), self.args.concurrency)
+        return recorder.summary(elapsed)
+
+    async def reservation_burst(self) -> dict:
+        await self._ensure_users()
+        recorder = Recorder()
+        exam_id = self.exam_ids[self.bursts % len(self.exam_ids)]
+        self.bursts += 1
+
+        async def reserve(headers: Dict[str, str]):
+            response = await recorder.request(self.client, "POST", "/reservation/", headers=headers,
+                                              json={"exam_id": exam_id, "people": 1})
+            if response.status_code == 201:
+                self.reservation_ids.append(response.json()["id"])
+
+        elapsed = await drive((lambda headers=headers: reserve(headers) for headers in self.user_headers),
+                              self.args.concurrency)
+        return recorder.summary(elapsed)
+
+    async def admin_confirm(self) -> dict:
+        await self._ensure_backlog()
+        recorder = Recorder()
+        reservation_ids, self.reservation_ids = self.reservation_ids, []
+
+        async def confirm(reservation_id: int):
+            await recorder.request(self.client, "PUT", "/admin/reservation/status", headers=self.admin_headers,
+                                   json={"id": reservation_id, "status": "CONFIRMED"})
+
+        elapsed = await drive((lambda reservation_id=reservation_id: confirm(reservation_id)
+                               for reservation_id in reservation_ids), self.args.concurrency)
+        return recorder.summary(elapsed)
+
+    async def admin_confirm_batch(self) -> dict:
+        await self._ensure_backlog()
+        recorder = Recorder()
+        reservation_ids, self.reservation_ids = self.reservation_ids, []
+        batches = [reservation_ids[start:start + self.args.batch_size]
+                   for start in range(0, len(reservation_ids), self.args.batch_size)]
+
+        async def confirm(batch: List[int]):
+            await recorder.request(self.client, "PUT", "/admin/reservation/status/batch", headers=self.admin_headers,
+                                   json={"items": [{"id": reservation_id, "status": "CONFIRMED"}
+                                                    for reservation_id in batch]})
+
+        elapsed = await drive((lambda batch=batch: confirm(batch) for batch in batches), self.args.concurrency)
+        summary = recorder.summary(elapsed)
+        summary["items_per_second"] = round(len(reservation_ids) / elapsed, 1) if elapsed else 0.0
+        return summary
+
+
+def git_commit() -> str | None:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results: dict, baseline_path: str) -> None:
+    with open(baseline_path, "rb") as file:
+        baseline = orjson.loads(file.read())
+
+    print(f"\ncompared with {baseline.get('commit')} ({baseline_path})")
+    for name, summary in results["scenarios"].items():
+        before = baseline.get("scenarios", {}).get(name)
+        if not before:
+            continue
+        deltas = [
+            f"{metric} {before[metric]} -> {summary[metric]} ({(summary[metric] / before[metric] - 1) * 100:+.1f}%)"
+            for metric in ("rps", "p95_ms", "p99_ms") if before[metric]
+        ]
+        print(f"{name:<22} " + ", ".join(deltas))
+
+
+async def run(args: argparse.Namespace) -> dict:
+    from main import app
+
+    scenarios = {}
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=300) as client:
+            lifecycle = Lifecycle(client, args)
+            await lifecycle.setup()
+            for name in args.scenarios:
+                scenarios[name] = await getattr(lifecycle, name)()
+                print(f"{name:<22} {orjson.dumps(scenarios[name]).decode()}")
+
+    return {
+        "commit": git_commit(),
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "parameters": {key: value for key, value in vars(args).items() if key not in ("output", "compare")},
+        "settings": {key: os.environ.get(key) for key in (
+            "DATABASE_ASYNC", "DB_POOL_SIZE", "DB_MAX_OVERFLOW", "CACHE_BACKEND", "PASSWORD_HASH_SCHEME",
+            "PASSWORD_HASH_ITERATIONS", "PASSWORD_HASH_WORKERS", "LOG_LEVEL", "LOG_FORMAT",
+        )},
+        "scenarios": scenarios,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Latency percentiles and throughput of the reservation lifecycle, "
+                                                 "driving main.app in-process against Postgres")
+    parser.add_argument("--database-url", default=os.getenv("BENCH_DATABASE_URL"),
+                        help="postgresql:// URL of a disposable database (default: BENCH_DATABASE_URL)")
+    parser.add_argument("--scenarios", nargs="+", choices=SCENARIOS, default=SCENARIOS)
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--exams", type=int, default=100)
+    parser.add_argument("--browse", type=int, default=500, help="catalog browsing sessions (5 requests each)")
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--output", help="result file (default: benchmark/results/lifecycle-<commit>.json)")
+    parser.add_argument("--compare", help="previous result file to print rps/p95/p99 deltas against")
+    args = parser.parse_args()
+
+    if not args.database_url:
+        parser.error("--database-url or BENCH_DATABASE_URL is required")
+    if args.exams < 1:
+        parser.error("--exams must be at least 1")
+
+    configure_database(args.database_url)
+    migrate(args.database_url)
+    results = asyncio.run(run(args))
+
+    output = args.output or os.path.join("benchmark", "results", f"lifecycle-{results['commit'] or 'local'}.json")
+    os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+    with open(output, "wb") as file:
+        file.write(orjson.dumps(results, option=orjson.OPT_INDENT_2))
+    print(f"\nwrote {output}", file=sys.stderr)
+
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
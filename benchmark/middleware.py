@@ -0,0 +1,106 @@
+import argparse
+import asyncio
+import logging
+import time
+import traceback
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from src.core.exception.global_exception_middleware import GlobalExceptionMiddleware
+
+logger = logging.getLogger(__name__)
+
+
+class BaseHTTPExceptionMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next):
+        try:
+            logger.info(f"Incoming request: {request.method} {request.url}")
+
+            return await call_next(request)
+
+        except Exception as e:
+            logger.error(f"Unhandled exception: {str(e)}")
+            logger.error(traceback.format_exc())
+
+            return JSONResponse(
+                status_code=500,
+                content={
+                    "error": "Internal Server Error",
+                    "detail": "An unexpected error occurred"
+                }
+            )
+
+
+def build_app(middleware) -> FastAPI:
+    app = FastAPI()
+    if middleware is not None:
+        app.add_middleware(middleware)
+
+    @app.get("/ping")
+    async def ping():
+        return {"ok": True}
+
+    return app
+
+
+async def call(app: FastAPI) -> None:
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/ping",
+        "raw_path": b"/ping",
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"host", b"bench")],
+        "client": ("127.0.0.1", 1234),
+        "server": ("bench", 80),
+    }
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    await app(scope, receive, send)
+
+
+async def run(app: FastAPI, requests: int, concurrency: int) -> float:
+    async def worker(count: int):
+        for _ in range(count):
+            await call(app)
+
+    await worker(100)
+    start = time.perf_counter()
+    await asyncio.gather(*(worker(requests // concurrency) for _ in range(concurrency)))
+    return (requests // concurrency * concurrency) / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Requests/second of a trivial endpoint through each middleware")
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--log-level", default="WARNING")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=args.log_level)
+
+    apps = {
+        "no middleware": build_app(None),
+        "BaseHTTPMiddleware (before)": build_app(BaseHTTPExceptionMiddleware),
+        "pure ASGI (after)": build_app(GlobalExceptionMiddleware),
+    }
+
+    print(f"{args.requests} requests, concurrency {args.concurrency}, log level {args.log_level}")
+    for name, app in apps.items():
+        rps = asyncio.run(run(app, args.requests, args.concurrency))
+        print(f"{name:<30} {rps:10.0f} req/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,223 @@
+import argparse
+import asyncio
+import base64
+import os
+import sys
+import time
+from collections import Counter, defaultdict
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+from urllib.parse import quote
+
+import httpx
+import orjson
+
+from benchmark.lifecycle import configure_database, git_commit, latency_summary, migrate
+
+
+def load_entries(path: str, limit: Optional[int]) -> List[dict]:
+    with open(path, "rb") as file:
+        entries = [orjson.loads(line) for line in file if line.strip()]
+
+    entries.sort(key=lambda entry: entry["ts"])
+    return entries[:limit] if limit else entries
+
+
+def request_body(entry: dict, password: str) -> Optional[bytes]:
+    body = entry.get("body")
+    if body is None:
+        return None
+
+    if entry.get("body_encoding") == "base64":
+        return base64.b64decode(body)
+
+    from src.core.traffic.recorder import REDACTED
+
+    if entry.get("content_type", "").startswith("application/x-www-form-urlencoded"):
+        body = body.replace(quote(REDACTED), quote(password))
+    return body.replace(REDACTED, password).encode("utf-8")
+
+
+class Replayer:
+    def __init__(self, client: httpx.AsyncClient, args: argparse.Namespace):
+        self.client = client
+        self.args = args
+        self.tokens: Dict[int, str] = {}
+        self.results: List[dict] = []
+        self.lags: List[float] = []
+
+    def _headers(self, entry: dict) -> Dict[str, str]:
+        headers = {}
+        if entry.get("content_type"):
+            headers["Content-Type"] = entry["content_type"]
+
+        principal = entry.get("principal")
+        if principal and self.args.secret_key:
+            if principal["id"] not in self.tokens:
+                from src.core.security.security import create_access_token
+
+                self.tokens[principal["id"]] = create_access_token(principal)
+            headers["Authorization"] = "Bearer " + self.tokens[principal["id"]]
+
+        return headers
+
+    async def _send(self, entry: dict, semaphore: asyncio.Semaphore) -> None:
+        try:
+            url = entry["path"] + ("?" + entry["query"] if entry.get("query") else "")
+            start = time.perf_counter()
+            status, error = None, None
+            try:
+                response = await self.client.request(entry["method"], url, headers=self._headers(entry),
+                                                     content=request_body(entry, self.args.password))
+                status = response.status_code
+            except httpx.TransportError as exc:
+                error = type(exc).__name__
+            self.results.append({
+                "route": entry.get("route") or entry["path"],
+                "method": entry["method"],
+                "recorded_status": entry["status"],
+                "status": status,
+                "error": error,
+                "recorded": entry["duration_ms"] / 1000,
+                "replayed": time.perf_counter() - start,
+            })
+        finally:
+            semaphore.release()
+
+    async def run(self, entries: List[dict]) -> float:
+        semaphore = asyncio.Semaphore(self.args.concurrency)
+        tasks = []
+        first_ts = entries[0]["ts"]
+        start = time.perf_counter()
+
+        for entry in entries:
+            if self.args.speed > 0:
+                delay = (entry["ts"] - first_ts) / self.args.speed - (time.perf_counter() - start)
+                if delay > 0:
+                    await asyncio.sleep(delay)
+
+            await semaphore.acquire()
+            if self.args.speed > 0:
+                self.lags.append(max(0.0, time.perf_counter() - start - (entry["ts"] - first_ts) / self.args.speed))
+            tasks.append(asyncio.create_task(self._send(entry, semaphore)))
+
+        await asyncio.gather(*tasks)
+        return time.perf_counter() - start
+
+
+def compare_latencies(results: List[dict]) -> dict:
+    recorded = latency_summary([result["recorded"] for result in results])
+    replayed = latency_summary([result["replayed"] for result in results])
+    mismatches = sum(1 for result in results if result["status"] != result["recorded_status"])
+    errors = Counter(result["error"] for result in results if result["error"])
+
+    return {
+        "requests": len(results),
+        "status_mismatches": mismatches,
+        "statuses": {str(status): count for status, count in
+                     sorted(Counter(result["status"] for result in results if result["status"]).items())},
+        "errors": dict(sorted(errors.items())),
+        "recorded": recorded,
+        "replayed": replayed,
+        "p95_change": round(replayed["p95_ms"] / recorded["p95_ms"] - 1, 4) if recorded["p95_ms"] else None,
+    }
+
+
+def report(entries: List[dict], replayer: Replayer, elapsed: float, args: argparse.Namespace) -> dict:
+    by_route = defaultdict(list)
+    for result in replayer.results:
+        by_route[f"{result['method']} {result['route']}"].append(result)
+
+    recorded_span = entries[-1]["ts"] - entries[0]["ts"]
+    return {
+        "commit": git_commit(),
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "source": args.path,
+        "target": "in-process" if args.in_process else args.target,
+        "speed": args.speed,
+        "concurrency": args.concurrency,
+        "recorded_seconds": round(recorded_span, 3),
+        "replayed_seconds": round(elapsed, 3),
+        "rps": round(len(replayer.results) / elapsed, 1) if elapsed else 0.0,
+        "schedule_lag": latency_summary(replayer.lags),
+        "overall": compare_latencies(replayer.results),
+        "routes": {route: compare_latencies(results) for route, results in
+                   sorted(by_route.items(), key=lambda item: -len(item[1]))},
+    }
+
+
+def print_report(result: dict) -> None:
+    print(f"{result['overall']['requests']} requests in {result['replayed_seconds']}s "
+          f"(recorded over {result['recorded_seconds']}s), {result['rps']} req/s, "
+          f"schedule lag p95 {result['schedule_lag']['p95_ms']}ms")
+    print(f"{'route':<48} {'count':>6} {'rec p50':>9} {'rep p50':>9} {'rec p95':>9} {'rep p95':>9} "
+          f"{'rec p99':>9} {'rep p99':>9} {'status!=':>8} {'errors':>6}")
+    for route, summary in [("overall", result["overall"]), *result["routes"].items()]:
+        recorded, replayed = summary["recorded"], summary["replayed"]
+        print(f"{route[:48]:<48} {summary['requests']:>6} "
+              f"{recorded['p50_ms']:>9} {replayed['p50_ms']:>9} {recorded['p95_ms']:>9} {replayed['p95_ms']:>9} "
+              f"{recorded['p99_ms']:>9} {replayed['p99_ms']:>9} {summary['status_mismatches']:>8} "
+              f"{sum(summary['errors'].values()):>6}")
+    if result["overall"]["errors"]:
+        print(f"transport errors: {result['overall']['errors']}")
+
+
+async def run(args: argparse.Namespace, entries: List[dict]) -> dict:
+    if args.in_process:
+        from main import app
+
+        transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+        async with app.router.lifespan_context(app):
+            async with httpx.AsyncClient(transport=transport, base_url="http://replay", timeout=300) as client:
+                replayer = Replayer(client, args)
+                elapsed = await replayer.run(entries)
+    else:
+        limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+        async with httpx.AsyncClient(base_url=args.target, timeout=300, limits=limits) as client:
+            replayer = Replayer(client, args)
+            elapsed = await replayer.run(entries)
+
+    return report(entries, replayer, elapsed, args)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay traffic recorded with TRAFFIC_RECORD_PATH against a test "
+                                                 "instance and compare latencies with the recording")
+    parser.add_argument("path", help="JSONL file written by the traffic recorder")
+    parser.add_argument("--target", default="http://localhost:8000", help="base URL of the instance to replay against")
+    parser.add_argument("--in-process", action="store_true",
+                        help="replay against main.app in-process using --database-url / BENCH_DATABASE_URL")
+    parser.add_argument("--database-url", default=os.getenv("BENCH_DATABASE_URL"))
+    parser.add_argument("--speed", type=float, default=1.0,
+                        help="multiple of the recorded request rate, 0 sends as fast as concurrency allows")
+    parser.add_argument("--concurrency", type=int, default=100, help="maximum requests in flight")
+    parser.add_argument("--limit", type=int, help="replay only the first N recorded requests")
+    parser.add_argument("--secret-key", default=os.getenv("SECRET_KEY"),
+                        help="target's SECRET_KEY, used to mint tokens for recorded principals")
+    parser.add_argument("--password", default="benchmark", help="substituted for redacted passwords")
+    parser.add_argument("--output", help="write the JSON report to this file")
+    args = parser.parse_args()
+
+    if args.secret_key:
+        os.environ["SECRET_KEY"] = args.secret_key
+    if args.in_process:
+        if not args.database_url:
+            parser.error("--in-process requires --database-url or BENCH_DATABASE_URL")
+        configure_database(args.database_url)
+        migrate(args.database_url)
+
+    entries = load_entries(args.path, args.limit)
+    if not entries:
+        parser.error(f"no recorded requests in {args.path}")
+
+    result = asyncio.run(run(args, entries))
+    print_report(result)
+
+    if args.output:
+        with open(args.output, "wb") as file:
+            file.write(orjson.dumps(result, option=orjson.OPT_INDENT_2))
+        print(f"\nwrote {args.output}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+import argparse
+import asyncio
+import statistics
+import time
+from datetime import datetime, timedelta, timezone
+from typing import List
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.orm import Session
+
+from src.core.serialization.serialization import dump_json, rows_to_dicts
+from src.db.db import Base
+from src.exam.model import Exam
+from src.exam.repository import ExamRepository
+from src.exam.schema import ExamResponse
+from src.member.model import Member
+
+
+def prepare(rows: int) -> Session:
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine, tables=[Member.__table__, Exam.__table__])
+
+    now = datetime.now(timezone.utc)
+    with engine.begin() as connection:
+        connection.execute(insert(Exam), [
+            {
+                "member_id": 1,
+                "description": f"exam {index}",
+                "date": datetime(2030, 1, 1) + timedelta(minutes=index),
+                "current_people": index % 100,
+                "max_people": 50000,
+                "created_at": now,
+                "modified_at": now,
+            }
+            for index in range(rows)
+        ])
+
+    return Session(engine)
+
+
+def model_path(db: Session, limit: int, field) -> bytes:
+    exams = db.scalars(ExamRepository()._page_statement(select(Exam), limit)).all()
+    items = [ExamResponse.model_validate(exam) for exam in exams]
+    content = asyncio.run(serialize_response(field=field, response_content=items))
+    db.expunge_all()
+    return JSONResponse(content).body
+
+
+def row_path(db: Session, limit: int) -> bytes:
+    columns = select(Exam.date, Exam.description, Exam.current_people, Exam.max_people,
+                     Exam.id, Exam.member_id, Exam.created_at)
+    rows = db.execute(ExamRepository()._page_statement(columns, limit)).all()
+    return dump_json(rows_to_dicts(rows))
+
+
+def measure(function, repeat: int) -> List[float]:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare ORM + Pydantic serialization with the row + orjson path")
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    db = prepare(args.rows)
+    field = create_model_field(name="Response_get_all", type_=List[ExamResponse], mode="serialization")
+
+    model_path(db, args.rows, field)
+    row_path(db, args.rows)
+
+    results = {
+        "orm + model_validate + response_model": measure(lambda: model_path(db, args.rows, field), args.repeat),
+        "column rows + orjson": measure(lambda: row_path(db, args.rows), args.repeat),
+    }
+
+    print(f"{args.rows} rows, {args.repeat} runs")
+    for name, timings in results.items():
+        print(f"{name:<40} median {statistics.median(timings):8.2f} ms   min {min(timings):8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
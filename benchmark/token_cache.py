@@ -0,0 +1,43 @@
+import argparse
+import os
+import statistics
+import time
+from typing import List
+
+os.environ.setdefault("SECRET_KEY", "benchmark-secret")
+
+from src.core.security import security  # noqa: E402
+from src.core.security.token_cache import TokenCache  # noqa: E402
+
+
+def measure(token: str, calls: int, repeat: int) -> List[float]:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(calls):
+            security.decode_token(token)
+        timings.append((time.perf_counter() - start) / calls * 1_000_000)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare decode_token cost with and without the verified-token cache")
+    parser.add_argument("--calls", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    token = security.create_access_token({"id": 1, "username": "benchmark", "role": "USER"})
+
+    results = {}
+    for name, max_entries in (("jose.jwt.decode (no cache)", 0), ("token cache", 10000)):
+        security.token_cache = TokenCache(max_entries)
+        security.decode_token(token)
+        results[name] = measure(token, args.calls, args.repeat)
+
+    print(f"{args.calls} calls, {args.repeat} runs")
+    for name, timings in results.items():
+        print(f"{name:<30} median {statistics.median(timings):8.2f} us/call   min {min(timings):8.2f} us/call")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,32 +1,83 @@
+import asyncio
+import contextlib
 import os
+from contextlib import asynccontextmanager
 
 from dotenv import load_dotenv
 from fastapi import FastAPI
 
+from src.core.config.config import settings
+from src.core.exception.exception_handler import register_exception_handlers
 from src.core.exception.global_exception_middleware import GlobalExceptionMiddleware
 from src.core.logger.logger import setup_logging
-from src.db.db import Base, engine
+from src.core.metrics.metrics import MetricsMiddleware, instrument_pool, mark_process_dead, observe_query
+from src.core.traffic.recorder import TrafficRecorderMiddleware, start_recording, stop_recording
+from src.db.db import async_engine, engine
+from src.db.query_stats import QueryStatsMiddleware, add_query_listener, instrument_engine
 from src.exam.admin_router import admin_router as admin_exam_router
 from src.exam.router import router as exam_router
+from src.exam.task import run_hot_people_flush
+from src.internal.router import router as internal_router
 from src.member.router import router as member_router
 from src.reservation.admin_router import admin_router as admin_reservation_router
 from src.reservation.router import router as reservation_router
+from src.reservation.task import run_pending_allocation
 
 load_dotenv()
 
-Base.metadata.create_all(bind=engine)
-
 setup_logging()
 
-app = FastAPI(title="grepp")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    tasks = []
+    if settings.HOT_EXAM_FLUSH_INTERVAL > 0:
+        tasks.append(asyncio.create_task(run_hot_people_flush(settings.HOT_EXAM_FLUSH_INTERVAL)))
+    if settings.RESERVATION_ALLOCATION_INTERVAL > 0:
+        tasks.append(asyncio.create_task(run_pending_allocation(settings.RESERVATION_ALLOCATION_INTERVAL,
+                                                                settings.RESERVATION_ALLOCATION_BATCH_SIZE,
+                                                                settings.RESERVATION_ALLOCATION_SETTLE_SECONDS)))
+
+    yield
+
+    for task in tasks:
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+
+    stop_recording()
+    mark_process_dead()
+
+
+app = FastAPI(title="grepp", lifespan=lifespan)
+register_exception_handlers(app)
+app.add_middleware(QueryStatsMiddleware, headers=settings.DB_QUERY_HEADERS,
+                   repeated_query_threshold=settings.DB_REPEATED_QUERY_THRESHOLD)
 app.add_middleware(GlobalExceptionMiddleware)
 
+instrument_engine(engine, settings.DB_SLOW_QUERY_SECONDS)
+instrument_engine(async_engine.sync_engine, settings.DB_SLOW_QUERY_SECONDS)
+
+if settings.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+    add_query_listener(observe_query)
+    instrument_pool("sync", engine.pool, settings.DB_POOL_SIZE)
+    instrument_pool("async", async_engine.pool, settings.DB_POOL_SIZE)
+
+if settings.TRAFFIC_RECORD_PATH:
+    app.add_middleware(TrafficRecorderMiddleware,
+                       writer=start_recording(settings.TRAFFIC_RECORD_PATH, settings.TRAFFIC_RECORD_QUEUE_SIZE),
+                       max_body_bytes=settings.TRAFFIC_RECORD_MAX_BODY_BYTES)
+
 app.include_router(member_router)
 app.include_router(exam_router)
 app.include_router(admin_exam_router)
 app.include_router(reservation_router)
 app.include_router(admin_reservation_router)
 
+if settings.INTERNAL_ENDPOINTS_ENABLED:
+    app.include_router(internal_router)
+
 if __name__ == "__main__":
     import uvicorn
 
@@ -0,0 +1,41 @@
+"""exam hot mode shards and exam date index
+
+Revision ID: 0001a
+Revises: 0001
+Create Date: 2026-10-17 10:15:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0001a'
+down_revision: Union[str, None] = '0001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('exam', sa.Column('hot_shards', sa.Integer(), server_default='0', nullable=False))
+    op.create_index('ix_exam_date_id', 'exam', ['date', 'id'])
+
+    op.create_table(
+        'exam_seat_shard',
+        sa.Column('exam_id', sa.Integer(), nullable=False),
+        sa.Column('shard', sa.Integer(), nullable=False),
+        sa.Column('remaining', sa.Integer(), nullable=False),
+        sa.CheckConstraint('remaining >= 0', name='ck_exam_seat_shard_remaining'),
+        sa.ForeignKeyConstraint(['exam_id'], ['exam.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('exam_id', 'shard'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('exam_seat_shard')
+    op.drop_index('ix_exam_date_id', table_name='exam')
+    op.drop_column('exam', 'hot_shards')
@@ -0,0 +1,43 @@
+"""query indexes for reservation and exam lookups
+
+Revision ID: 0002
+Revises: 0001a
+Create Date: 2026-10-17 10:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0002'
+down_revision: Union[str, None] = '0001a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_exam_member_id', 'exam', ['member_id'])
+    op.create_index('ix_exam_hot', 'exam', ['id', 'hot_shards'],
+                    postgresql_where=sa.text('hot_shards > 0'))
+
+    op.create_index('ix_reservation_member_id_created_at', 'reservation', ['member_id', 'created_at'],
+                    postgresql_include=['id', 'status', 'people', 'modified_at'])
+    op.drop_index('ix_reservation_member_id', table_name='reservation')
+    op.create_index('ix_reservation_exam_id_id', 'reservation', ['exam_id', 'id'])
+    op.create_index('ix_reservation_exam_id_pending', 'reservation', ['exam_id', 'created_at', 'id'],
+                    postgresql_where=sa.text("status = 'PENDING'"))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_reservation_exam_id_pending', table_name='reservation')
+    op.drop_index('ix_reservation_exam_id_id', table_name='reservation')
+    op.create_index('ix_reservation_member_id', 'reservation', ['member_id'])
+    op.drop_index('ix_reservation_member_id_created_at', table_name='reservation')
+
+    op.drop_index('ix_exam_hot', table_name='exam')
+    op.drop_index('ix_exam_member_id', table_name='exam')
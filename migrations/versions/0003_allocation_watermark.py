@@ -0,0 +1,38 @@
+"""allocation watermark for the pending reservation worker
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-17 19:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0003'
+down_revision: Union[str, None] = '0002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'allocation_watermark',
+        sa.Column('exam_id', sa.Integer(), nullable=False),
+        sa.Column('reservation_created_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('reservation_id', sa.Integer(), nullable=False),
+        sa.Column('confirmed', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('denied', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('modified_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.ForeignKeyConstraint(['exam_id'], ['exam.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('exam_id'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('allocation_watermark')
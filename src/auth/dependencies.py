@@ -1,10 +1,15 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.auth.principal import Principal
+from src.core.config.config import settings
+from src.core.security.revocation import issued_before, revocation_list
+from src.core.security.schema import TokenData
 from src.core.security.security import decode_token
+from src.core.security.token_cache import token_digest
 from src.db.db import get_db
-from src.member.model import Member, Role
+from src.member.model import Role
 from src.member.repository import MemberRepository
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="members/login")
@@ -12,17 +17,31 @@ oauth2_scheme = OAuth2PasswordBearer(tokenUrl="members/login")
 member_repository = MemberRepository()
 
 
-async def get_current_member(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)) -> Member:
+async def is_token_revoked(db: AsyncSession, token: str, token_data: TokenData) -> bool:
+    revoked = revocation_list.cached_revoked(token)
+    if revoked is None:
+        revocation = await member_repository.find_token_revocation(db, token_data.id, token_digest(token))
+        revoked = (revocation is None or revocation.revoked
+                   or issued_before(token_data, revocation.tokens_valid_after))
+        revocation_list.cache_revoked(token, token_data.id, revoked)
+
+    return revoked
+
+
+async def get_current_member(token: str = Depends(oauth2_scheme), db: AsyncSession = Depends(get_db)) -> Principal:
     token_data = decode_token(token)
 
-    if token_data is None:
+    if token_data is None or await is_token_revoked(db, token, token_data):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid authentication credentials",
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    member = member_repository.find_by_id(db, token_data.id)
+    if settings.AUTH_STATELESS:
+        return Principal.from_token(token_data)
+
+    member = await member_repository.find_by_id(db, token_data.id)
     if member is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -30,14 +49,14 @@ async def get_current_member(token: str = Depends(oauth2_scheme), db: Session =
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    return member
+    return Principal.from_member(member)
 
 
-async def get_current_active_member(current_member: Member = Depends(get_current_member)) -> Member:
+async def get_current_active_member(current_member: Principal = Depends(get_current_member)) -> Principal:
     return current_member
 
 
-async def get_admin_member(current_member: Member = Depends(get_current_member)) -> Member:
+async def get_admin_member(current_member: Principal = Depends(get_current_member)) -> Principal:
     if current_member.role != Role.ADMIN:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -0,0 +1,29 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.security.schema import TokenData
+from src.member.model import Member, Role
+from src.member.repository import MemberRepository
+
+member_repository = MemberRepository()
+
+
+class Principal:
+    def __init__(self, id: int, username: str, role: Role, member: Member | None = None):
+        self.id = id
+        self.username = username
+        self.role = role
+        self._member = member
+
+    @classmethod
+    def from_token(cls, token_data: TokenData) -> "Principal":
+        return cls(id=token_data.id, username=token_data.username, role=Role(token_data.role))
+
+    @classmethod
+    def from_member(cls, member: Member) -> "Principal":
+        return cls(id=member.id, username=member.username, role=member.role, member=member)
+
+    async def load(self, db: AsyncSession) -> Member | None:
+        if self._member is None:
+            self._member = await member_repository.find_by_id(db, self.id)
+
+        return self._member
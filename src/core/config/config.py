@@ -14,6 +14,59 @@ class Settings:
 
     DATABASE_URL = (f'postgresql://{POSTGRESQL_USER}:{POSTGRESQL_PASSWORD}@{POSTGRESQL_HOST}:{POSTGRESQL_PORT}/'
                     f'{POSTGRESQL_DATABASE}')
+    ASYNC_DATABASE_URL = (f'postgresql+asyncpg://{POSTGRESQL_USER}:{POSTGRESQL_PASSWORD}@{POSTGRESQL_HOST}:'
+                          f'{POSTGRESQL_PORT}/{POSTGRESQL_DATABASE}')
+    DATABASE_ASYNC: bool = os.getenv('DATABASE_ASYNC', 'true').lower() == 'true'
+
+    DB_POOL_SIZE: int = int(os.getenv('DB_POOL_SIZE', 5))
+    DB_MAX_OVERFLOW: int = int(os.getenv('DB_MAX_OVERFLOW', 10))
+    DB_POOL_TIMEOUT: float = float(os.getenv('DB_POOL_TIMEOUT', 30))
+    DB_POOL_RECYCLE: int = int(os.getenv('DB_POOL_RECYCLE', 1800))
+    DB_POOL_PRE_PING: bool = os.getenv('DB_POOL_PRE_PING', 'true').lower() == 'true'
+    DB_SLOW_QUERY_SECONDS: float = float(os.getenv('DB_SLOW_QUERY_SECONDS', 0.5))
+    DB_QUERY_HEADERS: bool = os.getenv('DB_QUERY_HEADERS', 'false').lower() == 'true'
+    DB_REPEATED_QUERY_THRESHOLD: int = int(os.getenv('DB_REPEATED_QUERY_THRESHOLD', 10))
+    DB_PGBOUNCER: bool = os.getenv('DB_PGBOUNCER', 'false').lower() == 'true'
+
+    LOG_LEVEL: str = os.getenv('LOG_LEVEL', 'INFO').upper()
+    LOG_FORMAT: str = os.getenv('LOG_FORMAT', 'json')
+    LOG_SAMPLE_RATE: float = float(os.getenv('LOG_SAMPLE_RATE', 0.1))
+    LOG_QUEUE_SIZE: int = int(os.getenv('LOG_QUEUE_SIZE', 10000))
+
+    SERVICE_ERROR_LOG_INTERVAL: float = float(os.getenv('SERVICE_ERROR_LOG_INTERVAL', 1))
+
+    TRAFFIC_RECORD_PATH: str = os.getenv('TRAFFIC_RECORD_PATH', '')
+    TRAFFIC_RECORD_QUEUE_SIZE: int = int(os.getenv('TRAFFIC_RECORD_QUEUE_SIZE', 10000))
+    TRAFFIC_RECORD_MAX_BODY_BYTES: int = int(os.getenv('TRAFFIC_RECORD_MAX_BODY_BYTES', 65536))
+
+    METRICS_ENABLED: bool = os.getenv('METRICS_ENABLED', 'true').lower() == 'true'
+
+    INTERNAL_ENDPOINTS_ENABLED: bool = os.getenv('INTERNAL_ENDPOINTS_ENABLED', 'false').lower() == 'true'
+
+    CACHE_BACKEND: str = os.getenv('CACHE_BACKEND', 'memory')
+    CACHE_URL: str = os.getenv('CACHE_URL', 'redis://localhost:6379/0')
+    CACHE_MAX_ENTRIES: int = int(os.getenv('CACHE_MAX_ENTRIES', 10000))
+    EXAM_CACHE_TTL: float = float(os.getenv('EXAM_CACHE_TTL', 5))
+
+    HOT_EXAM_FLUSH_INTERVAL: float = float(os.getenv('HOT_EXAM_FLUSH_INTERVAL', 2))
+
+    RESERVATION_ALLOCATION_INTERVAL: float = float(os.getenv('RESERVATION_ALLOCATION_INTERVAL', 0))
+    RESERVATION_ALLOCATION_BATCH_SIZE: int = int(os.getenv('RESERVATION_ALLOCATION_BATCH_SIZE', 500))
+    RESERVATION_ALLOCATION_SETTLE_SECONDS: float = float(os.getenv('RESERVATION_ALLOCATION_SETTLE_SECONDS', 1))
+
+    PASSWORD_HASH_SCHEME: str = os.getenv('PASSWORD_HASH_SCHEME', 'pbkdf2_sha256')
+    PASSWORD_HASH_ITERATIONS: int = int(os.getenv('PASSWORD_HASH_ITERATIONS', 100000))
+    SCRYPT_N: int = int(os.getenv('SCRYPT_N', 2 ** 14))
+    SCRYPT_R: int = int(os.getenv('SCRYPT_R', 8))
+    SCRYPT_P: int = int(os.getenv('SCRYPT_P', 1))
+    PASSWORD_REHASH_ON_LOGIN: bool = os.getenv('PASSWORD_REHASH_ON_LOGIN', 'true').lower() == 'true'
+    PASSWORD_HASH_WORKERS: int = int(os.getenv('PASSWORD_HASH_WORKERS', os.cpu_count() or 1))
+    PASSWORD_HASH_QUEUE_SIZE: int = int(os.getenv('PASSWORD_HASH_QUEUE_SIZE', 64))
+
+    TOKEN_CACHE_MAX_ENTRIES: int = int(os.getenv('TOKEN_CACHE_MAX_ENTRIES', 10000))
+    TOKEN_REVOCATION_CACHE_TTL: float = float(os.getenv('TOKEN_REVOCATION_CACHE_TTL', 5))
+
+    AUTH_STATELESS: bool = os.getenv('AUTH_STATELESS', 'true').lower() == 'true'
 
 
 settings = Settings()
@@ -0,0 +1,93 @@
+import logging
+import time
+from collections import defaultdict
+from typing import Dict, Optional, Tuple
+
+import orjson
+from fastapi import FastAPI, Request
+from starlette.responses import Response
+
+from src.core.config.config import settings
+from src.core.exception.security_exception import SecurityException
+from src.core.exception.service_exception import ServiceException
+
+MAX_CACHED_RESPONSES = 256
+
+DomainException = ServiceException | SecurityException
+ResponseKey = Tuple[type, str, Optional[str]]
+
+logger = logging.getLogger(__name__)
+
+
+class ErrorResponse:
+    def __init__(self, status_code: int, body: bytes, headers: Optional[Dict[str, str]]):
+        self.status_code = status_code
+        self.body = body
+        self.headers = headers
+
+    @classmethod
+    def from_exception(cls, exc: DomainException) -> "ErrorResponse":
+        http_exception = exc.to_http_exception()
+        return cls(http_exception.status_code, orjson.dumps({"detail": http_exception.detail}),
+                   http_exception.headers)
+
+    def render(self) -> Response:
+        return Response(content=self.body, status_code=self.status_code, headers=self.headers,
+                        media_type="application/json")
+
+
+class ErrorLogLimiter:
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._logged_at: Dict[str, float] = {}
+        self._suppressed: Dict[str, int] = defaultdict(int)
+
+    def acquire(self, key: str) -> Optional[int]:
+        if self.interval <= 0:
+            return 0
+
+        now = time.monotonic()
+        if now - self._logged_at.get(key, float("-inf")) < self.interval:
+            self._suppressed[key] += 1
+            return None
+
+        self._logged_at[key] = now
+        return self._suppressed.pop(key, 0)
+
+
+class DomainExceptionHandler:
+    def __init__(self, log_interval: float):
+        self.log_limiter = ErrorLogLimiter(log_interval)
+        self._responses: Dict[ResponseKey, ErrorResponse] = {}
+
+    async def __call__(self, request: Request, exc: DomainException) -> Response:
+        response = self._response(exc)
+
+        # Expected domain errors skip traceback formatting and are logged at most once per interval per code.
+        error_code = exc.error_code or type(exc).__name__
+        suppressed = self.log_limiter.acquire(error_code)
+        if suppressed is not None:
+            level = logging.WARNING if response.status_code >= 500 else logging.INFO
+            logger.log(level, "Service exception: %s %s %s %s (%s suppressed)", error_code, response.status_code,
+                       request.method, request.url.path, suppressed,
+                       extra={"error_code": error_code, "status": response.status_code, "suppressed": suppressed,
+                              "request_id": request.scope.get("state", {}).get("request_id")})
+
+        return response.render()
+
+    def _response(self, exc: DomainException) -> ErrorResponse:
+        # Bodies carry only the class-level message and code, so one rendering serves every instance.
+        key = (type(exc), exc.message, exc.error_code)
+        response = self._responses.get(key)
+        if response is None:
+            response = ErrorResponse.from_exception(exc)
+            if len(self._responses) < MAX_CACHED_RESPONSES:
+                self._responses[key] = response
+
+        return response
+
+
+def register_exception_handlers(app: FastAPI) -> None:
+    handler = DomainExceptionHandler(settings.SERVICE_ERROR_LOG_INTERVAL)
+    app.add_exception_handler(ServiceException, handler)
+    app.add_exception_handler(SecurityException, handler)
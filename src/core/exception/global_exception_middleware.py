@@ -1,30 +1,72 @@
 import logging
-import traceback
+import time
+import uuid
 
-from fastapi import Request
 from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.core.logger.logger import SAMPLED
 
 logger = logging.getLogger(__name__)
 
+REQUEST_ID_HEADER = "X-Request-ID"
+PROCESS_TIME_HEADER = "X-Process-Time"
 
-class GlobalExceptionMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        try:
-            logger.info(f"Incoming request: {request.method} {request.url}")
 
-            response = await call_next(request)
-            
-            return response
+class GlobalExceptionMiddleware:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = self._request_id(scope)
+        scope.setdefault("state", {})["request_id"] = request_id
+        started_at = time.perf_counter()
+        status_code = 500
+        response_started = False
 
+        log_extra = {**SAMPLED, "request_id": request_id}
+        logger.info("Incoming request: %s %s [%s]", scope["method"], scope["path"], request_id, extra=log_extra)
+
+        async def send_with_headers(message: Message) -> None:
+            nonlocal status_code, response_started
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                response_started = True
+                headers = MutableHeaders(scope=message)
+                headers.append(REQUEST_ID_HEADER, request_id)
+                headers.append(PROCESS_TIME_HEADER, f"{time.perf_counter() - started_at:.6f}")
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_headers)
         except Exception as e:
-            logger.error(f"Unhandled exception: {str(e)}")
-            logger.error(traceback.format_exc())
+            logger.exception("Unhandled exception: %s [%s]", e, request_id, extra={"request_id": request_id})
+            if response_started:
+                raise
 
-            return JSONResponse(
+            response = JSONResponse(
                 status_code=500,
                 content={
                     "error": "Internal Server Error",
                     "detail": "An unexpected error occurred"
                 }
             )
+            await response(scope, receive, send_with_headers)
+        finally:
+            level = logging.WARNING if status_code >= 500 else logging.INFO
+            if logger.isEnabledFor(level):
+                elapsed_ms = (time.perf_counter() - started_at) * 1000
+                logger.log(level, "Completed request: %s %s %s %.2fms [%s]", scope["method"], scope["path"],
+                           status_code, elapsed_ms, request_id,
+                           extra={**log_extra, "status": status_code, "duration_ms": round(elapsed_ms, 3)})
+
+    def _request_id(self, scope: Scope) -> str:
+        for name, value in scope["headers"]:
+            if name == b"x-request-id":
+                return value.decode("latin-1")[:128]
+        return uuid.uuid4().hex
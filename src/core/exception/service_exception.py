@@ -16,6 +16,5 @@ class ServiceException(Exception):
             detail={
                 "message": self.message,
                 "error_code": self.error_code,
-                "detail": self.detail
             }
         )
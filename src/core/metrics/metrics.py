@@ -0,0 +1,113 @@
+import os
+import time
+
+from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, Counter, Gauge, Histogram, \
+    generate_latest, multiprocess
+from sqlalchemy import event
+from sqlalchemy.pool import Pool
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.db.query_stats import track_queries
+
+MULTIPROC_DIR_ENV = "PROMETHEUS_MULTIPROC_DIR"
+UNMATCHED_ROUTE = "<unmatched>"
+
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_OPERATIONS = {"SELECT", "INSERT", "UPDATE", "DELETE", "WITH"}
+
+http_request_duration = Histogram(
+    "http_request_duration_seconds", "HTTP request latency by route template",
+    ["method", "route", "status"], buckets=LATENCY_BUCKETS,
+)
+http_request_db_duration = Histogram(
+    "http_request_db_duration_seconds", "Time a request spent waiting on SQL statements",
+    ["method", "route"], buckets=LATENCY_BUCKETS,
+)
+http_requests_in_flight = Gauge(
+    "http_requests_in_flight", "HTTP requests currently being handled", multiprocess_mode="livesum",
+)
+
+db_query_duration = Histogram(
+    "db_query_duration_seconds", "SQL statement execution time", ["operation"], buckets=LATENCY_BUCKETS,
+)
+db_pool_size = Gauge("db_pool_size", "Configured connection pool size", ["pool"], multiprocess_mode="livesum")
+db_pool_connections = Gauge("db_pool_connections", "Open pooled connections", ["pool"], multiprocess_mode="livesum")
+db_pool_checked_out = Gauge("db_pool_checked_out", "Connections checked out of the pool", ["pool"],
+                            multiprocess_mode="livesum")
+
+reservation_events = Counter(
+    "reservation_events", "Reservations created, confirmed, denied or rejected", ["event"],
+)
+
+
+def multiprocess_enabled() -> bool:
+    return bool(os.environ.get(MULTIPROC_DIR_ENV))
+
+
+def render_metrics() -> tuple[bytes, str]:
+    if not multiprocess_enabled():
+        return generate_latest(REGISTRY), CONTENT_TYPE_LATEST
+
+    # Each worker process writes its own files; any worker can aggregate all of them on scrape.
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    return generate_latest(registry), CONTENT_TYPE_LATEST
+
+
+def mark_process_dead() -> None:
+    if multiprocess_enabled():
+        multiprocess.mark_process_dead(os.getpid())
+
+
+def _operation(statement: str) -> str:
+    words = statement.split(None, 1)
+    operation = words[0].upper() if words else ""
+    return operation if operation in QUERY_OPERATIONS else "OTHER"
+
+
+def observe_query(statement: str, seconds: float) -> None:
+    db_query_duration.labels(_operation(statement)).observe(seconds)
+
+
+def instrument_pool(name: str, pool: Pool, size: int) -> None:
+    db_pool_size.labels(name).set(size)
+    connections = db_pool_connections.labels(name)
+    checked_out = db_pool_checked_out.labels(name)
+
+    event.listen(pool, "connect", lambda dbapi_connection, connection_record: connections.inc())
+    event.listen(pool, "close", lambda dbapi_connection, connection_record: connections.dec())
+    event.listen(pool, "close_detached", lambda dbapi_connection: connections.dec())
+    event.listen(pool, "checkout", lambda dbapi_connection, connection_record, connection_proxy: checked_out.inc())
+    event.listen(pool, "checkin", lambda dbapi_connection, connection_record: checked_out.dec())
+
+
+class MetricsMiddleware:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        http_requests_in_flight.inc()
+        try:
+            with track_queries() as stats:
+                await self.app(scope, receive, send_with_status)
+        finally:
+            http_requests_in_flight.dec()
+
+            # Label by route template, never the raw path, so ids in URLs cannot blow up series cardinality.
+            route = getattr(scope.get("route"), "path", UNMATCHED_ROUTE)
+            http_request_duration.labels(scope["method"], route, str(status_code)).observe(
+                time.perf_counter() - started)
+            http_request_db_duration.labels(scope["method"], route).observe(stats.seconds)
@@ -1,6 +1,7 @@
 from fastapi import HTTPException, status
 
 from src.core.exception.security_exception import SecurityException
+from src.core.exception.service_exception import ServiceException
 
 
 class TokenValidationFailed(SecurityException):
@@ -18,3 +19,21 @@ class TokenValidationFailed(SecurityException):
                 "error_code": self.error_code,
             }
         )
+
+
+class PasswordHashingBusy(ServiceException):
+    def __init__(self):
+        super().__init__(
+            message="Too many password hashing requests, try again later",
+            error_code="PASSWORD_HASHING_BUSY",
+        )
+
+    def to_http_exception(self):
+        return HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail={
+                "message": self.message,
+                "error_code": self.error_code,
+            },
+            headers={"Retry-After": "1"},
+        )
@@ -0,0 +1,217 @@
+import asyncio
+import hashlib
+import hmac
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional, TypeVar
+
+from src.core.config.config import settings
+from src.core.security.exception import PasswordHashingBusy
+
+SALT_BYTES = 32
+LEGACY_ITERATIONS = 100000
+
+T = TypeVar("T")
+
+
+class VerifyScheme(ABC):
+    name: str
+
+    @abstractmethod
+    def verify(self, hashed_password: str, password: str) -> bool:
+        ...
+
+    def needs_update(self, hashed_password: str) -> bool:
+        return False
+
+
+class HashScheme(VerifyScheme):
+    @abstractmethod
+    def hash(self, password: str) -> str:
+        ...
+
+
+class Pbkdf2Sha256Scheme(HashScheme):
+    name = "pbkdf2_sha256"
+
+    def __init__(self, iterations: int):
+        self.iterations = iterations
+
+    def hash(self, password: str) -> str:
+        salt = os.urandom(SALT_BYTES)
+        pw_hash = hashlib.pbkdf2_hmac('sha256', password.encode('utf-8'), salt, self.iterations)
+        return f"{self.name}${self.iterations}${salt.hex()}${pw_hash.hex()}"
+
+    def verify(self, hashed_password: str, password: str) -> bool:
+        _, iterations, salt_hex, stored_hash = hashed_password.split('$')
+        pw_hash = hashlib.pbkdf2_hmac('sha256', password.encode('utf-8'), bytes.fromhex(salt_hex), int(iterations))
+        return hmac.compare_digest(pw_hash, bytes.fromhex(stored_hash))
+
+    def needs_update(self, hashed_password: str) -> bool:
+        return int(hashed_password.split('$')[1]) != self.iterations
+
+
+class LegacyPbkdf2Sha256Scheme(VerifyScheme):
+    name = "legacy"
+
+    def verify(self, hashed_password: str, password: str) -> bool:
+        salt_hex, stored_hash = hashed_password.split(':')
+        pw_hash = hashlib.pbkdf2_hmac('sha256', password.encode('utf-8'), bytes.fromhex(salt_hex), LEGACY_ITERATIONS)
+        return hmac.compare_digest(pw_hash, bytes.fromhex(stored_hash))
+
+    def needs_update(self, hashed_password: str) -> bool:
+        return True
+
+
+class ScryptScheme(HashScheme):
+    name = "scrypt"
+
+    def __init__(self, n: int, r: int, p: int):
+        self.n = n
+        self.r = r
+        self.p = p
+
+    def hash(self, password: str) -> str:
+        salt = os.urandom(SALT_BYTES)
+        pw_hash = self._derive(password, salt, self.n, self.r, self.p)
+        return f"{self.name}${self.n}${self.r}${self.p}${salt.hex()}${pw_hash.hex()}"
+
+    def verify(self, hashed_password: str, password: str) -> bool:
+        _, n, r, p, salt_hex, stored_hash = hashed_password.split('$')
+        pw_hash = self._derive(password, bytes.fromhex(salt_hex), int(n), int(r), int(p))
+        return hmac.compare_digest(pw_hash, bytes.fromhex(stored_hash))
+
+    def needs_update(self, hashed_password: str) -> bool:
+        _, n, r, p, _, _ = hashed_password.split('$')
+        return (int(n), int(r), int(p)) != (self.n, self.r, self.p)
+
+    def _derive(self, password: str, salt: bytes, n: int, r: int, p: int) -> bytes:
+        return hashlib.scrypt(password.encode('utf-8'), salt=salt, n=n, r=r, p=p,
+                              maxmem=256 * n * r + 1024 * 1024, dklen=32)
+
+
+class PasswordHasher:
+    def __init__(self, schemes: List[VerifyScheme], default: str):
+        self.schemes = {scheme.name: scheme for scheme in schemes}
+        if default not in self.schemes:
+            raise ValueError(f"Unknown password hash scheme: {default}")
+        if not isinstance(self.schemes[default], HashScheme):
+            raise ValueError(f"Password hash scheme {default} is verify-only and cannot be the default")
+        self.default: HashScheme = self.schemes[default]
+
+    def identify(self, hashed_password: str) -> Optional[VerifyScheme]:
+        if '$' not in hashed_password:
+            return self.schemes.get(LegacyPbkdf2Sha256Scheme.name)
+        return self.schemes.get(hashed_password.split('$', 1)[0])
+
+    def hash(self, password: str) -> str:
+        return self.default.hash(password)
+
+    def verify(self, hashed_password: str, password: str) -> bool:
+        scheme = self.identify(hashed_password)
+        if scheme is None:
+            return False
+        try:
+            return scheme.verify(hashed_password, password)
+        except ValueError:
+            return False
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        scheme = self.identify(hashed_password)
+        return scheme is not self.default or scheme.needs_update(hashed_password)
+
+
+password_hasher = PasswordHasher(
+    [
+        Pbkdf2Sha256Scheme(settings.PASSWORD_HASH_ITERATIONS),
+        ScryptScheme(settings.SCRYPT_N, settings.SCRYPT_R, settings.SCRYPT_P),
+        LegacyPbkdf2Sha256Scheme(),
+    ],
+    default=settings.PASSWORD_HASH_SCHEME,
+)
+
+
+def hash_password(password: str) -> str:
+    return password_hasher.hash(password)
+
+
+def verify_password(hashed_password: str, password: str) -> bool:
+    return password_hasher.verify(hashed_password, password)
+
+
+def needs_rehash(hashed_password: str) -> bool:
+    return password_hasher.needs_rehash(hashed_password)
+
+
+def hash_passwords(passwords: List[str]) -> List[str]:
+    return [password_hasher.hash(password) for password in passwords]
+
+
+class PasswordHashingPool:
+    def __init__(self, workers: int, queue_size: int):
+        self.workers = workers
+        self.queue_size = queue_size
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="password-hashing")
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self.running = 0
+        self.submitted = 0
+        self.completed = 0
+        self.rejected = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+        self.run_seconds_total = 0.0
+
+    async def run(self, func: Callable[..., T], *args) -> T:
+        with self._lock:
+            if self.in_flight >= self.workers + self.queue_size:
+                self.rejected += 1
+                raise PasswordHashingBusy()
+            self.in_flight += 1
+            self.submitted += 1
+
+        try:
+            return await asyncio.get_running_loop().run_in_executor(
+                self._executor, self._call, time.perf_counter(), func, *args
+            )
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+    def _call(self, submitted_at: float, func: Callable[..., T], *args) -> T:
+        started_at = time.perf_counter()
+        waited = started_at - submitted_at
+        with self._lock:
+            self.running += 1
+            self.wait_seconds_total += waited
+            self.wait_seconds_max = max(self.wait_seconds_max, waited)
+
+        try:
+            return func(*args)
+        finally:
+            with self._lock:
+                self.running -= 1
+                self.completed += 1
+                self.run_seconds_total += time.perf_counter() - started_at
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "queue_size": self.queue_size,
+                "in_flight": self.in_flight,
+                "running": self.running,
+                "queued": self.in_flight - self.running,
+                "submitted": self.submitted,
+                "completed": self.completed,
+                "rejected": self.rejected,
+                "wait_seconds_total": round(self.wait_seconds_total, 6),
+                "wait_seconds_max": round(self.wait_seconds_max, 6),
+                "run_seconds_total": round(self.run_seconds_total, 6),
+            }
+
+
+password_hashing_pool = PasswordHashingPool(settings.PASSWORD_HASH_WORKERS, settings.PASSWORD_HASH_QUEUE_SIZE)
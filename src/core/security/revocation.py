@@ -0,0 +1,75 @@
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Optional
+
+from src.core.config.config import settings
+from src.core.security.schema import TokenData
+from src.core.security.token_cache import TokenCache, token_cache, token_digest
+
+
+def issued_before(token_data: TokenData, cutoff: Optional[datetime]) -> bool:
+    if cutoff is None:
+        return False
+
+    return token_data.iat is None or token_data.iat < int(cutoff.timestamp())
+
+
+class TokenRevocationList:
+    def __init__(self, token_cache: TokenCache, ttl: float, max_entries: int):
+        self.token_cache = token_cache
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._checks: OrderedDict[bytes, tuple[float, int, bool]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def revoke_member(self, member_id: int) -> None:
+        with self._lock:
+            for key in [key for key, (_, cached_member_id, _) in self._checks.items() if cached_member_id == member_id]:
+                del self._checks[key]
+
+        self.token_cache.evict_member(member_id)
+
+    def revoke_token(self, token: str, member_id: int) -> None:
+        self.cache_revoked(token, member_id, True)
+        self.token_cache.evict(token)
+
+    def cached_revoked(self, token: str) -> Optional[bool]:
+        key = token_digest(token)
+
+        with self._lock:
+            entry = self._checks.get(key)
+            if entry is None:
+                return None
+
+            expires_at, _, revoked = entry
+            if expires_at <= time.monotonic():
+                del self._checks[key]
+                return None
+
+            self._checks.move_to_end(key)
+            return revoked
+
+    def cache_revoked(self, token: str, member_id: int, revoked: bool) -> None:
+        # The logout denylist and member cutoffs live in the database; a negative answer is only trusted
+        # for `ttl` seconds so a revocation made through another process takes effect here within that window.
+        if self.max_entries <= 0 or (self.ttl <= 0 and not revoked):
+            return
+
+        key = token_digest(token)
+        expires_at = float("inf") if revoked else time.monotonic() + self.ttl
+
+        with self._lock:
+            self._checks[key] = (expires_at, member_id, revoked)
+            self._checks.move_to_end(key)
+            while len(self._checks) > self.max_entries:
+                self._checks.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._checks.clear()
+
+
+revocation_list = TokenRevocationList(token_cache, settings.TOKEN_REVOCATION_CACHE_TTL,
+                                      settings.TOKEN_CACHE_MAX_ENTRIES)
@@ -1,3 +1,5 @@
+from typing import Optional
+
 from pydantic import BaseModel
 
 
@@ -5,3 +7,5 @@ class TokenData(BaseModel):
     id: int
     username: str
     role: str
+    iat: Optional[int] = None
+    exp: Optional[int] = None
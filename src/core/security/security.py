@@ -6,6 +6,7 @@ from jose import jwt
 
 from src.core.security.exception import TokenValidationFailed
 from src.core.security.schema import TokenData
+from src.core.security.token_cache import token_cache
 
 SECRET_KEY = os.getenv("SECRET_KEY")
 ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", 30))
@@ -14,26 +15,35 @@ ALGORITHM = "HS256"
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     to_encode = data.copy()
+    issued_at = datetime.utcnow()
 
     if expires_delta:
-        expire = datetime.utcnow() + expires_delta
+        expire = issued_at + expires_delta
     else:
-        expire = datetime.utcnow() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+        expire = issued_at + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
 
-    to_encode.update({"exp": expire})
+    to_encode.update({"exp": expire, "iat": issued_at})
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
 
     return encoded_jwt
 
 
 def decode_token(token: str) -> Optional[TokenData]:
+    token_data = token_cache.get(token)
+    if token_data is not None:
+        return token_data
+
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
         token_data = TokenData(
             id=payload.get("id"),
             username=payload.get("username"),
-            role=payload.get("role")
+            role=payload.get("role"),
+            iat=payload.get("iat"),
+            exp=payload.get("exp")
         )
-        return token_data
     except Exception:
         raise TokenValidationFailed
+
+    token_cache.set(token, token_data)
+    return token_data
@@ -0,0 +1,78 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from src.core.config.config import settings
+from src.core.security.schema import TokenData
+
+
+def token_digest(token: str) -> bytes:
+    return hashlib.sha256(token.encode('utf-8')).digest()
+
+
+class TokenCache:
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[bytes, TokenData] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, token: str) -> Optional[TokenData]:
+        key = token_digest(token)
+
+        with self._lock:
+            token_data = self._entries.get(key)
+            if token_data is None:
+                self.misses += 1
+                return None
+
+            if token_data.exp <= time.time():
+                del self._entries[key]
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return token_data
+
+    def set(self, token: str, token_data: TokenData) -> None:
+        if self.max_entries <= 0 or token_data.exp is None:
+            return
+
+        key = token_digest(token)
+
+        with self._lock:
+            self._entries[key] = token_data
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def evict(self, token: str) -> None:
+        with self._lock:
+            self._entries.pop(token_digest(token), None)
+
+    def evict_member(self, member_id: int) -> None:
+        with self._lock:
+            for key in [key for key, token_data in self._entries.items() if token_data.id == member_id]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "evictions": self.evictions,
+        }
+
+
+token_cache = TokenCache(settings.TOKEN_CACHE_MAX_ENTRIES)
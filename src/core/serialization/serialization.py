@@ -0,0 +1,47 @@
+import csv
+import enum
+import io
+from datetime import datetime, timezone
+from typing import Annotated, Any, Iterable
+
+import orjson
+from pydantic import AfterValidator
+
+JSON_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+
+def to_naive_utc(value: datetime) -> datetime:
+    # exam.date is TIMESTAMP WITHOUT TIME ZONE and asyncpg refuses aware datetimes for it.
+    if value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+NaiveUtcDatetime = Annotated[datetime, AfterValidator(to_naive_utc)]
+
+
+def dump_json(content: Any) -> bytes:
+    return orjson.dumps(content, option=JSON_OPTIONS)
+
+
+def rows_to_dicts(rows: Iterable[Any]) -> list[dict]:
+    return [row._asdict() for row in rows]
+
+
+def dump_ndjson(items: Iterable[dict]) -> bytes:
+    return b"".join(orjson.dumps(item, option=JSON_OPTIONS | orjson.OPT_APPEND_NEWLINE) for item in items)
+
+
+def _csv_value(value: Any) -> Any:
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def dump_csv(rows: Iterable[Iterable[Any]]) -> bytes:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    writer.writerows([_csv_value(value) for value in row] for row in rows)
+    return buffer.getvalue().encode("utf-8")
@@ -0,0 +1,199 @@
+import atexit
+import base64
+import logging
+import queue
+import threading
+import time
+from typing import Callable, Optional
+from urllib.parse import parse_qsl, urlencode
+
+import orjson
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.core.security.security import decode_token
+
+REDACTED = "<redacted>"
+REDACTED_FIELDS = {"password"}
+EXCLUDED_PREFIXES = ("/internal", "/docs", "/openapi.json")
+
+_STOP = object()
+
+logger = logging.getLogger(__name__)
+
+_writer: Optional["JsonlWriter"] = None
+
+
+class JsonlWriter:
+    def __init__(self, path: str, queue_size: int, prepare: Callable[[dict], dict] = lambda entry: entry):
+        self.path = path
+        self.prepare = prepare
+        self._queue: queue.Queue = queue.Queue(queue_size)
+        self._thread = threading.Thread(target=self._run, name="traffic-writer", daemon=True)
+        self.written = 0
+        self.dropped = 0
+        self._thread.start()
+
+    def write(self, entry: dict) -> None:
+        try:
+            self._queue.put_nowait(entry)
+        except queue.Full:
+            self.dropped += 1
+
+    def close(self) -> None:
+        if self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join()
+
+    def _run(self) -> None:
+        with open(self.path, "ab") as file:
+            while True:
+                entry = self._queue.get()
+                if entry is _STOP:
+                    return
+
+                try:
+                    file.write(orjson.dumps(self.prepare(entry), option=orjson.OPT_APPEND_NEWLINE))
+                except Exception:
+                    self.dropped += 1
+                    logger.exception("Failed to record request %s %s", entry.get("method"), entry.get("path"))
+                    continue
+
+                self.written += 1
+                if self._queue.empty():
+                    file.flush()
+
+    def stats(self) -> dict:
+        return {"path": self.path, "queued": self._queue.qsize(), "written": self.written, "dropped": self.dropped}
+
+
+def redact_body(body: bytes, content_type: str) -> bytes:
+    if content_type.startswith("application/json"):
+        try:
+            content = orjson.loads(body)
+        except orjson.JSONDecodeError:
+            return body
+        if isinstance(content, dict) and REDACTED_FIELDS & content.keys():
+            return orjson.dumps({key: REDACTED if key in REDACTED_FIELDS else value for key, value in content.items()})
+        return body
+
+    if content_type.startswith("application/x-www-form-urlencoded"):
+        fields = parse_qsl(body.decode("latin-1"), keep_blank_values=True)
+        if any(key in REDACTED_FIELDS for key, _ in fields):
+            return urlencode([(key, REDACTED if key in REDACTED_FIELDS else value) for key, value in fields]).encode()
+
+    return body
+
+
+def _principal(authorization: Optional[bytes]) -> Optional[dict]:
+    if not authorization or not authorization.lower().startswith(b"bearer "):
+        return None
+
+    try:
+        token_data = decode_token(authorization[7:].decode("latin-1"))
+    except Exception:
+        return None
+
+    return {"id": token_data.id, "username": token_data.username, "role": token_data.role}
+
+
+def prepare_entry(raw: dict) -> dict:
+    entry = {key: raw[key] for key in ("ts", "method", "path", "route", "status", "duration_ms", "request_id")}
+    entry["query"] = raw["query"].decode("latin-1")
+    entry["principal"] = _principal(raw["authorization"])
+
+    body = raw["body"]
+    if raw["body_truncated"]:
+        entry["body_truncated"] = True
+    elif body:
+        entry["content_type"] = raw["content_type"]
+        body = redact_body(body, raw["content_type"])
+        try:
+            entry["body"] = body.decode("utf-8")
+        except UnicodeDecodeError:
+            entry["body"] = base64.b64encode(body).decode()
+            entry["body_encoding"] = "base64"
+
+    return entry
+
+
+class TrafficRecorderMiddleware:
+    def __init__(self, app: ASGIApp, writer: JsonlWriter, max_body_bytes: int):
+        self.app = app
+        self.writer = writer
+        self.max_body_bytes = max_body_bytes
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"].startswith(EXCLUDED_PREFIXES):
+            await self.app(scope, receive, send)
+            return
+
+        started_at = time.time()
+        started = time.perf_counter()
+        body = bytearray()
+        body_truncated = False
+        status_code = 500
+
+        async def receive_with_body() -> Message:
+            nonlocal body_truncated
+            message = await receive()
+            if message["type"] == "http.request" and not body_truncated:
+                chunk = message.get("body", b"")
+                if len(body) + len(chunk) > self.max_body_bytes:
+                    body_truncated = True
+                    body.clear()
+                else:
+                    body.extend(chunk)
+            return message
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive_with_body, send_with_status)
+        finally:
+            # Only raw fields are captured here; decoding, redaction and JSON encoding run on the writer thread.
+            headers = dict(scope["headers"])
+            self.writer.write({
+                "ts": round(started_at, 6),
+                "method": scope["method"],
+                "path": scope["path"],
+                "query": scope["query_string"],
+                "route": getattr(scope.get("route"), "path", None),
+                "status": status_code,
+                "duration_ms": round((time.perf_counter() - started) * 1000, 3),
+                "request_id": scope.get("state", {}).get("request_id"),
+                "authorization": headers.get(b"authorization"),
+                "content_type": headers.get(b"content-type", b"").decode("latin-1"),
+                "body": bytes(body),
+                "body_truncated": body_truncated,
+            })
+
+
+def start_recording(path: str, queue_size: int) -> JsonlWriter:
+    global _writer
+
+    if _writer is None:
+        _writer = JsonlWriter(path, queue_size, prepare_entry)
+        atexit.register(stop_recording)
+
+    return _writer
+
+
+def stop_recording() -> None:
+    global _writer
+
+    if _writer is None:
+        return
+
+    _writer.close()
+    _writer = None
+
+
+def recording_stats() -> dict:
+    if _writer is None:
+        return {"enabled": False}
+
+    return {"enabled": True, **_writer.stats()}
@@ -1,16 +1,154 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, declarative_base
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+from uuid import uuid4
+
+from sqlalchemy import Result, create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, SessionTransaction, sessionmaker, declarative_base
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+from starlette.concurrency import run_in_threadpool
 
 from src.core.config.config import settings
+from src.db.pool_metrics import PoolMetrics, instrumented_pool_class
+
+sync_pool_metrics = PoolMetrics()
+async_pool_metrics = PoolMetrics()
+
+
+def _pool_options(pool_class: type[QueuePool], metrics: PoolMetrics) -> dict:
+    return {
+        "poolclass": instrumented_pool_class(pool_class, metrics),
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+
+
+def _async_connect_args() -> dict:
+    if not settings.DB_PGBOUNCER:
+        return {}
+
+    # PgBouncer in transaction mode can hand each transaction to a different server connection,
+    # so asyncpg must not rely on named prepared statements surviving between them.
+    return {
+        "statement_cache_size": 0,
+        "prepared_statement_cache_size": 0,
+        "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+    }
+
+
+engine = create_engine(settings.DATABASE_URL, **_pool_options(QueuePool, sync_pool_metrics))
+sync_pool_metrics.attach(engine.pool)
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
+
+async_engine = create_async_engine(settings.ASYNC_DATABASE_URL,
+                                   connect_args=_async_connect_args(),
+                                   **_pool_options(AsyncAdaptedQueuePool, async_pool_metrics))
+async_pool_metrics.attach(async_engine.pool)
+AsyncSessionLocal = async_sessionmaker(bind=async_engine, class_=AsyncSession, autoflush=False,
+                                       expire_on_commit=False)
 
-engine = create_engine(settings.DATABASE_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
 
-def get_db():
-    db = SessionLocal()
+class ThreadedSession:
+    def __init__(self, session: Session):
+        self.sync_session = session
+
+    @property
+    def info(self) -> dict:
+        return self.sync_session.info
+
+    def add(self, instance) -> None:
+        self.sync_session.add(instance)
+
+    def add_all(self, instances) -> None:
+        self.sync_session.add_all(instances)
+
+    async def execute(self, statement, params=None, **kwargs):
+        return await run_in_threadpool(self.sync_session.execute, statement, params, **kwargs)
+
+    async def scalar(self, statement, params=None, **kwargs):
+        return await run_in_threadpool(self.sync_session.scalar, statement, params, **kwargs)
+
+    async def scalars(self, statement, params=None, **kwargs):
+        return await run_in_threadpool(self.sync_session.scalars, statement, params, **kwargs)
+
+    async def stream(self, statement, params=None, execution_options=None, **kwargs) -> "ThreadedResult":
+        execution_options = {**(execution_options or {}), "stream_results": True}
+        result = await run_in_threadpool(self.sync_session.execute, statement, params,
+                                         execution_options=execution_options, **kwargs)
+        return ThreadedResult(result)
+
+    async def get(self, entity, ident, **kwargs):
+        return await run_in_threadpool(self.sync_session.get, entity, ident, **kwargs)
+
+    async def delete(self, instance) -> None:
+        await run_in_threadpool(self.sync_session.delete, instance)
+
+    async def flush(self, objects=None) -> None:
+        await run_in_threadpool(self.sync_session.flush, objects)
+
+    async def refresh(self, instance, attribute_names=None) -> None:
+        await run_in_threadpool(self.sync_session.refresh, instance, attribute_names)
+
+    async def begin_nested(self) -> "ThreadedSessionTransaction":
+        return ThreadedSessionTransaction(await run_in_threadpool(self.sync_session.begin_nested))
+
+    async def commit(self) -> None:
+        await run_in_threadpool(self.sync_session.commit)
+
+    async def rollback(self) -> None:
+        await run_in_threadpool(self.sync_session.rollback)
+
+    async def close(self) -> None:
+        await run_in_threadpool(self.sync_session.close)
+
+
+class ThreadedSessionTransaction:
+    def __init__(self, transaction: SessionTransaction):
+        self.transaction = transaction
+
+    async def commit(self) -> None:
+        await run_in_threadpool(self.transaction.commit)
+
+    async def rollback(self) -> None:
+        await run_in_threadpool(self.transaction.rollback)
+
+
+class ThreadedResult:
+    def __init__(self, result: Result):
+        self.result = result
+
+    async def partitions(self, size=None) -> AsyncIterator[list]:
+        partitions = self.result.partitions(size)
+        while (partition := await run_in_threadpool(next, partitions, None)) is not None:
+            yield partition
+
+
+@asynccontextmanager
+async def open_db():
+    if settings.DATABASE_ASYNC:
+        async with AsyncSessionLocal() as db:
+            yield db
+        return
+
+    db = ThreadedSession(SessionLocal())
     try:
         yield db
     finally:
-        db.close()
+        await db.close()
+
+
+async def get_db():
+    async with open_db() as db:
+        yield db
+
+
+def pool_status() -> dict:
+    return {
+        "async": async_pool_metrics.snapshot(async_engine.pool),
+        "sync": sync_pool_metrics.snapshot(engine.pool),
+    }
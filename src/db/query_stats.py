@@ -0,0 +1,138 @@
+import logging
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Iterator, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+QUERY_COUNT_HEADER = "X-DB-Query-Count"
+QUERY_TIME_HEADER = "X-DB-Query-Time"
+QUERY_START_TIMES = "query_start_times"
+MAX_LOGGED_STATEMENT_LENGTH = 2000
+
+QueryListener = Callable[[str, float], None]
+
+logger = logging.getLogger(__name__)
+
+_current: ContextVar[Optional["QueryStats"]] = ContextVar("query_stats", default=None)
+_listeners: List[QueryListener] = []
+
+
+class QueryStats:
+    def __init__(self, request_id: Optional[str] = None):
+        self.request_id = request_id
+        self.count = 0
+        self.seconds = 0.0
+        self.statements: Counter = Counter()
+
+    def record(self, statement: str, seconds: float) -> None:
+        self.count += 1
+        self.seconds += seconds
+        self.statements[statement] += 1
+
+    def most_repeated(self) -> tuple[str, int]:
+        return self.statements.most_common(1)[0] if self.statements else ("", 0)
+
+
+@contextmanager
+def track_queries(request_id: Optional[str] = None) -> Iterator[QueryStats]:
+    stats = _current.get()
+    if stats is not None:
+        # Nested scopes (metrics middleware, query stats middleware, tests) share the outermost counter.
+        stats.request_id = stats.request_id or request_id
+        yield stats
+        return
+
+    stats = QueryStats(request_id)
+    token = _current.set(stats)
+    try:
+        yield stats
+    finally:
+        _current.reset(token)
+
+
+def add_query_listener(listener: QueryListener) -> None:
+    if listener not in _listeners:
+        _listeners.append(listener)
+
+
+def parameter_shape(parameters: Any, executemany: bool = False) -> Any:
+    if executemany and isinstance(parameters, (list, tuple)):
+        return {"rows": len(parameters), "row": parameter_shape(parameters[0]) if parameters else None}
+    if isinstance(parameters, dict):
+        return {key: type(value).__name__ for key, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        return [type(value).__name__ for value in parameters]
+    return type(parameters).__name__
+
+
+def instrument_engine(engine: Engine, slow_query_seconds: float = 0.0) -> None:
+    @event.listens_for(engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault(QUERY_START_TIMES, []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info[QUERY_START_TIMES].pop()
+
+        stats = _current.get()
+        if stats is not None:
+            stats.record(statement, elapsed)
+
+        for listener in _listeners:
+            listener(statement, elapsed)
+
+        if slow_query_seconds and elapsed >= slow_query_seconds:
+            # Only the parameter types are logged; values may hold password hashes or personal data.
+            logger.warning("Slow query: %.2fms %s", elapsed * 1000, statement[:MAX_LOGGED_STATEMENT_LENGTH],
+                           extra={"request_id": stats.request_id if stats else None,
+                                  "duration_ms": round(elapsed * 1000, 3),
+                                  "parameters": parameter_shape(parameters, executemany)})
+
+    @event.listens_for(engine, "handle_error")
+    def handle_error(exception_context):
+        connection = exception_context.connection
+        if connection is not None and connection.info.get(QUERY_START_TIMES):
+            connection.info[QUERY_START_TIMES].pop()
+
+
+class QueryStatsMiddleware:
+    def __init__(self, app: ASGIApp, headers: bool = False, repeated_query_threshold: int = 0):
+        self.app = app
+        self.headers = headers
+        self.repeated_query_threshold = repeated_query_threshold
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with track_queries(scope.get("state", {}).get("request_id")) as stats:
+            async def send_with_headers(message: Message) -> None:
+                if message["type"] == "http.response.start" and self.headers:
+                    headers = MutableHeaders(scope=message)
+                    headers.append(QUERY_COUNT_HEADER, str(stats.count))
+                    headers.append(QUERY_TIME_HEADER, f"{stats.seconds:.6f}")
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_headers)
+            finally:
+                self._check_repeated(scope, stats)
+
+    def _check_repeated(self, scope: Scope, stats: QueryStats) -> None:
+        if not self.repeated_query_threshold:
+            return
+
+        statement, count = stats.most_repeated()
+        if count >= self.repeated_query_threshold:
+            route = getattr(scope.get("route"), "path", scope["path"])
+            logger.warning("Possible N+1: same statement executed %s times in %s %s (%s queries total): %s",
+                           count, scope["method"], route, stats.count, statement[:MAX_LOGGED_STATEMENT_LENGTH],
+                           extra={"request_id": stats.request_id, "query_count": stats.count,
+                                  "repeated": count})
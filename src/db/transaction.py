@@ -0,0 +1,42 @@
+import functools
+from typing import Any, Awaitable, Callable
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+TRANSACTION_DEPTH = "transaction_depth"
+AFTER_COMMIT = "after_commit"
+
+
+def transactional(func: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+    @functools.wraps(func)
+    async def wrapper(self, db: AsyncSession, *args, **kwargs):
+        depth = db.info.get(TRANSACTION_DEPTH, 0)
+        db.info[TRANSACTION_DEPTH] = depth + 1
+
+        try:
+            result = await func(self, db, *args, **kwargs)
+        except BaseException:
+            if depth == 0:
+                db.info.pop(AFTER_COMMIT, None)
+                await db.rollback()
+            raise
+        finally:
+            db.info[TRANSACTION_DEPTH] = depth
+
+        if depth == 0:
+            callbacks = db.info.pop(AFTER_COMMIT, [])
+            await db.commit()
+            for callback, callback_args in callbacks:
+                await callback(*callback_args)
+
+        return result
+
+    return wrapper
+
+
+async def after_commit(db: AsyncSession, callback: Callable[..., Awaitable[Any]], *args) -> None:
+    if not db.info.get(TRANSACTION_DEPTH, 0):
+        await callback(*args)
+        return
+
+    db.info.setdefault(AFTER_COMMIT, []).append((callback, args))
@@ -1,11 +1,13 @@
-from fastapi import APIRouter, Depends, status
-from sqlalchemy.orm import Session
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Query, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.auth.dependencies import get_admin_member
+from src.auth.principal import Principal
 from src.db.db import get_db
-from src.exam.schema import ExamCreate, ExamResponse
+from src.exam.schema import ExamCreate, ExamResponse, ExamHotModeUpdate, ExamListQuery, ExamPage
 from src.exam.service import ExamService
-from src.member.model import Member
 
 admin_router = APIRouter(
     prefix="/admin/exams",
@@ -17,37 +19,59 @@ exam_service = ExamService()
 
 
 @admin_router.post("/", response_model=ExamResponse)
-def create(
+async def create(
         examCreate: ExamCreate,
-        db: Session = Depends(get_db),
-        admin: Member = Depends(get_admin_member),
+        db: AsyncSession = Depends(get_db),
+        admin: Principal = Depends(get_admin_member),
 ):
-    return exam_service.create(db, admin, examCreate)
+    return await exam_service.create(db, admin, examCreate)
 
 
-@admin_router.get("/", response_model=list[ExamResponse])
-def get_all(
-        db: Session = Depends(get_db),
-        admin: Member = Depends(get_admin_member)
+@admin_router.get("/", response_model=ExamPage)
+async def get_all(
+        query: Annotated[ExamListQuery, Query()],
+        db: AsyncSession = Depends(get_db),
+        admin: Principal = Depends(get_admin_member)
 ):
-    return exam_service.get_all(db)
+    content = await exam_service.get_page_json(db, query, use_cache=False)
+
+    return Response(content=content, media_type="application/json")
 
 
 @admin_router.get("/{exam_id}", response_model=ExamResponse)
-def get(
+async def get(
         exam_id: int,
-        db: Session = Depends(get_db),
-        admin: Member = Depends(get_admin_member)
+        db: AsyncSession = Depends(get_db),
+        admin: Principal = Depends(get_admin_member)
 ):
-    exam = exam_service.get_by_id(db, exam_id)
+    exam = await exam_service.get_by_id(db, exam_id)
 
     return exam
 
 
 @admin_router.delete("/{exam_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete(
+async def delete(
         exam_id: int,
-        db: Session = Depends(get_db),
-        admin: Member = Depends(get_admin_member)
+        db: AsyncSession = Depends(get_db),
+        admin: Principal = Depends(get_admin_member)
 ) -> None:
-    exam_service.delete(db, exam_id)
+    await exam_service.delete(db, exam_id)
+
+
+@admin_router.post("/{exam_id}/hot", response_model=ExamResponse)
+async def enable_hot_mode(
+        exam_id: int,
+        exam_hot_mode_update: ExamHotModeUpdate,
+        db: AsyncSession = Depends(get_db),
+        admin: Principal = Depends(get_admin_member)
+):
+    return await exam_service.enable_hot_mode(db, exam_id, exam_hot_mode_update.shards)
+
+
+@admin_router.delete("/{exam_id}/hot", response_model=ExamResponse)
+async def disable_hot_mode(
+        exam_id: int,
+        db: AsyncSession = Depends(get_db),
+        admin: Principal = Depends(get_admin_member)
+):
+    return await exam_service.disable_hot_mode(db, exam_id)
@@ -0,0 +1,38 @@
+from typing import Optional
+
+from src.core.cache.cache import CacheBackend, create_cache_backend
+from src.core.config.config import settings
+
+GENERATION_KEY = "exam:generation"
+
+
+class ExamCache:
+    def __init__(self, backend: CacheBackend, ttl: float):
+        self.backend = backend
+        self.ttl = ttl
+
+    async def page_key(self, query_key: str) -> str:
+        generation = await self.backend.get_counter(GENERATION_KEY)
+        return f"exam:page:{generation}:{query_key}"
+
+    def detail_key(self, exam_id: int) -> str:
+        return f"exam:detail:{exam_id}"
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return await self.backend.get(key)
+
+    async def set(self, key: str, content: bytes) -> None:
+        await self.backend.set(key, content, self.ttl)
+
+    async def invalidate(self, *exam_ids: int) -> None:
+        await self.backend.delete(*(self.detail_key(exam_id) for exam_id in exam_ids))
+        await self.backend.incr(GENERATION_KEY)
+
+    def stats(self) -> dict:
+        return self.backend.stats()
+
+
+exam_cache = ExamCache(
+    backend=create_cache_backend(settings.CACHE_BACKEND, settings.CACHE_URL, settings.CACHE_MAX_ENTRIES),
+    ttl=settings.EXAM_CACHE_TTL,
+)
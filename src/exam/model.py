@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, DateTime, ForeignKey, String
+from sqlalchemy import Column, Integer, DateTime, ForeignKey, String, CheckConstraint, Index
 from sqlalchemy.sql import func
 
 from src.db.db import Base
@@ -6,6 +6,12 @@ from src.db.db import Base
 
 class Exam(Base):
     __tablename__ = "exam"
+    __mapper_args__ = {"eager_defaults": True}
+    __table_args__ = (
+        Index("ix_exam_date_id", "date", "id"),
+        Index("ix_exam_member_id", "member_id"),
+        Index("ix_exam_hot", "id", "hot_shards", postgresql_where="hot_shards > 0"),
+    )
 
     id = Column(Integer, primary_key=True)
     member_id = Column(Integer, ForeignKey("member.id"), nullable=False)
@@ -13,5 +19,17 @@ class Exam(Base):
     date = Column(DateTime, nullable=False)
     current_people = Column(Integer, default=0, nullable=False)
     max_people = Column(Integer, default=50000, nullable=False)
+    hot_shards = Column(Integer, default=0, server_default="0", nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     modified_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+
+
+class ExamSeatShard(Base):
+    __tablename__ = "exam_seat_shard"
+    __table_args__ = (
+        CheckConstraint("remaining >= 0", name="ck_exam_seat_shard_remaining"),
+    )
+
+    exam_id = Column(Integer, ForeignKey("exam.id", ondelete="CASCADE"), primary_key=True)
+    shard = Column(Integer, primary_key=True)
+    remaining = Column(Integer, nullable=False)
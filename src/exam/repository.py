@@ -1,27 +1,157 @@
-from typing import List
+from datetime import datetime
+from typing import List, Optional, Tuple
 
-from sqlalchemy.orm import Session
+from sqlalchemy import Row, Select, delete, func, select, tuple_, update
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.exam.model import Exam
+from src.exam.model import Exam, ExamSeatShard
 
 
 class ExamRepository:
-    def find_all(self, db: Session) -> List[Exam]:
-        return db.query(Exam).all()
+    def _page_statement(self, statement: Select,
+                        limit: int,
+                        after: Optional[Tuple[datetime, int]] = None,
+                        date_from: Optional[datetime] = None,
+                        date_to: Optional[datetime] = None,
+                        min_remaining: Optional[int] = None) -> Select:
+        statement = statement.order_by(Exam.date, Exam.id).limit(limit)
 
-    def find_by_id(self, db: Session, exam_id: int) -> Exam | None:
-        return db.query(Exam).filter(Exam.id == exam_id).first()
+        if after is not None:
+            statement = statement.where(tuple_(Exam.date, Exam.id) > tuple_(*after))
+        if date_from is not None:
+            statement = statement.where(Exam.date >= date_from)
+        if date_to is not None:
+            statement = statement.where(Exam.date < date_to)
+        if min_remaining is not None:
+            statement = statement.where(Exam.max_people - Exam.current_people >= min_remaining)
 
-    def find_by_member_id(self, db: Session, member_id: int) -> List[Exam]:
-        return db.query(Exam).filter(Exam.member_id == member_id).all()
+        return statement
 
-    def save(self, db: Session, exam: Exam) -> Exam:
+    async def find_page_rows(self, db: AsyncSession, limit: int, **filters) -> List[Row]:
+        columns = select(Exam.date, Exam.description, Exam.current_people, Exam.max_people,
+                         Exam.id, Exam.member_id, Exam.created_at)
+        result = await db.execute(self._page_statement(columns, limit, **filters))
+        return list(result.all())
+
+    async def find_by_id(self, db: AsyncSession, exam_id: int) -> Exam | None:
+        return await db.scalar(select(Exam).where(Exam.id == exam_id))
+
+    async def find_by_id_for_update(self, db: AsyncSession, exam_id: int) -> Exam | None:
+        statement = select(Exam).where(Exam.id == exam_id).with_for_update().execution_options(populate_existing=True)
+        return await db.scalar(statement)
+
+    async def find_by_member_id(self, db: AsyncSession, member_id: int) -> List[Exam]:
+        result = await db.scalars(select(Exam).where(Exam.member_id == member_id))
+        return list(result.all())
+
+    async def find_hot_shards(self, db: AsyncSession) -> dict[int, int]:
+        result = await db.execute(select(Exam.id, Exam.hot_shards).where(Exam.hot_shards > 0))
+        return {exam_id: shards for exam_id, shards in result.all()}
+
+    async def add_people(self, db: AsyncSession, exam_id: int, people: int) -> Exam | None:
+        next_people = Exam.current_people + people
+        statement = (
+            update(Exam)
+            .where(Exam.id == exam_id, Exam.hot_shards == 0, next_people <= Exam.max_people, next_people >= 0)
+            .values(current_people=next_people)
+            .returning(Exam)
+            .execution_options(populate_existing=True)
+        )
+        return await db.scalar(statement)
+
+    async def flush_hot_people(self, db: AsyncSession) -> int:
+        totals = (
+            select(ExamSeatShard.exam_id, func.sum(ExamSeatShard.remaining).label("remaining"))
+            .group_by(ExamSeatShard.exam_id)
+            .subquery()
+        )
+        flushed_people = Exam.max_people - totals.c.remaining
+        statement = (
+            update(Exam)
+            .where(Exam.id == totals.c.exam_id, Exam.hot_shards > 0, Exam.current_people != flushed_people)
+            .values(current_people=flushed_people)
+            .execution_options(synchronize_session=False)
+        )
+        result = await db.execute(statement)
+        return result.rowcount
+
+    async def save(self, db: AsyncSession, exam: Exam) -> Exam:
         db.add(exam)
-        db.commit()
-        db.refresh(exam)
+        await db.flush()
         return exam
 
-    def delete(self, db: Session, exam: Exam) -> bool:
-        db.delete(exam)
-        db.commit()
+    async def delete(self, db: AsyncSession, exam: Exam) -> bool:
+        await db.delete(exam)
+        await db.flush()
+        return True
+
+
+class ExamSeatShardRepository:
+    def add_all(self, db: AsyncSession, shards: List[ExamSeatShard]) -> None:
+        db.add_all(shards)
+
+    async def find_available(self, db: AsyncSession, exam_id: int, people: int) -> List[int]:
+        result = await db.scalars(
+            select(ExamSeatShard.shard).where(ExamSeatShard.exam_id == exam_id, ExamSeatShard.remaining >= people)
+        )
+        return list(result.all())
+
+    async def take(self, db: AsyncSession, exam_id: int, shard: int, people: int) -> int | None:
+        unlocked_shard = (
+            select(ExamSeatShard.shard)
+            .where(ExamSeatShard.exam_id == exam_id,
+                   ExamSeatShard.shard == shard,
+                   ExamSeatShard.remaining >= people)
+            .with_for_update(skip_locked=True)
+            .scalar_subquery()
+        )
+        statement = (
+            update(ExamSeatShard)
+            .where(ExamSeatShard.exam_id == exam_id, ExamSeatShard.shard == unlocked_shard)
+            .values(remaining=ExamSeatShard.remaining - people)
+            .returning(ExamSeatShard.remaining)
+        )
+        return await db.scalar(statement)
+
+    async def take_rebalanced(self, db: AsyncSession, exam_id: int, people: int) -> bool | None:
+        result = await db.scalars(
+            select(ExamSeatShard)
+            .where(ExamSeatShard.exam_id == exam_id)
+            .order_by(ExamSeatShard.shard)
+            .with_for_update()
+            .execution_options(populate_existing=True)
+        )
+        shards = list(result.all())
+        if not shards:
+            return None
+
+        total = sum(shard.remaining for shard in shards) - people
+        if total < 0:
+            return False
+
+        for shard, remaining in zip(shards, split_evenly(total, len(shards))):
+            shard.remaining = remaining
+
+        await db.flush()
         return True
+
+    async def lock_remaining(self, db: AsyncSession, exam_id: int) -> int | None:
+        result = await db.scalars(
+            select(ExamSeatShard.remaining)
+            .where(ExamSeatShard.exam_id == exam_id)
+            .order_by(ExamSeatShard.shard)
+            .with_for_update()
+        )
+        remaining = list(result.all())
+        return sum(remaining) if remaining else None
+
+    async def delete_all(self, db: AsyncSession, exam_id: int) -> int:
+        result = await db.scalars(
+            delete(ExamSeatShard).where(ExamSeatShard.exam_id == exam_id).returning(ExamSeatShard.remaining)
+        )
+        return sum(result.all())
+
+
+def split_evenly(total: int, parts: int) -> List[int]:
+    base, extra = divmod(total, parts)
+    return [base + 1 if index < extra else base for index in range(parts)]
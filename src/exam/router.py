@@ -1,10 +1,10 @@
-from typing import List
+from typing import Annotated
 
-from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, Query, Response
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.db.db import get_db
-from src.exam.schema import ExamResponse
+from src.exam.schema import ExamResponse, ExamListQuery, ExamPage
 from src.exam.service import ExamService
 
 router = APIRouter(
@@ -16,14 +16,21 @@ router = APIRouter(
 exam_service = ExamService()
 
 
-@router.get("/", response_model=List[ExamResponse])
-def get_all(db: Session = Depends(get_db)):
-    return exam_service.get_all(db)
+@router.get("/", response_model=ExamPage)
+async def get_all(
+        query: Annotated[ExamListQuery, Query()],
+        db: AsyncSession = Depends(get_db)
+):
+    content = await exam_service.get_page_json(db, query)
+
+    return Response(content=content, media_type="application/json")
 
 
 @router.get("/{exam_id}", response_model=ExamResponse)
-def get(
+async def get(
         exam_id: int,
-        db: Session = Depends(get_db)
+        db: AsyncSession = Depends(get_db)
 ):
-    return exam_service.get_by_id(db, exam_id)
+    content = await exam_service.get_json_by_id(db, exam_id)
+
+    return Response(content=content, media_type="application/json")
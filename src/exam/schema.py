@@ -1,10 +1,13 @@
 from datetime import datetime
+from typing import List, Optional
 
 from pydantic import BaseModel, Field
 
+from src.core.serialization.serialization import NaiveUtcDatetime
+
 
 class ExamBase(BaseModel):
-    date: datetime
+    date: NaiveUtcDatetime
     description: str
     current_people: int = Field(default=0, ge=0)
     max_people: int = Field(default=50000, ge=1)
@@ -22,3 +25,20 @@ class ExamResponse(ExamBase):
     model_config = {
         'from_attributes': True
     }
+
+
+class ExamListQuery(BaseModel):
+    limit: int = Field(default=50, ge=1, le=500)
+    cursor: Optional[str] = None
+    date_from: Optional[NaiveUtcDatetime] = None
+    date_to: Optional[NaiveUtcDatetime] = None
+    min_remaining: Optional[int] = Field(default=None, ge=1)
+
+
+class ExamPage(BaseModel):
+    items: List[ExamResponse]
+    next_cursor: Optional[str] = None
+
+
+class ExamHotModeUpdate(BaseModel):
+    shards: int = Field(default=16, ge=1, le=1024)
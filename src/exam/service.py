@@ -1,37 +1,93 @@
-from typing import List
+import base64
+import json
+import random
+from datetime import datetime
+from typing import List, Tuple
 
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.exam.exception import ExamCapacityExceededError, ExamNotFound
-from src.exam.model import Exam
-from src.exam.repository import ExamRepository
-from src.exam.schema import ExamCreate, ExamResponse
-from src.member.model import Member
+from src.auth.principal import Principal
+from src.core.serialization.serialization import dump_json, rows_to_dicts
+from src.db.transaction import after_commit, transactional
+from src.exam.cache import exam_cache
+from src.exam.exception import ExamCapacityExceededError, ExamNotFound, ExamValidationError
+from src.exam.model import Exam, ExamSeatShard
+from src.exam.repository import ExamRepository, ExamSeatShardRepository, split_evenly
+from src.exam.schema import ExamCreate, ExamResponse, ExamListQuery
+
+hot_exam_shards: dict[int, int] = {}
 
 
 class ExamService:
     def __init__(self):
         self.repository = ExamRepository()
+        self.shard_repository = ExamSeatShardRepository()
+        self.cache = exam_cache
 
-    def get_all(self, db: Session) -> List[ExamResponse]:
-        exams = self.repository.find_all(db)
+    def _encode_cursor(self, date: datetime, exam_id: int) -> str:
+        raw = json.dumps([date.isoformat(), exam_id]).encode()
+        return base64.urlsafe_b64encode(raw).decode()
 
-        return [ExamResponse.model_validate(exam) for exam in exams]
+    def _decode_cursor(self, cursor: str) -> Tuple[datetime, int]:
+        try:
+            date, exam_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+            return datetime.fromisoformat(date), int(exam_id)
+        except (ValueError, TypeError):
+            raise ExamValidationError("Invalid cursor")
+
+    async def _render_page(self, db: AsyncSession, query: ExamListQuery) -> bytes:
+        after = self._decode_cursor(query.cursor) if query.cursor else None
+        rows = await self.repository.find_page_rows(db,
+                                                    limit=query.limit + 1,
+                                                    after=after,
+                                                    date_from=query.date_from,
+                                                    date_to=query.date_to,
+                                                    min_remaining=query.min_remaining)
+
+        items = rows_to_dicts(rows[:query.limit])
+        next_cursor = self._encode_cursor(items[-1]["date"], items[-1]["id"]) if len(rows) > query.limit else None
+
+        return dump_json({"items": items, "next_cursor": next_cursor})
 
-    def get_by_id(self, db: Session, exam_id: int) -> ExamResponse:
-        exam = self.repository.find_by_id(db, exam_id)
+    async def get_page_json(self, db: AsyncSession, query: ExamListQuery, use_cache: bool = True) -> bytes:
+        if not use_cache:
+            return await self._render_page(db, query)
+
+        key = await self.cache.page_key(query.model_dump_json(exclude_none=True))
+        content = await self.cache.get(key)
+
+        if content is None:
+            content = await self._render_page(db, query)
+            await self.cache.set(key, content)
+
+        return content
+
+    async def get_by_id(self, db: AsyncSession, exam_id: int) -> ExamResponse:
+        exam = await self.repository.find_by_id(db, exam_id)
 
         if not exam:
             raise ExamNotFound(exam_id)
 
         return ExamResponse.model_validate(exam)
 
-    def get_by_member_id(self, db: Session, member_id: int) -> List[ExamResponse]:
-        exams = self.repository.find_by_member_id(db, member_id)
+    async def get_json_by_id(self, db: AsyncSession, exam_id: int) -> bytes:
+        key = self.cache.detail_key(exam_id)
+        content = await self.cache.get(key)
+
+        if content is None:
+            exam = await self.get_by_id(db, exam_id)
+            content = exam.model_dump_json().encode()
+            await self.cache.set(key, content)
+
+        return content
+
+    async def get_by_member_id(self, db: AsyncSession, member_id: int) -> List[ExamResponse]:
+        exams = await self.repository.find_by_member_id(db, member_id)
 
         return [ExamResponse.model_validate(exam) for exam in exams]
 
-    def create(self, db: Session, member: Member, exam_create: ExamCreate) -> ExamResponse:
+    @transactional
+    async def create(self, db: AsyncSession, member: Principal, exam_create: ExamCreate) -> ExamResponse:
         if exam_create.current_people > exam_create.max_people:
             raise ExamCapacityExceededError()
 
@@ -42,25 +98,139 @@ class ExamService:
             current_people=exam_create.current_people,
             max_people=exam_create.max_people
         )
-        saved_exam = self.repository.save(db, exam)
+        saved_exam = await self.repository.save(db, exam)
+        await after_commit(db, self.cache.invalidate)
 
         return ExamResponse.model_validate(saved_exam)
 
-    def delete(self, db: Session, exam_id: int) -> None:
-        exam = self.repository.find_by_id(db, exam_id)
+    @transactional
+    async def delete(self, db: AsyncSession, exam_id: int) -> None:
+        exam = await self.repository.find_by_id(db, exam_id)
         if not exam:
             raise ExamNotFound(exam_id)
 
-        self.repository.delete(db, exam)
+        await self.repository.delete(db, exam)
+        await after_commit(db, self.cache.invalidate, exam_id)
+
+    @transactional
+    async def update_people(self, db: AsyncSession, exam_id: int, people: int) -> Exam | None:
+        if exam_id in hot_exam_shards and await self._update_hot_people(db, exam_id, people):
+            return None
 
-    def update_people(self, db: Session, exam_id: int, people: int):
-        exam = self.repository.find_by_id(db, exam_id)
+        exam = await self.repository.add_people(db, exam_id, people)
+        if exam:
+            await after_commit(db, self.cache.invalidate, exam_id)
+            return exam
+
+        exam = await self.repository.find_by_id(db, exam_id)
         if not exam:
             raise ExamNotFound(exam_id)
 
-        if exam.current_people + people > exam.max_people:
+        if exam.hot_shards:
+            hot_exam_shards[exam_id] = exam.hot_shards
+            if await self._update_hot_people(db, exam_id, people):
+                return None
+
+        if people < 0:
+            raise ExamValidationError("Exam people cannot be negative")
+
+        raise ExamCapacityExceededError()
+
+    async def _update_hot_people(self, db: AsyncSession, exam_id: int, people: int) -> bool:
+        savepoint = await db.begin_nested()
+        if await self._take_any_shard(db, exam_id, people):
+            await savepoint.commit()
+            return True
+
+        # A take that lost its re-check under READ COMMITTED still keeps the row lock until the
+        # transaction ends, so drop those before the rebalance waits on every shard in order.
+        await savepoint.rollback()
+
+        # A failed rebalance still holds every shard lock; release them so a caller that falls back to
+        # lock_remaining_seats takes the exam row before the shards, like every other path.
+        savepoint = await db.begin_nested()
+        taken = await self.shard_repository.take_rebalanced(db, exam_id, people)
+        if not taken:
+            await savepoint.rollback()
+            if taken is None:
+                hot_exam_shards.pop(exam_id, None)
+                return False
             raise ExamCapacityExceededError()
 
-        exam.current_people += people
+        await savepoint.commit()
+        return True
+
+    async def _take_any_shard(self, db: AsyncSession, exam_id: int, people: int) -> bool:
+        shard = random.randrange(hot_exam_shards[exam_id])
+        if await self.shard_repository.take(db, exam_id, shard, people) is not None:
+            return True
+
+        available = await self.shard_repository.find_available(db, exam_id, people)
+        random.shuffle(available)
+        for shard in available:
+            if await self.shard_repository.take(db, exam_id, shard, people) is not None:
+                return True
+
+        return False
+
+    async def lock_remaining_seats(self, db: AsyncSession, exam_id: int) -> int:
+        exam = await self.repository.find_by_id_for_update(db, exam_id)
+        if not exam:
+            raise ExamNotFound(exam_id)
+
+        if exam.hot_shards:
+            remaining = await self.shard_repository.lock_remaining(db, exam_id)
+            if remaining is not None:
+                return remaining
+
+        return exam.max_people - exam.current_people
+
+    @transactional
+    async def enable_hot_mode(self, db: AsyncSession, exam_id: int, shards: int) -> ExamResponse:
+        exam = await self.repository.find_by_id_for_update(db, exam_id)
+        if not exam:
+            raise ExamNotFound(exam_id)
+
+        if exam.hot_shards:
+            raise ExamValidationError("Exam is already in hot mode")
+
+        remaining = split_evenly(exam.max_people - exam.current_people, shards)
+        self.shard_repository.add_all(db, [
+            ExamSeatShard(exam_id=exam_id, shard=shard, remaining=seats) for shard, seats in enumerate(remaining)
+        ])
+        exam.hot_shards = shards
+        saved_exam = await self.repository.save(db, exam)
+        hot_exam_shards[exam_id] = shards
+        await after_commit(db, self.cache.invalidate, exam_id)
+
+        return ExamResponse.model_validate(saved_exam)
+
+    @transactional
+    async def disable_hot_mode(self, db: AsyncSession, exam_id: int) -> ExamResponse:
+        exam = await self.repository.find_by_id_for_update(db, exam_id)
+        if not exam:
+            raise ExamNotFound(exam_id)
+
+        if not exam.hot_shards:
+            raise ExamValidationError("Exam is not in hot mode")
+
+        remaining = await self.shard_repository.delete_all(db, exam_id)
+        exam.current_people = exam.max_people - remaining
+        exam.hot_shards = 0
+        saved_exam = await self.repository.save(db, exam)
+        hot_exam_shards.pop(exam_id, None)
+        await after_commit(db, self.cache.invalidate, exam_id)
+
+        return ExamResponse.model_validate(saved_exam)
+
+    @transactional
+    async def flush_hot_people(self, db: AsyncSession) -> int:
+        flushed = await self.repository.flush_hot_people(db)
+
+        hot_exam_shards.clear()
+        hot_exam_shards.update(await self.repository.find_hot_shards(db))
+
+        if flushed:
+            await after_commit(db, self.cache.invalidate, *hot_exam_shards)
 
-        return self.repository.save(db, exam)
+        return flushed
@@ -0,0 +1,20 @@
+import asyncio
+import logging
+
+from src.db.db import open_db
+from src.exam.service import ExamService
+
+logger = logging.getLogger(__name__)
+
+
+async def run_hot_people_flush(interval: float) -> None:
+    exam_service = ExamService()
+
+    while True:
+        try:
+            async with open_db() as db:
+                await exam_service.flush_hot_people(db)
+        except Exception:
+            logger.exception("Failed to flush hot exam seat counters")
+
+        await asyncio.sleep(interval)
@@ -0,0 +1,46 @@
+from fastapi import APIRouter, Response
+
+from src.core.logger.logger import logging_stats
+from src.core.metrics.metrics import render_metrics
+from src.core.security.password import password_hashing_pool
+from src.core.security.token_cache import token_cache
+from src.core.traffic.recorder import recording_stats
+from src.db.db import pool_status
+from src.exam.cache import exam_cache
+
+router = APIRouter(
+    prefix="/internal",
+    tags=["internal"],
+    include_in_schema=False,
+)
+
+
+@router.get("/db/pool")
+async def get_pool_status() -> dict:
+    return pool_status()
+
+
+@router.get("/cache")
+async def get_cache_stats() -> dict:
+    return {"exam": exam_cache.stats(), "token": token_cache.stats()}
+
+
+@router.get("/password-hashing")
+async def get_password_hashing_stats() -> dict:
+    return password_hashing_pool.stats()
+
+
+@router.get("/logging")
+async def get_logging_stats() -> dict:
+    return logging_stats()
+
+
+@router.get("/traffic")
+async def get_traffic_recording_stats() -> dict:
+    return recording_stats()
+
+
+@router.get("/metrics")
+async def get_metrics() -> Response:
+    content, media_type = render_metrics()
+    return Response(content=content, media_type=media_type)
@@ -0,0 +1,144 @@
+import argparse
+import asyncio
+import csv
+import logging
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Iterator, List, Optional, Tuple
+
+import orjson
+from pydantic import ValidationError
+
+from src.core.logger.logger import setup_logging
+from src.core.security.password import hash_passwords
+from src.db.db import open_db
+from src.member.schema import MemberCreate
+from src.member.service import MemberService
+
+logger = logging.getLogger(__name__)
+
+MAX_BATCH_SIZE = 10000
+
+
+def read_records(path: str, format: Optional[str] = None) -> Iterator[Tuple[int, dict]]:
+    format = format or os.path.splitext(path)[1].lstrip('.').lower()
+
+    with open(path, newline='', encoding='utf-8') as file:
+        if format == 'csv':
+            for line, record in enumerate(csv.DictReader(file), start=2):
+                yield line, record
+        elif format in ('ndjson', 'jsonl'):
+            for line, raw in enumerate(file, start=1):
+                if raw.strip():
+                    yield line, orjson.loads(raw)
+        else:
+            raise ValueError(f"Unsupported import format: {format}")
+
+
+class MemberImporter:
+    def __init__(self, executor: Executor, workers: int, batch_size: int):
+        self.executor = executor
+        self.workers = workers
+        self.batch_size = batch_size
+        self.member_service = MemberService()
+        self.read = 0
+        self.created = 0
+        self.existing = 0
+        self.duplicate = 0
+        self.invalid = 0
+        self._seen: set[str] = set()
+
+    async def run(self, records: Iterator[Tuple[int, dict]]) -> dict:
+        started_at = time.perf_counter()
+        batch = []
+
+        for line, record in records:
+            self.read += 1
+            member = self._validate(line, record)
+            if member is None:
+                continue
+
+            batch.append(member)
+            if len(batch) >= self.batch_size:
+                await self._import_batch(batch)
+                batch = []
+
+        if batch:
+            await self._import_batch(batch)
+
+        return {**self.stats(), "seconds": round(time.perf_counter() - started_at, 3)}
+
+    def _validate(self, line: int, record: dict) -> MemberCreate | None:
+        try:
+            member = MemberCreate.model_validate(record)
+        except ValidationError as e:
+            self.invalid += 1
+            logger.warning("Skipped invalid member record on line %s: %s", line, e.errors(include_url=False))
+            return None
+
+        if member.username in self._seen:
+            self.duplicate += 1
+            return None
+
+        self._seen.add(member.username)
+        return member
+
+    async def _import_batch(self, members: List[MemberCreate]) -> None:
+        async with open_db() as db:
+            existing = await self.member_service.find_existing_usernames(db, [member.username for member in members])
+            await db.rollback()
+
+            members = [member for member in members if member.username not in existing]
+            hashed_passwords = await self._hash([member.password for member in members])
+            created = await self.member_service.create_many(db, members, hashed_passwords) if members else []
+
+        self.created += len(created)
+        self.existing += len(existing) + len(members) - len(created)
+        logger.info("Imported members: %s", self.stats())
+
+    async def _hash(self, passwords: List[str]) -> List[str]:
+        chunk_size = -(-len(passwords) // self.workers) or 1
+        loop = asyncio.get_running_loop()
+        chunks = await asyncio.gather(*(
+            loop.run_in_executor(self.executor, hash_passwords, passwords[start:start + chunk_size])
+            for start in range(0, len(passwords), chunk_size)
+        ))
+        return [hashed_password for chunk in chunks for hashed_password in chunk]
+
+    def stats(self) -> dict:
+        return {
+            "read": self.read,
+            "created": self.created,
+            "existing": self.existing,
+            "duplicate": self.duplicate,
+            "invalid": self.invalid,
+        }
+
+
+async def import_members(path: str, format: Optional[str], workers: int, batch_size: int) -> dict:
+    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn')) as executor:
+        return await MemberImporter(executor, workers, batch_size).run(read_records(path, format))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bulk import members from a CSV or NDJSON file "
+                                                 "(username, password[, role])")
+    parser.add_argument("path")
+    parser.add_argument("--format", choices=["csv", "ndjson"], help="defaults to the file extension")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="password hashing processes")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    args = parser.parse_args()
+
+    if not 1 <= args.batch_size <= MAX_BATCH_SIZE:
+        parser.error(f"--batch-size must be between 1 and {MAX_BATCH_SIZE}")
+
+    setup_logging()
+    summary = asyncio.run(import_members(args.path, args.format, args.workers, args.batch_size))
+    sys.stdout.write(orjson.dumps(summary).decode() + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Enum, DateTime
+from sqlalchemy import Column, Integer, String, Enum, DateTime, ForeignKey, LargeBinary
 from sqlalchemy.sql import func
 import enum
 
@@ -12,6 +12,7 @@ class Role(enum.Enum):
 
 class Member(Base):
     __tablename__ = "member"
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(Integer, primary_key=True)
     username = Column(String, unique=True, index=True, nullable=False)
@@ -19,3 +20,12 @@ class Member(Base):
     role = Column(Enum(Role), default=Role.USER, nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     modified_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+    tokens_valid_after = Column(DateTime(timezone=True), nullable=True)
+
+
+class RevokedToken(Base):
+    __tablename__ = "revoked_token"
+
+    digest = Column(LargeBinary, primary_key=True)
+    member_id = Column(Integer, ForeignKey("member.id", ondelete="CASCADE"), nullable=False)
+    expires_at = Column(DateTime(timezone=True), nullable=False, index=True)
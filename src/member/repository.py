@@ -1,23 +1,65 @@
-from sqlalchemy.orm import Session
+from datetime import datetime
+from typing import List
 
-from src.member.model import Member
+from sqlalchemy import Row, delete, exists, func, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.member.model import Member, RevokedToken
 
 
 class MemberRepository:
-    def find_by_id(self, db: Session, member_id: int) -> Member:
-        return db.query(Member).filter(Member.id == member_id).first()
+    async def find_by_id(self, db: AsyncSession, member_id: int) -> Member:
+        return await db.scalar(select(Member).where(Member.id == member_id))
+
+    async def find_by_username(self, db: AsyncSession, username: str) -> Member:
+        return await db.scalar(select(Member).where(Member.username == username))
+
+    async def find_existing_usernames(self, db: AsyncSession, usernames: List[str]) -> set[str]:
+        result = await db.scalars(select(Member.username).where(Member.username.in_(usernames)))
+        return set(result.all())
+
+    async def insert_many(self, db: AsyncSession, members: List[dict]) -> List[str]:
+        result = await db.scalars(
+            insert(Member)
+            .values(members)
+            .on_conflict_do_nothing(index_elements=[Member.username])
+            .returning(Member.username)
+        )
+        return list(result.all())
+
+    async def update_password(self, db: AsyncSession, member_id: int, hashed_password: str,
+                              new_hashed_password: str) -> bool:
+        result = await db.execute(
+            update(Member)
+            .where(Member.id == member_id, Member.password == hashed_password)
+            .values(password=new_hashed_password)
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount == 1
+
+    async def revoke_token(self, db: AsyncSession, member_id: int, digest: bytes, expires_at: datetime) -> None:
+        await db.execute(delete(RevokedToken).where(RevokedToken.expires_at <= func.now()))
+        await db.execute(
+            insert(RevokedToken)
+            .values(digest=digest, member_id=member_id, expires_at=expires_at)
+            .on_conflict_do_nothing(index_elements=[RevokedToken.digest])
+        )
 
-    def find_by_username(self, db: Session, username: str) -> Member:
-        return db.query(Member).filter(Member.username == username).first()
+    async def find_token_revocation(self, db: AsyncSession, member_id: int, digest: bytes) -> Row | None:
+        result = await db.execute(
+            select(Member.tokens_valid_after, exists().where(RevokedToken.digest == digest).label("revoked"))
+            .where(Member.id == member_id)
+        )
+        return result.first()
 
-    def save(self, db: Session, member: Member):
+    async def save(self, db: AsyncSession, member: Member):
         db.add(member)
-        db.commit()
-        db.refresh(member)
+        await db.flush()
         return member
 
-    def delete(self, db: Session, member: Member):
-        db.delete(member)
-        db.commit()
+    async def delete(self, db: AsyncSession, member: Member):
+        await db.delete(member)
+        await db.flush()
 
         return True
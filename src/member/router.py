@@ -1,10 +1,10 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.auth.dependencies import get_current_member
+from src.auth.dependencies import get_current_member, oauth2_scheme
+from src.auth.principal import Principal
 from src.db.db import get_db
-from src.member.model import Member
 from src.member.schema import MemberResponse, MemberCreate, MemberUpdate, LoginResponse
 from src.member.service import MemberService
 
@@ -18,8 +18,8 @@ member_service = MemberService()
 
 
 @router.post("/", response_model=MemberResponse, status_code=status.HTTP_201_CREATED)
-def create(member_create: MemberCreate, db: Session = Depends(get_db)) -> MemberResponse:
-    member = member_service.create(db, member_create)
+async def create(member_create: MemberCreate, db: AsyncSession = Depends(get_db)) -> MemberResponse:
+    member = await member_service.create(db, member_create)
 
     if member is None:
         raise HTTPException(status_code=400, detail="Username already registered")
@@ -28,10 +28,15 @@ def create(member_create: MemberCreate, db: Session = Depends(get_db)) -> Member
 
 
 @router.put("/", response_model=MemberResponse)
-def update(member_update: MemberUpdate,
-           db: Session = Depends(get_db),
-           member: Member = Depends(get_current_member), ) -> MemberResponse:
-    member_update = member_service.update(db, member, member_update=member_update)
+async def update(member_update: MemberUpdate,
+                 db: AsyncSession = Depends(get_db),
+                 current_member: Principal = Depends(get_current_member), ) -> MemberResponse:
+    member = await current_member.load(db)
+
+    if member is None:
+        raise HTTPException(status_code=404, detail="Member not found")
+
+    member_update = await member_service.update(db, member, member_update=member_update)
 
     if member_update is None:
         raise HTTPException(status_code=404, detail="Member not found")
@@ -40,8 +45,8 @@ def update(member_update: MemberUpdate,
 
 
 @router.delete("/{member_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete(member_id: int, db: Session = Depends(get_db)) -> None:
-    success = member_service.delete(db, member_id=member_id)
+async def delete(member_id: int, db: AsyncSession = Depends(get_db)) -> None:
+    success = await member_service.delete(db, member_id=member_id)
     if not success:
         raise HTTPException(status_code=404, detail="Member not found")
 
@@ -49,10 +54,20 @@ def delete(member_id: int, db: Session = Depends(get_db)) -> None:
 
 
 @router.post("/login", response_model=LoginResponse, status_code=status.HTTP_200_OK)
-def login(member_login: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)) -> LoginResponse:
-    loginResponse = member_service.login(db, member_login)
+async def login(member_login: OAuth2PasswordRequestForm = Depends(),
+                db: AsyncSession = Depends(get_db)) -> LoginResponse:
+    loginResponse = await member_service.login(db, member_login)
 
     if loginResponse is None:
         raise HTTPException(status_code=401, detail="Incorrect username or password")
 
     return loginResponse
+
+
+@router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
+async def logout(token: str = Depends(oauth2_scheme),
+                 db: AsyncSession = Depends(get_db),
+                 current_member: Principal = Depends(get_current_member)) -> None:
+    await member_service.logout(db, token)
+
+    return None
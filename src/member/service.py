@@ -1,49 +1,59 @@
-import hashlib
+import asyncio
 import logging
-import os
-
-from sqlalchemy.orm import Session
-
-from src.core.security.security import create_access_token
+from datetime import datetime, timezone
+from typing import List
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.config.config import settings
+from src.core.security.exception import PasswordHashingBusy
+from src.core.security.password import hash_password, needs_rehash, password_hashing_pool, verify_password
+from src.core.security.revocation import revocation_list
+from src.core.security.security import create_access_token, decode_token
+from src.core.security.token_cache import token_digest
+from src.db.db import open_db
+from src.db.transaction import after_commit, transactional
 from src.member.model import Member
 from src.member.repository import MemberRepository
 from src.member.schema import MemberCreate, MemberUpdate, MemberResponse, MemberLogin, LoginResponse
 
 logger = logging.getLogger(__name__)
 
+rehash_tasks: set[asyncio.Task] = set()
+
 
 class MemberService:
     def __init__(self):
         self.repository = MemberRepository()
 
     def _hash_password(self, password: str) -> str:
-        salt = os.urandom(32)
-        pw_hash = hashlib.pbkdf2_hmac('sha256', password.encode('utf-8'), salt, 100000)
-        return salt.hex() + ':' + pw_hash.hex()
+        return hash_password(password)
 
     def _verify_password(self, hashed_password: str, password: str) -> bool:
-        salt_hex, stored_hash = hashed_password.split(':')
-        salt = bytes.fromhex(salt_hex)
-
-        pw_hash = hashlib.pbkdf2_hmac('sha256', password.encode('utf-8'), salt, 100000)
+        return verify_password(hashed_password, password)
 
-        return pw_hash.hex() == stored_hash
+    async def _release_connection(self, db: AsyncSession) -> None:
+        # Ends the read transaction so the pooled connection is not held while waiting for the hashing pool.
+        # Sessions use expire_on_commit=False, so committing keeps the loaded member usable, unlike rollback.
+        await db.commit()
 
-    def _get_by_id(self, db: Session, member_id: int) -> MemberResponse:
-        member = self.repository.find_by_id(db, member_id)
+    async def _get_by_id(self, db: AsyncSession, member_id: int) -> MemberResponse:
+        member = await self.repository.find_by_id(db, member_id)
         if not member:
             return None
         return MemberResponse.model_validate(member)
 
-    def _get_by_username(self, db: Session, username: str) -> Member:
-        return self.repository.find_by_username(db, username)
+    async def _get_by_username(self, db: AsyncSession, username: str) -> Member:
+        return await self.repository.find_by_username(db, username)
 
-    def create(self, db: Session, member_create: MemberCreate) -> MemberResponse:
-        existing_member = self.repository.find_by_username(db, username=member_create.username)
+    @transactional
+    async def create(self, db: AsyncSession, member_create: MemberCreate) -> MemberResponse:
+        existing_member = await self.repository.find_by_username(db, username=member_create.username)
         if existing_member:
             return None
 
-        hashed_password = self._hash_password(member_create.password)
+        await self._release_connection(db)
+        hashed_password = await password_hashing_pool.run(self._hash_password, member_create.password)
 
         member = Member(
             username=member_create.username,
@@ -51,36 +61,65 @@ class MemberService:
             role=member_create.role
         )
 
-        saved_member = self.repository.save(db, member)
+        saved_member = await self.repository.save(db, member)
         return MemberResponse.model_validate(saved_member)
 
-    def update(self, db: Session, member: Member, member_update: MemberUpdate) -> MemberResponse:
+    async def find_existing_usernames(self, db: AsyncSession, usernames: List[str]) -> set[str]:
+        return await self.repository.find_existing_usernames(db, usernames)
+
+    @transactional
+    async def create_many(self, db: AsyncSession, members: List[MemberCreate], hashed_passwords: List[str]) -> List[str]:
+        return await self.repository.insert_many(db, [
+            {"username": member.username, "password": hashed_password, "role": member.role.value}
+            for member, hashed_password in zip(members, hashed_passwords)
+        ])
+
+    @transactional
+    async def update(self, db: AsyncSession, member: Member, member_update: MemberUpdate) -> MemberResponse:
         update_data = member_update.model_dump(exclude_unset=True)
 
         if 'password' in update_data:
-            update_data['password'] = self._hash_password(update_data['password'])
+            await self._release_connection(db)
+            update_data['password'] = await password_hashing_pool.run(self._hash_password, update_data['password'])
 
         for key, value in update_data.items():
             setattr(member, key, value)
 
-        updated_member = self.repository.save(db, member)
+        if 'password' in update_data:
+            member.tokens_valid_after = datetime.now(timezone.utc)
+            await after_commit(db, self._revoke_cached_member, member.id)
+
+        updated_member = await self.repository.save(db, member)
 
         return MemberResponse.model_validate(updated_member)
 
-    def delete(self, db: Session, member_id: int) -> bool:
-        member = self.repository.find_by_id(db, member_id)
+    @transactional
+    async def delete(self, db: AsyncSession, member_id: int) -> bool:
+        member = await self.repository.find_by_id(db, member_id)
 
         if not member:
             return False
 
-        return self.repository.delete(db, member)
+        success = await self.repository.delete(db, member)
 
-    def login(self, db: Session, member_login: MemberLogin) -> LoginResponse | None:
-        member = self.repository.find_by_username(db, member_login.username)
+        if success:
+            await after_commit(db, self._revoke_cached_member, member_id)
 
-        if not member or not self._verify_password(member.password, member_login.password):
+        return success
+
+    async def login(self, db: AsyncSession, member_login: MemberLogin) -> LoginResponse | None:
+        member = await self.repository.find_by_username(db, member_login.username)
+
+        if not member:
             return None
 
+        await self._release_connection(db)
+        if not await password_hashing_pool.run(self._verify_password, member.password, member_login.password):
+            return None
+
+        if settings.PASSWORD_REHASH_ON_LOGIN and needs_rehash(member.password):
+            self._schedule_rehash(member.id, member.password, member_login.password)
+
         payload = {
             "id": member.id,
             "username": member.username,
@@ -89,3 +128,36 @@ class MemberService:
         access_token = create_access_token(data=payload)
 
         return LoginResponse.model_validate({"access_token": access_token, "token_type": "bearer"})
+
+    @transactional
+    async def logout(self, db: AsyncSession, token: str) -> None:
+        token_data = decode_token(token)
+        expires_at = datetime.fromtimestamp(token_data.exp, timezone.utc)
+        await self.repository.revoke_token(db, token_data.id, token_digest(token), expires_at)
+        await after_commit(db, self._revoke_cached_token, token, token_data.id)
+
+    async def _revoke_cached_token(self, token: str, member_id: int) -> None:
+        revocation_list.revoke_token(token, member_id)
+
+    async def _revoke_cached_member(self, member_id: int) -> None:
+        revocation_list.revoke_member(member_id)
+
+    def _schedule_rehash(self, member_id: int, hashed_password: str, password: str) -> None:
+        task = asyncio.create_task(self._rehash_in_background(member_id, hashed_password, password))
+        rehash_tasks.add(task)
+        task.add_done_callback(rehash_tasks.discard)
+
+    async def _rehash_in_background(self, member_id: int, hashed_password: str, password: str) -> None:
+        try:
+            new_hashed_password = await password_hashing_pool.run(self._hash_password, password)
+            async with open_db() as db:
+                await self.rehash_password(db, member_id, hashed_password, new_hashed_password)
+        except PasswordHashingBusy:
+            logger.info("Skipped password rehash for member %s, hashing pool is busy", member_id)
+        except Exception:
+            logger.exception("Failed to rehash password for member %s", member_id)
+
+    @transactional
+    async def rehash_password(self, db: AsyncSession, member_id: int, hashed_password: str,
+                              new_hashed_password: str) -> bool:
+        return await self.repository.update_password(db, member_id, hashed_password, new_hashed_password)
@@ -1,12 +1,14 @@
-from typing import List
+from typing import Annotated, List
 
-from fastapi import APIRouter, status, Depends
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, status, Depends, Query, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.auth.dependencies import get_admin_member
+from src.auth.principal import Principal
 from src.db.db import get_db
-from src.member.model import Member
-from src.reservation.schema import ReservationResponse, ReservationUpdate, ReservationUpdateStatus
+from src.reservation.schema import ExportFormat, ReservationExportQuery, ReservationResponse, ReservationStatusBatch, \
+    ReservationStatusBatchResponse, ReservationUpdate, ReservationUpdateStatus
 from src.reservation.service import ReservationService
 
 admin_router = APIRouter(
@@ -17,30 +19,56 @@ admin_router = APIRouter(
 
 reservation_service = ReservationService()
 
+EXPORT_MEDIA_TYPES = {
+    ExportFormat.NDJSON: "application/x-ndjson",
+    ExportFormat.CSV: "text/csv; charset=utf-8",
+}
+
+
+@admin_router.get("/export", status_code=status.HTTP_200_OK)
+async def export(query: Annotated[ReservationExportQuery, Query()],
+                 admin: Principal = Depends(get_admin_member)):
+    filename = f"reservations.{query.format.value}"
+
+    return StreamingResponse(reservation_service.export(query),
+                             media_type=EXPORT_MEDIA_TYPES[query.format],
+                             headers={"Content-Disposition": f'attachment; filename="{filename}"'})
+
 
 @admin_router.get("/{member_id}", response_model=List[ReservationResponse], status_code=status.HTTP_200_OK)
-def get_by_member_id(member_id: int,
-                     db: Session = Depends(get_db),
-                     admin: Member = Depends(get_admin_member)) -> List[ReservationResponse]:
-    return reservation_service.get_all_by_member_id(db, member_id)
+async def get_by_member_id(member_id: int,
+                           db: AsyncSession = Depends(get_db),
+                           admin: Principal = Depends(get_admin_member)):
+    content = await reservation_service.get_all_json_by_member_id(db, member_id)
+
+    return Response(content=content, media_type="application/json")
 
 
 @admin_router.put("/", status_code=status.HTTP_200_OK)
-def update(reservation_update: ReservationUpdate,
-           db: Session = Depends(get_db),
-           admin: Member = Depends(get_admin_member)) -> ReservationResponse:
-    return reservation_service.update(db, admin, reservation_update)
+async def update(reservation_update: ReservationUpdate,
+                 db: AsyncSession = Depends(get_db),
+                 admin: Principal = Depends(get_admin_member)) -> ReservationResponse:
+    return await reservation_service.update(db, admin, reservation_update)
 
 
 @admin_router.delete("/", status_code=status.HTTP_204_NO_CONTENT)
-def delete(reservation_id: int,
-           db: Session = Depends(get_db),
-           admin: Member = Depends(get_admin_member)):
-    reservation_service.delete(db, admin, reservation_id)
+async def delete(reservation_id: int,
+                 db: AsyncSession = Depends(get_db),
+                 admin: Principal = Depends(get_admin_member)):
+    await reservation_service.delete(db, admin, reservation_id)
 
 
 @admin_router.put("/status", response_model=ReservationResponse, status_code=status.HTTP_200_OK)
-def update_status(reservation_update_status: ReservationUpdateStatus,
-                  db: Session = Depends(get_db),
-                  admin: Member = Depends(get_admin_member)) -> ReservationResponse:
-    return reservation_service.update_status(db, reservation_update_status)
+async def update_status(reservation_update_status: ReservationUpdateStatus,
+                        db: AsyncSession = Depends(get_db),
+                        admin: Principal = Depends(get_admin_member)) -> ReservationResponse:
+    return await reservation_service.update_status(db, reservation_update_status)
+
+
+@admin_router.put("/status/batch", response_model=ReservationStatusBatchResponse, status_code=status.HTTP_200_OK)
+async def update_status_batch(reservation_status_batch: ReservationStatusBatch,
+                              db: AsyncSession = Depends(get_db),
+                              admin: Principal = Depends(get_admin_member)):
+    content = await reservation_service.update_status_batch(db, reservation_status_batch)
+
+    return Response(content=content, media_type="application/json")
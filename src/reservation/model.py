@@ -1,6 +1,6 @@
 import enum
 
-from sqlalchemy import Column, Integer, ForeignKey, DateTime, Enum
+from sqlalchemy import Column, Integer, ForeignKey, DateTime, Enum, Index
 from sqlalchemy.sql import func
 
 from src.db.db import Base
@@ -14,11 +14,30 @@ class Status(enum.Enum):
 
 class Reservation(Base):
     __tablename__ = "reservation"
+    __mapper_args__ = {"eager_defaults": True}
+    __table_args__ = (
+        Index("ix_reservation_member_id_created_at", "member_id", "created_at",
+              postgresql_include=["id", "status", "people", "modified_at"]),
+        Index("ix_reservation_exam_id_id", "exam_id", "id"),
+        Index("ix_reservation_exam_id_pending", "exam_id", "created_at", "id",
+              postgresql_where="status = 'PENDING'"),
+    )
 
     id = Column(Integer, primary_key=True)
-    member_id = Column(Integer, ForeignKey("member.id"), index=True, nullable=False)
+    member_id = Column(Integer, ForeignKey("member.id"), nullable=False)
     exam_id = Column(Integer, ForeignKey("exam.id"), nullable=False)
     people = Column(Integer, nullable=False)
     status = Column(Enum(Status), default=Status.PENDING)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     modified_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+
+
+class AllocationWatermark(Base):
+    __tablename__ = "allocation_watermark"
+
+    exam_id = Column(Integer, ForeignKey("exam.id", ondelete="CASCADE"), primary_key=True)
+    reservation_created_at = Column(DateTime(timezone=True), nullable=False)
+    reservation_id = Column(Integer, nullable=False)
+    confirmed = Column(Integer, default=0, server_default="0", nullable=False)
+    denied = Column(Integer, default=0, server_default="0", nullable=False)
+    modified_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
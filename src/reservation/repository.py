@@ -1,31 +1,175 @@
-from typing import List
+from datetime import datetime, timedelta
+from typing import AsyncIterator, List, Optional, Tuple
 
-from sqlalchemy.orm import Session
+from sqlalchemy import Row, Select, func, or_, select, tuple_, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.reservation.model import Reservation
+from src.exam.model import Exam
+from src.member.model import Member
+from src.reservation.model import AllocationWatermark, Reservation, Status
+
+ID_CHUNK_SIZE = 5000
+ALLOCATION_LOCK_KEY = 0x67726570
 
 
 class ReservationRepository:
-    def find_by_member_id(self, db: Session, member_id: int) -> List[Reservation]:
-        return db.query(Reservation).filter(Reservation.member_id == member_id).all()
+    async def find_by_member_id(self, db: AsyncSession, member_id: int) -> List[Reservation]:
+        result = await db.scalars(
+            select(Reservation)
+            .where(Reservation.member_id == member_id)
+            .order_by(Reservation.created_at)
+        )
+        return list(result.all())
+
+    async def find_rows_by_member_id(self, db: AsyncSession, member_id: int) -> List[Row]:
+        result = await db.execute(
+            select(Reservation.id, Reservation.status, Reservation.people,
+                   Reservation.created_at, Reservation.modified_at)
+            .where(Reservation.member_id == member_id)
+            .order_by(Reservation.created_at)
+        )
+        return list(result.all())
+
+    def _export_statement(self, exam_id: Optional[int] = None,
+                          date_from: Optional[datetime] = None,
+                          date_to: Optional[datetime] = None,
+                          status: Optional[Status] = None) -> Select:
+        statement = (
+            select(Reservation.id, Reservation.exam_id, Exam.date.label("exam_date"), Reservation.member_id,
+                   Member.username, Reservation.people, Reservation.status, Reservation.created_at,
+                   Reservation.modified_at)
+            .join(Exam, Exam.id == Reservation.exam_id)
+            .join(Member, Member.id == Reservation.member_id)
+            .order_by(Exam.date, Reservation.exam_id, Reservation.id)
+        )
+
+        if exam_id is not None:
+            statement = statement.where(Reservation.exam_id == exam_id)
+        if date_from is not None:
+            statement = statement.where(Exam.date >= date_from)
+        if date_to is not None:
+            statement = statement.where(Exam.date < date_to)
+        if status is not None:
+            statement = statement.where(Reservation.status == status)
+
+        return statement
+
+    def export_columns(self) -> List[str]:
+        return list(self._export_statement().selected_columns.keys())
+
+    async def stream_export_rows(self, db: AsyncSession, yield_per: int, **filters) -> AsyncIterator[List[Row]]:
+        result = await db.stream(self._export_statement(**filters).execution_options(yield_per=yield_per))
+        async for rows in result.partitions():
+            yield rows
+
+    async def find_by_id(self, db: AsyncSession, id: int) -> Reservation | None:
+        return await db.scalar(select(Reservation).where(Reservation.id == id))
+
+    async def find_by_id_for_update(self, db: AsyncSession, id: int) -> Reservation | None:
+        statement = (
+            select(Reservation)
+            .where(Reservation.id == id)
+            .with_for_update()
+            .execution_options(populate_existing=True)
+        )
+        return await db.scalar(statement)
+
+    async def find_by_exam_id_and_member_id(self, db: AsyncSession, exam_id: int,
+                                            member_id: int) -> Reservation | None:
+        return await db.scalar(select(Reservation).where(Reservation.exam_id == exam_id,
+                                                         Reservation.member_id == member_id))
+
+    async def find_status_rows_for_update(self, db: AsyncSession, ids: List[int]) -> List[Row]:
+        ids = sorted(ids)
+        rows = []
+        for start in range(0, len(ids), ID_CHUNK_SIZE):
+            result = await db.execute(
+                select(Reservation.id, Reservation.exam_id, Reservation.people, Reservation.status)
+                .where(Reservation.id.in_(ids[start:start + ID_CHUNK_SIZE]))
+                .order_by(Reservation.id)
+                .with_for_update()
+            )
+            rows.extend(result.all())
+        return rows
+
+    async def update_statuses(self, db: AsyncSession, ids: List[int], status: Status) -> int:
+        updated = 0
+        for start in range(0, len(ids), ID_CHUNK_SIZE):
+            result = await db.execute(
+                update(Reservation)
+                .where(Reservation.id.in_(ids[start:start + ID_CHUNK_SIZE]))
+                .values(status=status)
+                .execution_options(synchronize_session=False)
+            )
+            updated += result.rowcount
+        return updated
+
+    async def find_exam_ids_with_pending(self, db: AsyncSession, settle: timedelta) -> List[int]:
+        result = await db.scalars(
+            select(Reservation.exam_id)
+            .outerjoin(AllocationWatermark, AllocationWatermark.exam_id == Reservation.exam_id)
+            .where(Reservation.status == Status.PENDING,
+                   Reservation.created_at <= func.now() - settle,
+                   or_(AllocationWatermark.exam_id.is_(None),
+                       tuple_(Reservation.created_at, Reservation.id)
+                       > tuple_(AllocationWatermark.reservation_created_at, AllocationWatermark.reservation_id)))
+            .distinct()
+        )
+        return list(result.all())
+
+    async def find_pending_rows_for_update(self, db: AsyncSession, exam_id: int, limit: int, settle: timedelta,
+                                           after: Optional[Tuple[datetime, int]] = None) -> List[Row]:
+        statement = (
+            select(Reservation.id, Reservation.exam_id, Reservation.people, Reservation.status, Reservation.created_at)
+            .where(Reservation.exam_id == exam_id,
+                   Reservation.status == Status.PENDING,
+                   Reservation.created_at <= func.now() - settle)
+            .order_by(Reservation.created_at, Reservation.id)
+            .limit(limit)
+            .with_for_update()
+        )
+        if after is not None:
+            statement = statement.where(tuple_(Reservation.created_at, Reservation.id) > tuple_(*after))
+
+        result = await db.execute(statement)
+        return list(result.all())
+
+    async def try_lock_allocation(self, db: AsyncSession, exam_id: int) -> bool:
+        return await db.scalar(select(func.pg_try_advisory_xact_lock(ALLOCATION_LOCK_KEY, exam_id)))
 
-    def find_by_id(self, db: Session, id: int) -> Reservation | None:
-        return db.query(Reservation).filter(Reservation.id == id).first()
+    async def find_watermark(self, db: AsyncSession, exam_id: int) -> AllocationWatermark | None:
+        return await db.scalar(select(AllocationWatermark).where(AllocationWatermark.exam_id == exam_id))
 
-    def find_by_exam_id_and_member_id(self, db: Session, exam_id: int,
-                                      member_id: int) -> Reservation | None:
-        return db.query(Reservation).filter(Reservation.exam_id == exam_id,
-                                            Reservation.member_id == member_id).first()
+    async def advance_watermark(self, db: AsyncSession, exam_id: int, reservation_created_at: datetime,
+                                reservation_id: int, confirmed: int, denied: int) -> None:
+        statement = insert(AllocationWatermark).values(
+            exam_id=exam_id,
+            reservation_created_at=reservation_created_at,
+            reservation_id=reservation_id,
+            confirmed=confirmed,
+            denied=denied,
+        )
+        statement = statement.on_conflict_do_update(
+            index_elements=[AllocationWatermark.exam_id],
+            set_={
+                "reservation_created_at": statement.excluded.reservation_created_at,
+                "reservation_id": statement.excluded.reservation_id,
+                "confirmed": AllocationWatermark.confirmed + statement.excluded.confirmed,
+                "denied": AllocationWatermark.denied + statement.excluded.denied,
+                "modified_at": func.now(),
+            },
+        )
+        await db.execute(statement)
 
-    def save(self, db: Session, reservationHistory: Reservation) -> Reservation:
+    async def save(self, db: AsyncSession, reservationHistory: Reservation) -> Reservation:
         db.add(reservationHistory)
-        db.commit()
-        db.refresh(reservationHistory)
+        await db.flush()
         
         return reservationHistory
 
-    def delete(self, db: Session, reservation: Reservation) -> bool:
-        db.delete(reservation)
-        db.commit()
+    async def delete(self, db: AsyncSession, reservation: Reservation) -> bool:
+        await db.delete(reservation)
+        await db.flush()
 
         return True
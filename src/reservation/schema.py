@@ -1,7 +1,10 @@
+import enum
 from datetime import datetime
+from typing import List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 
+from src.core.serialization.serialization import NaiveUtcDatetime
 from src.reservation.model import Status
 
 
@@ -21,6 +24,58 @@ class ReservationUpdateStatus(BaseModel):
     id: int
     status: Status
 
+    @model_validator(mode="after")
+    def reject_pending(self):
+        # The allocation worker never revisits rows behind its watermark, so a reservation moved back to
+        # PENDING would never be decided again.
+        if self.status == Status.PENDING:
+            raise ValueError("status cannot be changed back to PENDING")
+        return self
+
+
+class ReservationStatusBatch(BaseModel):
+    items: List[ReservationUpdateStatus] = Field(min_length=1, max_length=50000)
+
+
+class BatchResult(enum.Enum):
+    UPDATED = "UPDATED"
+    UNCHANGED = "UNCHANGED"
+    NOT_FOUND = "NOT_FOUND"
+    DUPLICATE = "DUPLICATE"
+    CAPACITY_EXCEEDED = "CAPACITY_EXCEEDED"
+
+
+class ReservationStatusBatchItem(BaseModel):
+    id: int
+    status: Status
+    result: BatchResult
+
+
+class ReservationStatusBatchResponse(BaseModel):
+    updated: int
+    unchanged: int
+    failed: int
+    results: List[ReservationStatusBatchItem]
+
+
+class ExportFormat(enum.Enum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+class ReservationExportQuery(BaseModel):
+    exam_id: Optional[int] = None
+    date_from: Optional[NaiveUtcDatetime] = None
+    date_to: Optional[NaiveUtcDatetime] = None
+    status: Optional[Status] = None
+    format: ExportFormat = ExportFormat.NDJSON
+
+    @model_validator(mode="after")
+    def require_filter(self):
+        if self.exam_id is None and self.date_from is None and self.date_to is None:
+            raise ValueError("exam_id or date_from/date_to is required")
+        return self
+
 
 class ReservationResponse(BaseModel):
     id: int
@@ -1,17 +1,29 @@
 import logging
+from collections import defaultdict
 from datetime import datetime, timedelta
-from typing import List
+from typing import AsyncIterator, List, Tuple
 
-from sqlalchemy.orm import Session
+from sqlalchemy import Row
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.auth.principal import Principal
+from src.core.metrics.metrics import reservation_events
+from src.core.serialization.serialization import dump_csv, dump_json, dump_ndjson, rows_to_dicts
+from src.db.db import open_db
+from src.db.transaction import after_commit, transactional
+from src.exam.exception import ExamCapacityExceededError
 from src.exam.model import Exam
 from src.exam.service import ExamService
-from src.member.model import Member
 from src.member.schema import Role
 from src.reservation.exception import ReservationNotFound, NotAllowed, ReservationValidationFailed
 from src.reservation.model import Reservation, Status
 from src.reservation.repository import ReservationRepository
-from src.reservation.schema import ReservationCreate, ReservationResponse, ReservationUpdateStatus, ReservationUpdate
+from src.reservation.schema import BatchResult, ExportFormat, ReservationCreate, ReservationExportQuery, \
+    ReservationResponse, ReservationStatusBatch, ReservationUpdateStatus, ReservationUpdate
+
+StatusChange = Tuple[int, Row, Status]
+
+EXPORT_CHUNK_SIZE = 1000
 
 logger = logging.getLogger(__name__)
 
@@ -28,16 +40,36 @@ class ReservationService:
         if exam.max_people - exam.current_people < people:
             raise ReservationValidationFailed()
 
-    def _validate_authorization(self, member: Member, reservation: Reservation):
+    def _validate_authorization(self, member: Principal, reservation: Reservation):
         if member.role.value != Role.ADMIN.value and member.id != reservation.member_id:
             raise NotAllowed()
 
-    def create(self, db: Session,
-               member: Member,
-               reservation_create: ReservationCreate) -> ReservationResponse:
-        exam = self.exam_service.get_by_id(db, reservation_create.exam_id)
+    async def _count(self, event: str, amount: int = 1) -> None:
+        if amount:
+            reservation_events.labels(event).inc(amount)
+
+    def _confirmed_people_delta(self, reservation: Reservation, status: Status) -> int:
+        was_confirmed = reservation.status == Status.CONFIRMED
+        is_confirmed = status == Status.CONFIRMED
+
+        if is_confirmed and not was_confirmed:
+            return reservation.people
+        if was_confirmed and not is_confirmed:
+            return -reservation.people
 
-        self._validate_reservation(exam, reservation_create.people)
+        return 0
+
+    @transactional
+    async def create(self, db: AsyncSession,
+                     member: Principal,
+                     reservation_create: ReservationCreate) -> ReservationResponse:
+        exam = await self.exam_service.get_by_id(db, reservation_create.exam_id)
+
+        try:
+            self._validate_reservation(exam, reservation_create.people)
+        except ReservationValidationFailed:
+            await self._count("validation_failed")
+            raise
 
         reservation = Reservation(
             exam_id=exam.id,
@@ -45,10 +77,13 @@ class ReservationService:
             people=reservation_create.people
         )
 
-        return self.repository.save(db, reservation)
+        saved_reservation = await self.repository.save(db, reservation)
+        await after_commit(db, self._count, "created")
 
-    def get_by_id(self, db: Session, member: Member, reservation_id: int) -> ReservationResponse:
-        reservation = self.repository.find_by_id(db, reservation_id)
+        return saved_reservation
+
+    async def get_by_id(self, db: AsyncSession, member: Principal, reservation_id: int) -> ReservationResponse:
+        reservation = await self.repository.find_by_id(db, reservation_id)
 
         if not reservation:
             raise ReservationNotFound({reservation_id})
@@ -57,20 +92,30 @@ class ReservationService:
 
         return ReservationResponse.model_validate(reservation)
 
-    def get_all(self, db: Session, member: Member) -> List[ReservationResponse]:
-        reservations = self.repository.find_by_member_id(db, member.id)
+    async def get_all_json_by_member_id(self, db: AsyncSession, member_id: int) -> bytes:
+        rows = await self.repository.find_rows_by_member_id(db, member_id)
+
+        return dump_json(rows_to_dicts(rows))
 
-        return [ReservationResponse.model_validate(reservation) for reservation in reservations]
+    async def export(self, query: ReservationExportQuery) -> AsyncIterator[bytes]:
+        filters = query.model_dump(exclude={"format"})
 
-    def get_all_by_member_id(self, db: Session, member_id: int, ) -> List[ReservationResponse]:
-        reservations = self.repository.find_by_member_id(db, member_id)
+        # Runs after the request's own session is closed, so the export holds its own connection while streaming.
+        async with open_db() as db:
+            if query.format == ExportFormat.CSV:
+                yield dump_csv([self.repository.export_columns()])
 
-        return [ReservationResponse.model_validate(reservation) for reservation in reservations]
+            async for rows in self.repository.stream_export_rows(db, EXPORT_CHUNK_SIZE, **filters):
+                if query.format == ExportFormat.CSV:
+                    yield dump_csv(rows)
+                else:
+                    yield dump_ndjson(rows_to_dicts(rows))
 
-    def update(self, db: Session,
-               member: Member,
-               reservation_update: ReservationUpdate) -> ReservationResponse:
-        reservation = self.repository.find_by_id(db, reservation_update.id)
+    @transactional
+    async def update(self, db: AsyncSession,
+                     member: Principal,
+                     reservation_update: ReservationUpdate) -> ReservationResponse:
+        reservation = await self.repository.find_by_id(db, reservation_update.id)
 
         if not reservation:
             raise ReservationNotFound({"id": reservation_update.id})
@@ -78,35 +123,152 @@ class ReservationService:
         self._validate_authorization(member, reservation)
 
         reservation.people = reservation_update.people
-        updated_reservation = self.repository.save(db, reservation)
+        updated_reservation = await self.repository.save(db, reservation)
 
         return ReservationResponse.model_validate(updated_reservation)
 
-    def update_status(self, db: Session,
-                      reservation_update_status: ReservationUpdateStatus) -> ReservationResponse | None:
-        reservation = self.repository.find_by_id(db, reservation_update_status.id)
+    @transactional
+    async def update_status(self, db: AsyncSession,
+                            reservation_update_status: ReservationUpdateStatus) -> ReservationResponse | None:
+        # Lock the reservation before the exam, as the batch and allocation paths do, so concurrent confirms of
+        # the same reservation see each other's status and move seats once.
+        reservation = await self.repository.find_by_id_for_update(db, reservation_update_status.id)
 
         if reservation is None:
             raise ReservationNotFound({"id": reservation_update_status.id})
 
+        people = self._confirmed_people_delta(reservation, reservation_update_status.status)
         reservation.status = reservation_update_status.status
 
-        if reservation_update_status.status == Status.CONFIRMED:
-            self.exam_service.update_people(db, reservation.exam_id, reservation.people)
+        if people:
+            try:
+                await self.exam_service.update_people(db, reservation.exam_id, people)
+            except ExamCapacityExceededError:
+                await self._count("capacity_exceeded")
+                raise
 
-        updated_reservation = self.repository.save(db, reservation)
+        updated_reservation = await self.repository.save(db, reservation)
+        await after_commit(db, self._count, reservation_update_status.status.value.lower())
 
         return ReservationResponse.model_validate(updated_reservation)
 
-    def delete(self, db: Session, member: Member, reservation_id: int) -> None:
-        reservation = self.repository.find_by_id(db, reservation_id)
+    @transactional
+    async def update_status_batch(self, db: AsyncSession, batch: ReservationStatusBatch) -> bytes:
+        results = [{"id": item.id, "status": item.status, "result": BatchResult.DUPLICATE} for item in batch.items]
+        requested = {}
+        for index, item in enumerate(batch.items):
+            requested.setdefault(item.id, index)
+
+        rows = {row.id: row for row in await self.repository.find_status_rows_for_update(db, list(requested))}
+
+        changes_by_exam: dict[int, List[StatusChange]] = defaultdict(list)
+        for reservation_id, index in requested.items():
+            row = rows.get(reservation_id)
+            status = batch.items[index].status
+
+            if row is None:
+                results[index]["result"] = BatchResult.NOT_FOUND
+            elif row.status == status:
+                results[index]["result"] = BatchResult.UNCHANGED
+            else:
+                results[index]["result"] = BatchResult.CAPACITY_EXCEEDED
+                changes_by_exam[row.exam_id].append((index, row, status))
+
+        ids_by_status: dict[Status, List[int]] = defaultdict(list)
+        for exam_id in sorted(changes_by_exam):
+            for index, row, status in await self._apply_exam_changes(db, exam_id, changes_by_exam[exam_id]):
+                results[index]["result"] = BatchResult.UPDATED
+                ids_by_status[status].append(row.id)
+
+        for status, ids in ids_by_status.items():
+            await self.repository.update_statuses(db, ids, status)
+
+        counts = defaultdict(int)
+        for result in results:
+            counts[result["result"]] += 1
+
+        await self._count("capacity_exceeded", counts[BatchResult.CAPACITY_EXCEEDED])
+        for status, ids in ids_by_status.items():
+            await after_commit(db, self._count, status.value.lower(), len(ids))
+
+        return dump_json({
+            "updated": counts[BatchResult.UPDATED],
+            "unchanged": counts[BatchResult.UNCHANGED],
+            "failed": len(results) - counts[BatchResult.UPDATED] - counts[BatchResult.UNCHANGED],
+            "results": results,
+        })
+
+    async def get_exam_ids_with_pending(self, db: AsyncSession, settle: timedelta) -> List[int]:
+        return await self.repository.find_exam_ids_with_pending(db, settle)
+
+    @transactional
+    async def allocate_pending(self, db: AsyncSession, exam_id: int, batch_size: int, settle: timedelta) -> int:
+        if not await self.repository.try_lock_allocation(db, exam_id):
+            return 0
+
+        # created_at is the creating transaction's start time, so only reservations older than `settle`
+        # are taken; anything newer may still be uncommitted and land behind the watermark.
+        watermark = await self.repository.find_watermark(db, exam_id)
+        after = (watermark.reservation_created_at, watermark.reservation_id) if watermark else None
+        rows = await self.repository.find_pending_rows_for_update(db, exam_id, batch_size, settle, after)
+        if not rows:
+            return 0
+
+        accepted = await self._apply_exam_changes(db, exam_id, [(index, row, Status.CONFIRMED)
+                                                                for index, row in enumerate(rows)])
+        confirmed_ids = [row.id for _, row, _ in accepted]
+        denied_ids = sorted({row.id for row in rows} - set(confirmed_ids))
+
+        if confirmed_ids:
+            await self.repository.update_statuses(db, confirmed_ids, Status.CONFIRMED)
+        if denied_ids:
+            await self.repository.update_statuses(db, denied_ids, Status.DENIED)
+
+        await self.repository.advance_watermark(db, exam_id, rows[-1].created_at, rows[-1].id,
+                                                len(confirmed_ids), len(denied_ids))
+        await after_commit(db, self._count, "confirmed", len(confirmed_ids))
+        await after_commit(db, self._count, "denied", len(denied_ids))
+
+        return len(rows)
+
+    async def _apply_exam_changes(self, db: AsyncSession, exam_id: int,
+                                  changes: List[StatusChange]) -> List[StatusChange]:
+        deltas = [self._confirmed_people_delta(row, status) for _, row, status in changes]
+        people = sum(deltas)
+
+        try:
+            if people:
+                await self.exam_service.update_people(db, exam_id, people)
+            return changes
+        except ExamCapacityExceededError:
+            pass
+
+        # Not everything fits: lock the exam's seats and confirm in request order while seats remain.
+        remaining = await self.exam_service.lock_remaining_seats(db, exam_id) - sum(d for d in deltas if d < 0)
+        accepted = []
+        for change, delta in zip(changes, deltas):
+            if delta > 0:
+                if delta > remaining:
+                    continue
+                remaining -= delta
+            accepted.append((change, delta))
+
+        people = sum(delta for _, delta in accepted)
+        if people:
+            await self.exam_service.update_people(db, exam_id, people)
+
+        return [change for change, _ in accepted]
+
+    @transactional
+    async def delete(self, db: AsyncSession, member: Principal, reservation_id: int) -> None:
+        reservation = await self.repository.find_by_id_for_update(db, reservation_id)
 
         if reservation is None:
             return ReservationNotFound({reservation_id})
 
         self._validate_authorization(member, reservation)
 
-        success = self.repository.delete(db, reservation)
+        success = await self.repository.delete(db, reservation)
 
         if success and reservation.status == Status.CONFIRMED:
-            self.exam_service.update_people(db, reservation.exam_id, -reservation.people)
+            await self.exam_service.update_people(db, reservation.exam_id, -reservation.people)
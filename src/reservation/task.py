@@ -0,0 +1,28 @@
+import asyncio
+import logging
+from datetime import timedelta
+
+from src.db.db import open_db
+from src.reservation.service import ReservationService
+
+logger = logging.getLogger(__name__)
+
+
+async def run_pending_allocation(interval: float, batch_size: int, settle_seconds: float) -> None:
+    reservation_service = ReservationService()
+    settle = timedelta(seconds=settle_seconds)
+
+    while True:
+        allocated = 0
+        try:
+            async with open_db() as db:
+                for exam_id in await reservation_service.get_exam_ids_with_pending(db, settle):
+                    try:
+                        allocated += await reservation_service.allocate_pending(db, exam_id, batch_size, settle)
+                    except Exception:
+                        logger.exception("Failed to allocate pending reservations for exam %s", exam_id)
+        except Exception:
+            logger.exception("Failed to allocate pending reservations")
+
+        if not allocated:
+            await asyncio.sleep(interval)
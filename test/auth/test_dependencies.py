@@ -0,0 +1,184 @@
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.auth import dependencies
+from src.auth.dependencies import get_current_member, get_admin_member
+from src.auth.principal import Principal
+from src.core.security.revocation import revocation_list
+from src.core.security.schema import TokenData
+from src.member.model import Member, Role
+
+
+@pytest.fixture
+def db_session():
+    return MagicMock(spec=AsyncSession)
+
+
+@pytest.fixture
+def token_data():
+    return TokenData(id=1, username="test_user", role="USER", iat=1000)
+
+
+def revocation(tokens_valid_after=None, revoked=False):
+    return SimpleNamespace(tokens_valid_after=tokens_valid_after, revoked=revoked)
+
+
+@pytest.fixture(autouse=True)
+def clear_revocation_list():
+    yield
+    revocation_list.clear()
+
+
+# 무상태 모드에서 토큰 클레임만으로 Principal 생성 테스트
+async def test_get_current_member_stateless(db_session, token_data):
+    # Given
+    with patch.object(dependencies, 'decode_token', return_value=token_data), \
+            patch.object(dependencies.settings, 'AUTH_STATELESS', True), \
+            patch.object(dependencies, 'member_repository', new_callable=AsyncMock) as member_repository:
+        member_repository.find_token_revocation.return_value = revocation()
+
+        # When
+        result = await get_current_member("token", db_session)
+
+    # Then
+    member_repository.find_by_id.assert_not_called()
+    assert isinstance(result, Principal)
+    assert result.id == 1
+    assert result.role == Role.USER
+
+
+# DB 조회 모드에서 회원 조회 테스트
+async def test_get_current_member_database(db_session, token_data):
+    # Given
+    mock_member = MagicMock(spec=Member)
+    mock_member.id = 1
+    mock_member.username = "test_user"
+    mock_member.role = Role.USER
+
+    with patch.object(dependencies, 'decode_token', return_value=token_data), \
+            patch.object(dependencies.settings, 'AUTH_STATELESS', False), \
+            patch.object(dependencies, 'member_repository', new_callable=AsyncMock) as member_repository:
+        member_repository.find_by_id.return_value = mock_member
+        member_repository.find_token_revocation.return_value = revocation()
+
+        # When
+        result = await get_current_member("token", db_session)
+
+    # Then
+    member_repository.find_by_id.assert_called_once_with(db_session, 1)
+    assert await result.load(db_session) == mock_member
+
+
+# 비밀번호 변경 이전에 발급된 토큰 인증 실패 테스트
+async def test_get_current_member_revoked(db_session, token_data):
+    # Given
+    with patch.object(dependencies, 'decode_token', return_value=token_data), \
+            patch.object(dependencies, 'member_repository', new_callable=AsyncMock) as member_repository:
+        member_repository.find_token_revocation.return_value = revocation(
+            tokens_valid_after=datetime.fromtimestamp(token_data.iat + 1, timezone.utc))
+
+        # When & Then
+        with pytest.raises(HTTPException) as exc_info:
+            await get_current_member("token", db_session)
+
+    assert exc_info.value.status_code == 401
+
+
+# 탈퇴한 회원의 토큰 인증 실패 테스트
+async def test_get_current_member_deleted(db_session, token_data):
+    # Given
+    with patch.object(dependencies, 'decode_token', return_value=token_data), \
+            patch.object(dependencies.settings, 'AUTH_STATELESS', True), \
+            patch.object(dependencies, 'member_repository', new_callable=AsyncMock) as member_repository:
+        member_repository.find_token_revocation.return_value = None
+
+        # When & Then
+        with pytest.raises(HTTPException) as exc_info:
+            await get_current_member("token", db_session)
+
+    assert exc_info.value.status_code == 401
+
+
+# 로그아웃한 토큰 인증 실패 테스트
+async def test_get_current_member_logged_out(db_session, token_data):
+    # Given
+    revocation_list.revoke_token("token", token_data.id)
+
+    with patch.object(dependencies, 'decode_token', return_value=token_data):
+        # When & Then
+        with pytest.raises(HTTPException) as exc_info:
+            await get_current_member("token", db_session)
+
+    assert exc_info.value.status_code == 401
+
+
+# 다른 프로세스에서 로그아웃한 토큰을 DB 에서 확인해 거부하는지 테스트
+async def test_get_current_member_logged_out_elsewhere(db_session, token_data):
+    # Given
+    with patch.object(dependencies, 'decode_token', return_value=token_data), \
+            patch.object(dependencies, 'member_repository', new_callable=AsyncMock) as member_repository:
+        member_repository.find_token_revocation.return_value = revocation(revoked=True)
+
+        # When
+        with pytest.raises(HTTPException) as exc_info:
+            await get_current_member("token", db_session)
+
+        # 두 번째 요청은 캐시된 결과로 거부
+        with pytest.raises(HTTPException):
+            await get_current_member("token", db_session)
+
+    # Then
+    assert exc_info.value.status_code == 401
+    member_repository.find_token_revocation.assert_awaited_once()
+
+
+# 폐기 시점 이후 발급된 토큰 인증 성공 테스트
+async def test_get_current_member_issued_after_revocation(db_session, token_data):
+    # Given
+    with patch.object(dependencies, 'decode_token', return_value=token_data), \
+            patch.object(dependencies.settings, 'AUTH_STATELESS', True), \
+            patch.object(dependencies, 'member_repository', new_callable=AsyncMock) as member_repository:
+        member_repository.find_token_revocation.return_value = revocation(
+            tokens_valid_after=datetime.fromtimestamp(token_data.iat, timezone.utc))
+
+        # When
+        result = await get_current_member("token", db_session)
+
+    # Then
+    assert result.id == token_data.id
+
+
+# 관리자 권한 검증 실패 테스트
+async def test_get_admin_member_forbidden():
+    # Given
+    principal = Principal(id=1, username="test_user", role=Role.USER)
+
+    # When & Then
+    with pytest.raises(HTTPException) as exc_info:
+        await get_admin_member(principal)
+
+    assert exc_info.value.status_code == 403
+
+
+# Principal 회원 지연 로딩 테스트
+async def test_principal_load_is_cached(db_session):
+    # Given
+    principal = Principal(id=1, username="test_user", role=Role.USER)
+    mock_member = MagicMock(spec=Member)
+
+    with patch('src.auth.principal.member_repository', new_callable=AsyncMock) as member_repository:
+        member_repository.find_by_id.return_value = mock_member
+        member_repository.find_token_revocation.return_value = revocation()
+
+        # When
+        first = await principal.load(db_session)
+        second = await principal.load(db_session)
+
+    # Then
+    member_repository.find_by_id.assert_called_once_with(db_session, 1)
+    assert first is second is mock_member
@@ -0,0 +1,18 @@
+from contextlib import contextmanager
+
+import pytest
+
+from src.db.query_stats import track_queries
+
+
+@pytest.fixture
+def max_queries():
+    @contextmanager
+    def assert_max_queries(limit: int):
+        with track_queries() as stats:
+            yield stats
+
+        statements = "\n".join(f"{count} x {statement}" for statement, count in stats.statements.items())
+        assert stats.count <= limit, f"{stats.count} queries executed, expected at most {limit}:\n{statements}"
+
+    return assert_max_queries
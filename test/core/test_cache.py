@@ -0,0 +1,82 @@
+from unittest.mock import patch
+
+import pytest
+
+from src.core.cache.cache import CacheBackend, InMemoryCacheBackend, NullCacheBackend, create_cache_backend
+
+
+@pytest.fixture
+def backend():
+    return InMemoryCacheBackend(max_entries=2)
+
+
+# 저장된 값 조회 및 적중/실패 집계 테스트
+async def test_get_and_set(backend):
+    # Given
+    await backend.set("key", b"value", ttl=60)
+
+    # When
+    hit = await backend.get("key")
+    miss = await backend.get("unknown")
+
+    # Then
+    assert hit == b"value"
+    assert miss is None
+    assert backend.stats()["hits"] == 1
+    assert backend.stats()["misses"] == 1
+
+
+# TTL 만료 테스트
+async def test_ttl_expired(backend):
+    # Given
+    with patch('src.core.cache.cache.time.monotonic', return_value=100.0):
+        await backend.set("key", b"value", ttl=5)
+
+    # When
+    with patch('src.core.cache.cache.time.monotonic', return_value=105.0):
+        result = await backend.get("key")
+
+    # Then
+    assert result is None
+    assert backend.stats()["entries"] == 0
+
+
+# LRU 정책에 따른 제거 테스트
+async def test_lru_eviction(backend):
+    # Given
+    await backend.set("first", b"1", ttl=60)
+    await backend.set("second", b"2", ttl=60)
+    await backend.get("first")
+
+    # When
+    await backend.set("third", b"3", ttl=60)
+
+    # Then
+    assert await backend.get("second") is None
+    assert await backend.get("first") == b"1"
+    assert backend.evictions == 1
+
+
+# 카운터는 LRU 제거 대상이 아님을 검증하는 테스트
+async def test_counter_not_evicted(backend):
+    # Given
+    await backend.incr("generation")
+
+    # When
+    for index in range(5):
+        await backend.set(f"key{index}", b"value", ttl=60)
+
+    # Then
+    assert await backend.get_counter("generation") == 1
+
+
+# 캐시 백엔드 생성 테스트
+def test_create_cache_backend():
+    assert isinstance(create_cache_backend("memory"), InMemoryCacheBackend)
+    assert isinstance(create_cache_backend("none"), NullCacheBackend)
+
+    with pytest.raises(ValueError):
+        create_cache_backend("unknown")
+
+    with pytest.raises(TypeError):
+        CacheBackend()
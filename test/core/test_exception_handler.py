@@ -0,0 +1,117 @@
+import logging
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from src.core.exception.exception_handler import DomainExceptionHandler, ErrorLogLimiter, \
+    register_exception_handlers
+from src.core.exception.global_exception_middleware import GlobalExceptionMiddleware
+from src.core.security.exception import PasswordHashingBusy, TokenValidationFailed
+from src.exam.exception import ExamCapacityExceededError, ExamValidationError
+
+
+@pytest.fixture
+def app():
+    app = FastAPI()
+    app.add_middleware(GlobalExceptionMiddleware)
+    register_exception_handlers(app)
+
+    @app.get("/full")
+    async def full():
+        raise ExamCapacityExceededError()
+
+    @app.get("/invalid")
+    async def invalid():
+        raise ExamValidationError("Invalid cursor")
+
+    @app.get("/busy")
+    async def busy():
+        raise PasswordHashingBusy()
+
+    @app.get("/token")
+    async def token():
+        raise TokenValidationFailed()
+
+    return app
+
+
+@pytest.fixture
+async def client(app):
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        yield client
+
+
+# 도메인 예외를 클래스별 상태 코드와 본문으로 변환하는지 테스트
+async def test_maps_service_exceptions(client):
+    # When
+    full = await client.get("/full")
+    invalid = await client.get("/invalid")
+
+    # Then
+    assert full.status_code == 400
+    assert full.json() == {"detail": {"message": "Exam capacity has been exceeded",
+                                      "error_code": "EXAM_CAPACITY_EXCEEDED"}}
+    assert invalid.json()["detail"]["message"] == "Invalid cursor"
+    assert "X-Request-ID" in full.headers
+
+
+# 예외에 정의된 응답 헤더와 보안 예외 변환 테스트
+async def test_maps_headers_and_security_exceptions(client):
+    # When
+    busy = await client.get("/busy")
+    token = await client.get("/token")
+
+    # Then
+    assert busy.status_code == 503
+    assert busy.headers["Retry-After"] == "1"
+    assert token.status_code == 401
+    assert token.json()["detail"]["error_code"] == "TOKEN_VALIDATION_FAILED"
+
+
+# 예상된 도메인 예외는 트레이스백 없이 간격당 한 번만 기록하는지 테스트
+async def test_rate_limits_domain_error_logs(client, caplog):
+    # When
+    with caplog.at_level(logging.INFO, logger="src.core.exception"):
+        for _ in range(5):
+            await client.get("/full")
+
+    # Then
+    records = [record for record in caplog.records if record.name == "src.core.exception.exception_handler"]
+    assert len(records) == 1
+    assert records[0].exc_info is None
+    assert not any(record.levelno >= logging.ERROR for record in caplog.records)
+
+
+# 억제된 로그 건수를 다음 기록에 포함하는지 테스트
+def test_log_limiter_reports_suppressed(monkeypatch):
+    # Given
+    now = [100.0]
+    monkeypatch.setattr("src.core.exception.exception_handler.time.monotonic", lambda: now[0])
+    limiter = ErrorLogLimiter(1.0)
+
+    # When
+    first = limiter.acquire("EXAM_CAPACITY_EXCEEDED")
+    suppressed = [limiter.acquire("EXAM_CAPACITY_EXCEEDED") for _ in range(3)]
+    now[0] += 1.0
+    next_log = limiter.acquire("EXAM_CAPACITY_EXCEEDED")
+
+    # Then
+    assert first == 0
+    assert suppressed == [None, None, None]
+    assert next_log == 3
+
+
+# 같은 클래스와 메시지의 응답을 한 번만 만드는지 테스트
+def test_reuses_rendered_response():
+    # Given
+    handler = DomainExceptionHandler(log_interval=1.0)
+
+    # When
+    first = handler._response(ExamCapacityExceededError())
+    second = handler._response(ExamCapacityExceededError())
+    other = handler._response(ExamValidationError("Exam is not in hot mode"))
+
+    # Then
+    assert first is second
+    assert other is not first
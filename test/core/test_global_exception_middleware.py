@@ -0,0 +1,58 @@
+import httpx
+import pytest
+from fastapi import FastAPI, Request
+
+from src.core.exception.global_exception_middleware import GlobalExceptionMiddleware
+
+
+@pytest.fixture
+def app():
+    app = FastAPI()
+    app.add_middleware(GlobalExceptionMiddleware)
+
+    @app.get("/ping")
+    async def ping(request: Request):
+        return {"request_id": request.state.request_id}
+
+    @app.get("/error")
+    async def error():
+        raise RuntimeError("boom")
+
+    return app
+
+
+@pytest.fixture
+async def client(app):
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        yield client
+
+
+# 요청 ID 와 처리 시간 헤더 추가 테스트
+async def test_adds_request_id_and_timing(client):
+    # When
+    response = await client.get("/ping")
+
+    # Then
+    assert response.status_code == 200
+    assert response.headers["X-Request-ID"] == response.json()["request_id"]
+    assert float(response.headers["X-Process-Time"]) >= 0
+
+
+# 클라이언트가 보낸 요청 ID 를 그대로 사용하는지 테스트
+async def test_propagates_incoming_request_id(client):
+    # When
+    response = await client.get("/ping", headers={"X-Request-ID": "abc-123"})
+
+    # Then
+    assert response.headers["X-Request-ID"] == "abc-123"
+
+
+# 처리되지 않은 예외를 500 JSON 으로 변환하는지 테스트
+async def test_unhandled_exception_returns_500(client):
+    # When
+    response = await client.get("/error")
+
+    # Then
+    assert response.status_code == 500
+    assert response.json() == {"error": "Internal Server Error", "detail": "An unexpected error occurred"}
+    assert "X-Request-ID" in response.headers
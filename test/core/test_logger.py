@@ -0,0 +1,79 @@
+import json
+import logging
+import queue
+
+import pytest
+
+from src.core.logger import logger as logger_module
+from src.core.logger.logger import (SAMPLED, JsonFormatter, NonBlockingQueueHandler, SamplingFilter, get_logger,
+                                    setup_logging, shutdown_logging)
+
+
+def make_record(level=logging.INFO, msg="hello %s", args=("world",), **extra) -> logging.LogRecord:
+    record = logging.LogRecord("test", level, __file__, 1, msg, args, None)
+    record.__dict__.update(extra)
+    return record
+
+
+@pytest.fixture
+def configured_logging():
+    shutdown_logging()
+    setup_logging()
+    yield
+    shutdown_logging()
+
+
+# JSON 포맷 출력 테스트
+def test_json_formatter_includes_extra_fields():
+    # Given
+    record = make_record(request_id="abc", **SAMPLED)
+
+    # When
+    entry = json.loads(JsonFormatter().format(record))
+
+    # Then
+    assert entry["message"] == "hello world"
+    assert entry["level"] == "INFO"
+    assert entry["logger"] == "test"
+    assert entry["request_id"] == "abc"
+    assert "sampled" not in entry
+
+
+# 표본 추출 대상 INFO 로그만 걸러내는지 테스트
+def test_sampling_filter_drops_only_sampled_info():
+    # Given
+    sampling_filter = SamplingFilter(rate=0)
+
+    # When & Then
+    assert sampling_filter.filter(make_record(**SAMPLED)) is False
+    assert sampling_filter.filter(make_record()) is True
+    assert sampling_filter.filter(make_record(level=logging.WARNING, **SAMPLED)) is True
+
+
+# 대기열이 가득 차면 블로킹 없이 버리는지 테스트
+def test_queue_handler_drops_when_full():
+    # Given
+    handler = NonBlockingQueueHandler(queue.Queue(maxsize=1))
+
+    # When
+    handler.handle(make_record())
+    handler.handle(make_record())
+
+    # Then
+    assert handler.stats() == {"queued": 1, "dropped": 1}
+    assert handler.queue.get_nowait().msg == "hello world"
+
+
+# 로깅 설정을 여러 번 호출해도 핸들러가 중복되지 않는지 테스트
+def test_setup_logging_is_idempotent(configured_logging):
+    # When
+    setup_logging()
+    get_logger("test")
+    get_logger("test")
+
+    # Then
+    queue_handlers = [handler for handler in logging.getLogger().handlers
+                      if isinstance(handler, NonBlockingQueueHandler)]
+    assert len(queue_handlers) == 1
+    assert logging.getLogger("test").handlers == []
+    assert logger_module.logging_stats()["configured"] is True
@@ -0,0 +1,111 @@
+import httpx
+import pytest
+from fastapi import FastAPI
+from prometheus_client import REGISTRY
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import QueuePool
+
+from src.core.metrics.metrics import MetricsMiddleware, _operation, instrument_pool, observe_query, render_metrics
+from src.db.query_stats import add_query_listener, instrument_engine
+
+
+def sample(name: str, **labels) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://", poolclass=QueuePool, pool_size=1)
+    instrument_engine(engine)
+    add_query_listener(observe_query)
+    instrument_pool("test", engine.pool, 1)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def app(engine):
+    app = FastAPI()
+    app.add_middleware(MetricsMiddleware)
+
+    @app.get("/metrics-test/items/{item_id}")
+    async def get_item(item_id: int):
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+        return {"id": item_id}
+
+    return app
+
+
+@pytest.fixture
+async def client(app):
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        yield client
+
+
+# 경로 템플릿 단위로 요청 지연 시간과 DB 시간을 집계하는지 테스트
+async def test_request_latency_by_route_template(client):
+    # Given
+    route = "/metrics-test/items/{item_id}"
+    before = sample("http_request_duration_seconds_count", method="GET", route=route, status="200")
+
+    # When
+    await client.get("/metrics-test/items/1")
+    await client.get("/metrics-test/items/2")
+
+    # Then
+    assert sample("http_request_duration_seconds_count", method="GET", route=route, status="200") == before + 2
+    assert sample("http_request_db_duration_seconds_sum", method="GET", route=route) > 0
+    assert sample("http_request_duration_seconds_count", method="GET", route="/metrics-test/items/1",
+                  status="200") == 0
+    assert sample("http_requests_in_flight") == 0
+
+
+# 매칭되지 않는 경로를 하나의 레이블로 묶는지 테스트
+async def test_unmatched_route_label(client):
+    # Given
+    before = sample("http_request_duration_seconds_count", method="GET", route="<unmatched>", status="404")
+
+    # When
+    await client.get("/metrics-test/unknown/123")
+
+    # Then
+    assert sample("http_request_duration_seconds_count", method="GET", route="<unmatched>", status="404") == before + 1
+
+
+# SQL 실행 시간과 커넥션 풀 상태 집계 테스트
+def test_query_and_pool_metrics(engine):
+    # Given
+    before = sample("db_query_duration_seconds_count", operation="SELECT")
+
+    # When
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+        checked_out = sample("db_pool_checked_out", pool="test")
+
+    # Then
+    assert sample("db_query_duration_seconds_count", operation="SELECT") == before + 1
+    assert checked_out == 1
+    assert sample("db_pool_checked_out", pool="test") == 0
+    assert sample("db_pool_connections", pool="test") == 1
+
+
+# SQL 첫 단어로 작업 종류를 분류하는지 테스트
+def test_query_operation_uses_first_word():
+    # When & Then
+    assert _operation("  select 1") == "SELECT"
+    assert _operation("WITH pending AS (SELECT 1) SELECT * FROM pending") == "WITH"
+    assert _operation("UPDATEX foo") == "OTHER"
+    assert _operation("SAVEPOINT sa_savepoint_1") == "OTHER"
+    assert _operation("") == "OTHER"
+
+
+# Prometheus 텍스트 형식 출력 테스트
+def test_render_metrics_text_format():
+    # When
+    content, media_type = render_metrics()
+
+    # Then
+    assert media_type.startswith("text/plain")
+    assert b"# TYPE http_request_duration_seconds histogram" in content
+    assert b"# TYPE reservation_events_total counter" in content
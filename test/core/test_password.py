@@ -0,0 +1,95 @@
+import asyncio
+import hashlib
+import threading
+
+import pytest
+
+from src.core.security.exception import PasswordHashingBusy
+from src.core.security.password import (LegacyPbkdf2Sha256Scheme, PasswordHasher, PasswordHashingPool,
+                                         Pbkdf2Sha256Scheme, ScryptScheme, hash_password)
+
+
+# 반복 횟수가 다른 해시도 저장된 비용으로 검증되는지 테스트
+def test_verify_password_with_stored_iterations():
+    # Given
+    hashed = Pbkdf2Sha256Scheme(iterations=1000).hash("test_password")
+    hasher = PasswordHasher([Pbkdf2Sha256Scheme(iterations=2000)], default="pbkdf2_sha256")
+
+    # When
+    result = hasher.verify(hashed, "test_password")
+
+    # Then
+    assert hashed.split("$")[1] == "1000"
+    assert result is True
+    assert hasher.verify(hashed, "wrong_password") is False
+    assert hasher.needs_rehash(hashed) is True
+    assert hasher.needs_rehash(hasher.hash("test_password")) is False
+
+
+# 여러 방식의 해시를 함께 검증하고 기본 방식이 아니면 재해싱 대상인지 테스트
+def test_hasher_supports_multiple_schemes():
+    # Given
+    pbkdf2 = Pbkdf2Sha256Scheme(iterations=1000)
+    scrypt = ScryptScheme(n=2 ** 10, r=8, p=1)
+    hasher = PasswordHasher([pbkdf2, scrypt, LegacyPbkdf2Sha256Scheme()], default="scrypt")
+    salt = bytes(32)
+    legacy = salt.hex() + ":" + hashlib.pbkdf2_hmac("sha256", b"test_password", salt, 100000).hex()
+
+    # When
+    hashed = hasher.hash("test_password")
+
+    # Then
+    assert hashed.startswith("scrypt$1024$8$1$")
+    assert hasher.verify(hashed, "test_password") is True
+    assert hasher.verify(pbkdf2.hash("test_password"), "test_password") is True
+    assert hasher.verify(legacy, "test_password") is True
+    assert hasher.verify(hashed, "wrong_password") is False
+    assert hasher.needs_rehash(hashed) is False
+    assert hasher.needs_rehash(pbkdf2.hash("test_password")) is True
+    assert hasher.needs_rehash(legacy) is True
+
+
+# 알 수 없거나 손상된 해시는 검증에 실패하는지 테스트
+def test_verify_unknown_or_malformed_hash():
+    # Given
+    hasher = PasswordHasher([Pbkdf2Sha256Scheme(iterations=1000)], default="pbkdf2_sha256")
+
+    # When & Then
+    assert hasher.verify("bcrypt$12$abc", "test_password") is False
+    assert hasher.verify("pbkdf2_sha256$1000$zz$zz", "test_password") is False
+    assert hasher.verify("salt:hash", "test_password") is False
+
+
+# 검증 전용이거나 알 수 없는 방식은 기본 방식으로 쓸 수 없는지 테스트
+def test_hasher_rejects_default_that_cannot_hash():
+    # When & Then
+    with pytest.raises(ValueError):
+        PasswordHasher([Pbkdf2Sha256Scheme(iterations=1000), LegacyPbkdf2Sha256Scheme()], default="legacy")
+
+    with pytest.raises(ValueError):
+        PasswordHasher([Pbkdf2Sha256Scheme(iterations=1000)], default="bcrypt")
+
+
+# 대기열이 가득 차면 즉시 거절하는지 테스트
+async def test_pool_rejects_when_queue_is_full():
+    # Given
+    pool = PasswordHashingPool(workers=1, queue_size=1)
+    release = threading.Event()
+    blocked = [asyncio.create_task(pool.run(release.wait)) for _ in range(2)]
+    await asyncio.sleep(0.05)
+
+    # When
+    with pytest.raises(PasswordHashingBusy):
+        await pool.run(hash_password, "test_password")
+
+    # Then
+    stats = pool.stats()
+    assert stats["in_flight"] == 2
+    assert stats["running"] == 1
+    assert stats["queued"] == 1
+    assert stats["rejected"] == 1
+
+    release.set()
+    await asyncio.gather(*blocked)
+    assert pool.stats()["completed"] == 2
+    assert pool.stats()["in_flight"] == 0
@@ -0,0 +1,118 @@
+import time
+from datetime import timedelta
+
+import pytest
+
+from src.core.security import security
+from src.core.security.revocation import TokenRevocationList
+from src.core.security.schema import TokenData
+from src.core.security.token_cache import TokenCache
+
+
+def make_token_data(member_id: int = 1, exp: float = None) -> TokenData:
+    return TokenData(id=member_id, username="test_user", role="USER", iat=1000,
+                     exp=int(exp if exp is not None else time.time() + 60))
+
+
+@pytest.fixture
+def token_cache():
+    return TokenCache(max_entries=2)
+
+
+# 캐시 적중/미스 집계 테스트
+def test_get_and_set(token_cache):
+    # Given
+    token_data = make_token_data()
+
+    # When
+    missed = token_cache.get("token")
+    token_cache.set("token", token_data)
+    hit = token_cache.get("token")
+
+    # Then
+    assert missed is None
+    assert hit == token_data
+    assert token_cache.stats()["hits"] == 1
+    assert token_cache.stats()["misses"] == 1
+
+
+# 만료된 토큰은 캐시에서 제거되는지 테스트
+def test_expired_token_is_dropped(token_cache):
+    # Given
+    token_cache.set("token", make_token_data(exp=time.time() - 1))
+
+    # When
+    result = token_cache.get("token")
+
+    # Then
+    assert result is None
+    assert token_cache.stats()["entries"] == 0
+
+
+# 최대 개수 초과 시 가장 오래 사용하지 않은 토큰 제거 테스트
+def test_lru_eviction(token_cache):
+    # Given
+    token_cache.set("first", make_token_data(1))
+    token_cache.set("second", make_token_data(2))
+    token_cache.get("first")
+
+    # When
+    token_cache.set("third", make_token_data(3))
+
+    # Then
+    assert token_cache.get("second") is None
+    assert token_cache.get("first") is not None
+    assert token_cache.stats()["evictions"] == 1
+
+
+# 로그아웃/회원 토큰 폐기 시 캐시에서 제거되는지 테스트
+def test_revocation_evicts_cached_tokens(token_cache):
+    # Given
+    revocation_list = TokenRevocationList(token_cache, ttl=5, max_entries=10)
+    token_cache.set("logout", make_token_data(1))
+    token_cache.set("member", make_token_data(2))
+    revocation_list.cache_revoked("member", 2, False)
+
+    # When
+    revocation_list.revoke_token("logout", 1)
+    revocation_list.revoke_member(2)
+
+    # Then
+    assert revocation_list.cached_revoked("logout") is True
+    assert revocation_list.cached_revoked("member") is None
+    assert token_cache.stats()["entries"] == 0
+
+
+# 폐기되지 않은 토큰 조회 결과는 TTL 동안만 캐시되는지 테스트
+def test_revocation_check_expires(token_cache):
+    # Given
+    revocation_list = TokenRevocationList(token_cache, ttl=0.01, max_entries=10)
+    revocation_list.cache_revoked("active", 1, False)
+    revocation_list.cache_revoked("logout", 1, True)
+
+    # When
+    cached = revocation_list.cached_revoked("active")
+    time.sleep(0.02)
+
+    # Then
+    assert cached is False
+    assert revocation_list.cached_revoked("active") is None
+    assert revocation_list.cached_revoked("logout") is True
+
+
+# decode_token 이 검증된 토큰을 캐시에서 재사용하는지 테스트
+def test_decode_token_uses_cache(monkeypatch, token_cache):
+    # Given
+    monkeypatch.setattr(security, "token_cache", token_cache)
+    monkeypatch.setattr(security, "SECRET_KEY", "test")
+    token = security.create_access_token({"id": 1, "username": "test_user", "role": "USER"},
+                                         expires_delta=timedelta(minutes=5))
+
+    # When
+    first = security.decode_token(token)
+    second = security.decode_token(token)
+
+    # Then
+    assert first is second
+    assert first.exp is not None
+    assert token_cache.stats()["hits"] == 1
@@ -0,0 +1,119 @@
+import threading
+
+import httpx
+import orjson
+import pytest
+from fastapi import FastAPI, Form, Request
+
+from src.core.security.security import create_access_token
+from src.core.traffic.recorder import JsonlWriter, TrafficRecorderMiddleware, prepare_entry, redact_body
+
+
+@pytest.fixture
+def writer(tmp_path):
+    writer = JsonlWriter(str(tmp_path / "traffic.jsonl"), queue_size=100, prepare=prepare_entry)
+    yield writer
+    writer.close()
+
+
+@pytest.fixture
+async def client(writer):
+    app = FastAPI()
+    app.add_middleware(TrafficRecorderMiddleware, writer=writer, max_body_bytes=1024)
+
+    @app.post("/items/{item_id}")
+    async def create(item_id: int, request: Request):
+        return await request.json()
+
+    @app.post("/login")
+    async def login(username: str = Form(), password: str = Form()):
+        return {"username": username}
+
+    @app.get("/internal/stats")
+    async def stats():
+        return {}
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        yield client
+
+
+def recorded(writer: JsonlWriter) -> list[dict]:
+    writer.close()
+    with open(writer.path, "rb") as file:
+        return [orjson.loads(line) for line in file]
+
+
+# 요청 경로, 본문, 인증 주체, 응답 시간 기록 테스트
+async def test_records_request(client, writer):
+    # Given
+    token = create_access_token({"id": 7, "username": "kim", "role": "USER"})
+
+    # When
+    await client.post("/items/3?dry=1", json={"name": "pen", "password": "secret"},
+                      headers={"Authorization": f"Bearer {token}"})
+
+    # Then
+    [entry] = recorded(writer)
+    assert (entry["method"], entry["path"], entry["route"], entry["query"]) == ("POST", "/items/3", "/items/{item_id}",
+                                                                              "dry=1")
+    assert entry["status"] == 200
+    assert entry["duration_ms"] >= 0
+    assert entry["principal"] == {"id": 7, "username": "kim", "role": "USER"}
+    assert orjson.loads(entry["body"]) == {"name": "pen", "password": "<redacted>"}
+
+
+# 폼 로그인 비밀번호 가림 및 내부 경로 제외 테스트
+async def test_redacts_form_password_and_skips_internal(client, writer):
+    # When
+    await client.post("/login", data={"username": "kim", "password": "secret"})
+    await client.get("/internal/stats")
+
+    # Then
+    [entry] = recorded(writer)
+    assert entry["body"] == "username=kim&password=%3Credacted%3E"
+    assert entry["principal"] is None
+
+
+# 본문 크기 제한 초과 시 본문 없이 기록 테스트
+async def test_truncated_body_is_not_recorded(client, writer):
+    # When
+    await client.post("/items/1", json={"name": "x" * 2000})
+
+    # Then
+    [entry] = recorded(writer)
+    assert entry["body_truncated"] is True
+    assert "body" not in entry
+
+
+# 대기열이 가득 차면 기록을 버리는지 테스트
+def test_writer_drops_when_full(tmp_path):
+    # Given
+    taken, release = threading.Event(), threading.Event()
+
+    def slow_prepare(entry):
+        taken.set()
+        release.wait(5)
+        return entry
+
+    writer = JsonlWriter(str(tmp_path / "traffic.jsonl"), queue_size=1, prepare=slow_prepare)
+    writer.write({"n": 1})
+    taken.wait(5)
+
+    # When
+    writer.write({"n": 2})
+    writer.write({"n": 3})
+    release.set()
+
+    # Then
+    assert [entry["n"] for entry in recorded(writer)] == [1, 2]
+    assert writer.dropped == 1
+
+
+# 비밀번호 필드가 없는 본문은 그대로 두는지 테스트
+def test_redact_body_keeps_other_bodies():
+    # Given
+    body = b'{"exam_id": 1}'
+
+    # When & Then
+    assert redact_body(body, "application/json") is body
+    assert redact_body(b"not json", "application/json") == b"not json"
@@ -0,0 +1,99 @@
+import os
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import create_engine, delete, or_, select
+from sqlalchemy.orm import Session
+
+from src.db.query_stats import instrument_engine
+from src.exam.model import Exam
+from src.member.model import Member, Role
+from src.reservation.model import Reservation
+
+DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+
+
+@pytest.fixture(scope="session")
+def engine():
+    if not DATABASE_URL:
+        pytest.skip("TEST_DATABASE_URL is not set")
+
+    config = Config("alembic.ini")
+    config.set_main_option("sqlalchemy.url", DATABASE_URL)
+    config.attributes["configure_logger"] = False
+    command.upgrade(config, "head")
+
+    engine = create_engine(DATABASE_URL)
+    instrument_engine(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def create_member(engine):
+    member_ids = []
+
+    def create(role: Role = Role.USER) -> Member:
+        with Session(engine, expire_on_commit=False) as session:
+            member = Member(username=f"{uuid.uuid4().hex[:8]}-{role.value.lower()}", password="x", role=role)
+            session.add(member)
+            session.commit()
+
+        member_ids.append(member.id)
+        return member
+
+    yield create
+
+    # Exam seat shards, allocation watermarks and revoked tokens cascade from their exam or member rows.
+    with Session(engine) as session:
+        exam_ids = select(Exam.id).where(Exam.member_id.in_(member_ids))
+        session.execute(delete(Reservation).where(or_(Reservation.member_id.in_(member_ids),
+                                                      Reservation.exam_id.in_(exam_ids))))
+        session.execute(delete(Exam).where(Exam.member_id.in_(member_ids)))
+        session.execute(delete(Member).where(Member.id.in_(member_ids)))
+        session.commit()
+
+
+@pytest.fixture
+def create_exam(engine, create_member):
+    def create(member: Member = None, **values) -> Exam:
+        member = member or create_member()
+        values = {"date": datetime.now() + timedelta(days=30), "description": "test", "current_people": 0,
+                  "max_people": 100, **values}
+        with Session(engine, expire_on_commit=False) as session:
+            exam = Exam(member_id=member.id, **values)
+            session.add(exam)
+            session.commit()
+
+        return exam
+
+    return create
+
+
+@pytest.fixture
+def create_reservations(engine):
+    def create(exam: Exam, count: int = 1, member: Member = None, **values) -> list[Reservation]:
+        member_id = member.id if member else exam.member_id
+        with Session(engine, expire_on_commit=False) as session:
+            reservations = [Reservation(exam_id=exam.id, member_id=member_id, **{"people": 1, **values})
+                            for _ in range(count)]
+            session.add_all(reservations)
+            session.commit()
+
+        return reservations
+
+    return create
+
+
+@pytest.fixture
+def auth_headers():
+    from src.core.security.security import create_access_token
+
+    def headers(member: Member) -> dict:
+        token = create_access_token({"id": member.id, "username": member.username, "role": member.role.value})
+        return {"Authorization": f"Bearer {token}"}
+
+    return headers
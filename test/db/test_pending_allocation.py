@@ -0,0 +1,41 @@
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy.orm import Session
+
+from src.db.db import ThreadedSession
+from src.reservation.model import AllocationWatermark, Status
+from src.reservation.repository import ReservationRepository
+
+
+@pytest.fixture
+def exam(create_exam):
+    return create_exam(description="allocation")
+
+
+async def exam_ids_with_pending(engine) -> list[int]:
+    db = ThreadedSession(Session(engine, autoflush=False, expire_on_commit=False))
+    try:
+        return await ReservationRepository().find_exam_ids_with_pending(db, timedelta(seconds=1))
+    finally:
+        await db.close()
+
+
+# 워터마크 이전의 대기 예약만 남은 시험은 할당 대상에서 제외되는지 테스트
+async def test_pending_behind_watermark_is_not_selected(engine, exam, create_reservations):
+    # Given
+    created_at = datetime.now().astimezone() - timedelta(minutes=10)
+    reservation, = create_reservations(exam, status=Status.PENDING, created_at=created_at)
+    with Session(engine) as session:
+        session.add(AllocationWatermark(exam_id=exam.id, reservation_created_at=created_at,
+                                        reservation_id=reservation.id))
+        session.commit()
+
+    # When
+    before = await exam_ids_with_pending(engine)
+    create_reservations(exam, status=Status.PENDING, created_at=created_at + timedelta(minutes=1))
+    after = await exam_ids_with_pending(engine)
+
+    # Then
+    assert exam.id not in before
+    assert exam.id in after
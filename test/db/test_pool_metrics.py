@@ -0,0 +1,57 @@
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import QueuePool
+
+from src.db.pool_metrics import PoolMetrics, instrumented_pool_class
+
+
+@pytest.fixture
+def metrics():
+    return PoolMetrics()
+
+
+@pytest.fixture
+def engine(metrics):
+    engine = create_engine("sqlite://", poolclass=instrumented_pool_class(QueuePool, metrics),
+                           pool_size=1, max_overflow=1, pool_timeout=0.01)
+    metrics.attach(engine.pool)
+    yield engine
+    engine.dispose()
+
+
+# 체크아웃/체크인 및 오버플로 집계 테스트
+def test_checkout_and_overflow(engine, metrics):
+    # Given
+    first = engine.connect()
+    second = engine.connect()
+
+    # When
+    snapshot = metrics.snapshot(engine.pool)
+
+    # Then
+    assert snapshot["checkouts"] == 2
+    assert snapshot["checked_out"] == 2
+    assert snapshot["overflow_checkouts"] == 1
+    assert snapshot["wait_count"] == 2
+
+    first.close()
+    second.close()
+
+    assert metrics.snapshot(engine.pool)["checkins"] == 2
+
+
+# 풀 고갈 시 타임아웃 집계 테스트
+def test_pool_timeout(engine, metrics):
+    # Given
+    connections = [engine.connect(), engine.connect()]
+
+    # When & Then
+    with pytest.raises(PoolTimeoutError):
+        engine.connect()
+
+    assert metrics.timeouts == 1
+    assert metrics.wait_seconds_max >= 0.01
+
+    for connection in connections:
+        connection.close()
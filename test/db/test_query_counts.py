@@ -0,0 +1,82 @@
+import httpx
+import pytest
+from sqlalchemy.orm import Session
+
+from src.db.db import ThreadedSession, get_db
+from src.exam.cache import exam_cache
+from src.member.model import Role
+
+
+@pytest.fixture
+def seed(create_member, create_exam, create_reservations):
+    admin = create_member(Role.ADMIN)
+    user = create_member(Role.USER)
+    exam = create_exam(admin, max_people=1000)
+    reservations = create_reservations(exam, 20, user)
+
+    return {"admin": admin, "user": user, "exam": exam, "reservations": reservations}
+
+
+@pytest.fixture
+async def client(engine, auth_headers):
+    from main import app
+
+    async def get_test_db():
+        db = ThreadedSession(Session(engine, autoflush=False, expire_on_commit=False))
+        try:
+            yield db
+        finally:
+            await db.close()
+
+    app.dependency_overrides[get_db] = get_test_db
+    await exam_cache.invalidate()
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        # Every request below uses a fresh token, so each count includes one logout denylist lookup.
+        client.auth_headers = auth_headers
+        yield client
+    app.dependency_overrides.pop(get_db)
+
+
+# 시험 상세 조회 쿼리 수 테스트
+async def test_get_exam_queries(client, seed, max_queries):
+    # When
+    with max_queries(1):
+        response = await client.get(f"/exams/{seed['exam'].id}")
+
+    # Then
+    assert response.status_code == 200
+
+
+# 예약 생성 쿼리 수 테스트
+async def test_create_reservation_queries(client, seed, max_queries):
+    # When
+    with max_queries(3):
+        response = await client.post("/reservation/", headers=client.auth_headers(seed["user"]),
+                                     json={"exam_id": seed["exam"].id, "people": 1})
+
+    # Then
+    assert response.status_code == 201
+
+
+# 예약 확정 쿼리 수 테스트
+async def test_confirm_reservation_queries(client, seed, max_queries):
+    # When
+    with max_queries(4):
+        response = await client.put("/admin/reservation/status", headers=client.auth_headers(seed["admin"]),
+                                    json={"id": seed["reservations"][0].id, "status": "CONFIRMED"})
+
+    # Then
+    assert response.status_code == 200
+
+
+# 일괄 확정 쿼리 수가 항목 수와 무관한지 테스트
+async def test_confirm_batch_queries_do_not_grow_with_items(client, seed, max_queries):
+    # When
+    with max_queries(4):
+        response = await client.put("/admin/reservation/status/batch", headers=client.auth_headers(seed["admin"]),
+                                    json={"items": [{"id": reservation.id, "status": "CONFIRMED"}
+                                                    for reservation in seed["reservations"]]})
+
+    # Then
+    assert response.status_code == 200
+    assert response.json()["updated"] == 20
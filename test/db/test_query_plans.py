@@ -0,0 +1,127 @@
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.exam.repository import ExamRepository
+from src.reservation.repository import ReservationRepository
+
+
+@pytest.fixture(scope="module")
+def connection(engine):
+    with engine.connect() as connection:
+        connection.exec_driver_sql("SET enable_seqscan = off")
+        connection.exec_driver_sql("SET enable_bitmapscan = off")
+        yield connection
+
+
+def explain(connection, statement) -> str:
+    compiled = statement.compile(dialect=connection.dialect)
+    processors = compiled._bind_processors
+    params = {
+        key: processors[key](value) if key in processors else value
+        for key, value in compiled.construct_params().items()
+    }
+    result = connection.exec_driver_sql("EXPLAIN " + str(compiled), params)
+    return "\n".join(row[0] for row in result)
+
+
+async def captured(method, *args, **kwargs):
+    db = MagicMock()
+    db.execute = AsyncMock(return_value=MagicMock())
+    db.scalars = AsyncMock(return_value=MagicMock())
+    await method(db, *args, **kwargs)
+    call = db.execute.call_args or db.scalars.call_args
+    return call.args[0]
+
+
+# 시험 목록 키셋 페이지네이션 인덱스 사용 테스트
+async def test_exam_page_uses_date_id_index(connection):
+    # Given
+    statement = await captured(ExamRepository().find_page_rows, 50, after=(datetime(2026, 1, 1), 1))
+
+    # When
+    plan = explain(connection, statement)
+
+    # Then
+    assert "ix_exam_date_id" in plan
+    assert "Sort" not in plan
+
+
+# 회원별 시험 조회 인덱스 사용 테스트
+async def test_exam_by_member_uses_member_index(connection):
+    # Given
+    statement = await captured(ExamRepository().find_by_member_id, 1)
+
+    # When
+    plan = explain(connection, statement)
+
+    # Then
+    assert "ix_exam_member_id" in plan
+
+
+# 핫 모드 시험 조회 부분 인덱스 사용 테스트
+async def test_hot_exams_use_partial_index(connection):
+    # Given
+    statement = await captured(ExamRepository().find_hot_shards)
+
+    # When
+    plan = explain(connection, statement)
+
+    # Then
+    assert "ix_exam_hot" in plan
+
+
+# 회원별 예약 목록 커버링 인덱스 사용 테스트
+async def test_reservation_rows_by_member_use_covering_index(connection):
+    # Given
+    statement = await captured(ReservationRepository().find_rows_by_member_id, 1)
+
+    # When
+    plan = explain(connection, statement)
+
+    # Then
+    assert "Index Only Scan using ix_reservation_member_id_created_at" in plan
+    assert "Sort" not in plan
+
+
+# 시험별 대기 예약 선착순 조회 부분 인덱스 사용 테스트
+async def test_pending_by_exam_uses_partial_index(connection):
+    # Given
+    statement = await captured(ReservationRepository().find_pending_rows_for_update, 1, 500, timedelta(seconds=1),
+                               after=(datetime(2026, 1, 1), 1))
+
+    # When
+    plan = explain(connection, statement)
+
+    # Then
+    assert "ix_reservation_exam_id_pending" in plan
+    assert "Sort" not in plan
+
+
+# 시험별 예약 내보내기 인덱스 사용 테스트
+async def test_export_by_exam_uses_exam_id_index(connection):
+    # Given
+    savepoint = connection.begin_nested()
+    member_id = connection.exec_driver_sql(
+        "INSERT INTO member (username, password, role) VALUES ('plan_export', 'x', 'USER') RETURNING id"
+    ).scalar_one()
+    exam_ids = connection.exec_driver_sql(
+        "INSERT INTO exam (member_id, description, date, current_people, max_people) "
+        "SELECT %(member_id)s, 'plan export', now() + n * interval '1 day', 0, 50000 "
+        "FROM generate_series(1, 50) AS n RETURNING id", {"member_id": member_id}
+    ).scalars().all()
+    connection.exec_driver_sql(
+        "INSERT INTO reservation (member_id, exam_id, people, status) "
+        "SELECT %(member_id)s, (%(exam_ids)s::int[])[1 + n %% 50], 1, 'PENDING' FROM generate_series(1, 20000) AS n",
+        {"member_id": member_id, "exam_ids": exam_ids}
+    )
+    connection.exec_driver_sql("ANALYZE member, exam, reservation")
+    statement = ReservationRepository()._export_statement(exam_id=exam_ids[0])
+
+    # When
+    plan = explain(connection, statement)
+    savepoint.rollback()
+
+    # Then
+    assert "ix_reservation_exam_id_id" in plan
@@ -0,0 +1,104 @@
+import logging
+import time
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import StaticPool
+
+from src.db.query_stats import QueryStatsMiddleware, instrument_engine, parameter_shape, track_queries
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+    instrument_engine(engine, slow_query_seconds=0.05)
+    engine.connect().close()
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def app(engine):
+    app = FastAPI()
+    app.add_middleware(QueryStatsMiddleware, headers=True, repeated_query_threshold=3)
+
+    @app.get("/items/{count}")
+    async def get_items(count: int):
+        with engine.connect() as connection:
+            for item_id in range(count):
+                connection.execute(text("SELECT :id"), {"id": item_id})
+        return {"count": count}
+
+    return app
+
+
+@pytest.fixture
+async def client(app):
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        yield client
+
+
+# 요청 단위 쿼리 수와 DB 시간을 응답 헤더로 노출하는지 테스트
+async def test_query_headers(client):
+    # When
+    response = await client.get("/items/2")
+
+    # Then
+    assert response.headers["X-DB-Query-Count"] == "2"
+    assert float(response.headers["X-DB-Query-Time"]) > 0
+
+
+# 같은 쿼리가 반복 실행되면 N+1 경고를 남기는지 테스트
+async def test_repeated_statement_warning(client, caplog):
+    # When
+    with caplog.at_level(logging.WARNING, logger="src.db.query_stats"):
+        await client.get("/items/1")
+        await client.get("/items/3")
+
+    # Then
+    warnings = [record for record in caplog.records if "N+1" in record.getMessage()]
+    assert len(warnings) == 1
+    assert warnings[0].repeated == 3
+    assert "GET /items/{count}" in warnings[0].getMessage()
+
+
+# 중첩된 추적 범위가 바깥 집계를 공유하는지 테스트
+def test_nested_tracking_shares_stats(engine):
+    # When
+    with track_queries() as outer:
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+            with track_queries("abc") as inner:
+                connection.execute(text("SELECT 2"))
+
+    # Then
+    assert inner is outer
+    assert outer.count == 2
+    assert outer.request_id == "abc"
+
+
+# 느린 쿼리를 값 대신 파라미터 형태와 함께 기록하는지 테스트
+def test_slow_query_logs_parameter_shape(engine, caplog):
+    # Given
+    with engine.connect() as connection:
+        connection.connection.dbapi_connection.create_function("sleep_ms", 1, lambda ms: time.sleep(ms / 1000))
+
+        # When
+        with caplog.at_level(logging.WARNING, logger="src.db.query_stats"):
+            connection.execute(text("SELECT sleep_ms(:ms), :secret"), {"ms": 60, "secret": "hunter2"})
+
+    # Then
+    [record] = [record for record in caplog.records if record.getMessage().startswith("Slow query")]
+    assert record.parameters == ["int", "str"]
+    assert "hunter2" not in record.getMessage()
+
+
+# executemany 파라미터 형태 요약 테스트
+def test_parameter_shape_executemany():
+    # When
+    shape = parameter_shape([{"id": 1, "name": "a"}, {"id": 2, "name": "b"}], executemany=True)
+
+    # Then
+    assert shape == {"rows": 2, "row": {"id": "int", "name": "str"}}
@@ -0,0 +1,127 @@
+import asyncio
+
+import pytest
+from sqlalchemy import event, func, select
+from sqlalchemy.orm import Session
+
+from src.db.db import ThreadedSession
+from src.exam.model import Exam, ExamSeatShard
+from src.exam.service import ExamService, hot_exam_shards
+from src.reservation.model import Reservation, Status
+from src.reservation.schema import ReservationStatusBatch, ReservationUpdateStatus
+from src.reservation.service import ReservationService
+
+
+@pytest.fixture
+def reservation(create_exam, create_reservations):
+    exam = create_exam(description="locking")
+    return create_reservations(exam, people=3)[0]
+
+
+def current_people(engine, exam_id: int) -> int:
+    with Session(engine) as session:
+        return session.scalar(select(Exam.current_people).where(Exam.id == exam_id))
+
+
+async def update_status_concurrently(engine, reservation_id: int, statuses) -> None:
+    service = ReservationService()
+    sessions = [ThreadedSession(Session(engine, autoflush=False, expire_on_commit=False)) for _ in statuses]
+
+    try:
+        await asyncio.gather(*(service.update_status(db, ReservationUpdateStatus(id=reservation_id, status=status))
+                               for db, status in zip(sessions, statuses)))
+    finally:
+        for db in sessions:
+            await db.close()
+
+
+# 같은 예약을 동시에 두 번 확정해도 좌석이 한 번만 반영되는지 테스트
+async def test_concurrent_confirms_move_seats_once(engine, reservation):
+    # When
+    await update_status_concurrently(engine, reservation.id, [Status.CONFIRMED, Status.CONFIRMED])
+
+    # Then
+    assert current_people(engine, reservation.exam_id) == 3
+
+
+# 확정과 거절이 동시에 들어와도 최종 상태와 좌석 수가 일치하는지 테스트
+async def test_concurrent_confirm_and_deny_keep_seats_consistent(engine, reservation):
+    # When
+    await update_status_concurrently(engine, reservation.id, [Status.CONFIRMED, Status.DENIED, Status.CONFIRMED])
+
+    # Then
+    with Session(engine) as session:
+        status = session.scalar(select(Reservation.status).where(Reservation.id == reservation.id))
+    assert current_people(engine, reservation.exam_id) == (3 if status == Status.CONFIRMED else 0)
+
+
+@pytest.fixture
+def hot_exam(create_exam, create_reservations):
+    exam = create_exam(description="hot locking", max_people=10)
+    yield exam, create_reservations(exam, 16, people=3)
+    hot_exam_shards.pop(exam.id, None)
+
+
+# 핫 모드 시험에서 용량을 넘는 일괄 확정이 동시에 들어와도 교착 없이 정원 안에서 확정되는지 테스트
+async def test_concurrent_over_capacity_batches_on_hot_exam(engine, hot_exam):
+    # Given
+    exam, reservations = hot_exam
+    db = ThreadedSession(Session(engine, autoflush=False, expire_on_commit=False))
+    try:
+        await ExamService().enable_hot_mode(db, exam.id, 4)
+    finally:
+        await db.close()
+
+    service = ReservationService()
+    batches = [ReservationStatusBatch(items=[ReservationUpdateStatus(id=reservation.id, status=Status.CONFIRMED)
+                                             for reservation in reservations[start::8]])
+               for start in range(8)]
+    sessions = [ThreadedSession(Session(engine, autoflush=False, expire_on_commit=False)) for _ in batches]
+
+    # When
+    try:
+        await asyncio.gather(*(service.update_status_batch(db, batch) for db, batch in zip(sessions, batches)))
+    finally:
+        for db in sessions:
+            await db.close()
+
+    # Then
+    with Session(engine) as session:
+        confirmed = session.scalar(select(func.sum(Reservation.people))
+                                   .where(Reservation.exam_id == exam.id, Reservation.status == Status.CONFIRMED))
+        remaining = session.scalar(select(func.sum(ExamSeatShard.remaining)).where(ExamSeatShard.exam_id == exam.id))
+    assert confirmed == 9
+    assert remaining == 1
+
+
+# 핫 모드 시험의 용량 초과 일괄 확정이 샤드 잠금을 풀고 시험 행부터 잠그는지 테스트
+async def test_over_capacity_batch_on_hot_exam_locks_exam_before_shards(engine, hot_exam):
+    # Given
+    exam, reservations = hot_exam
+    db = ThreadedSession(Session(engine, autoflush=False, expire_on_commit=False))
+    try:
+        await ExamService().enable_hot_mode(db, exam.id, 4)
+    finally:
+        await db.close()
+
+    statements = []
+    listener = lambda conn, cursor, statement, *args: statements.append(statement)
+    event.listen(engine, "before_cursor_execute", listener)
+    batch = ReservationStatusBatch(items=[ReservationUpdateStatus(id=reservation.id, status=Status.CONFIRMED)
+                                          for reservation in reservations[:4]])
+    db = ThreadedSession(Session(engine, autoflush=False, expire_on_commit=False))
+
+    # When
+    try:
+        await ReservationService().update_status_batch(db, batch)
+    finally:
+        await db.close()
+        event.remove(engine, "before_cursor_execute", listener)
+
+    # Then
+    locks = [index for index, statement in enumerate(statements) if "FOR UPDATE" in statement]
+    exam_lock = next(index for index in locks if "FROM exam " in statements[index])
+    shard_locks = [index for index in locks if "FROM exam_seat_shard" in statements[index]]
+    released = max(index for index in shard_locks if index < exam_lock)
+    assert any(statement.startswith("ROLLBACK TO SAVEPOINT") for statement in statements[released:exam_lock])
+    assert shard_locks[-1] > exam_lock
@@ -0,0 +1,45 @@
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from src.db.db import Base, ThreadedSession
+from src.member.model import Member, Role
+from src.member.repository import MemberRepository
+
+
+@pytest.fixture
+def statements():
+    return []
+
+
+@pytest.fixture
+def db(statements):
+    engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    Base.metadata.create_all(engine, tables=[Member.__table__])
+    event.listen(engine, "before_cursor_execute",
+                 lambda conn, cursor, statement, *args: statements.append(statement.split()[0]))
+
+    session = Session(engine, expire_on_commit=False)
+    yield ThreadedSession(session)
+    session.close()
+    engine.dispose()
+
+
+# 저장 시 RETURNING 으로 서버 기본값을 받아 재조회하지 않는지 테스트
+async def test_save_returns_server_defaults_without_select(db, statements):
+    # Given
+    repository = MemberRepository()
+    member = Member(username="testuser", password="hashed", role=Role.USER)
+
+    # When
+    saved_member = await repository.save(db, member)
+    created_at = saved_member.created_at
+    saved_member.password = "rehashed"
+    await repository.save(db, saved_member)
+
+    # Then
+    assert saved_member.id is not None
+    assert created_at is not None
+    assert saved_member.modified_at is not None
+    assert statements == ["INSERT", "UPDATE"]
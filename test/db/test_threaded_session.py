@@ -0,0 +1,47 @@
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from src.db import db as db_module
+from src.db.db import Base, ThreadedSession, open_db
+from src.member.model import Member, Role
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    Base.metadata.create_all(engine, tables=[Member.__table__])
+
+    session = Session(engine, expire_on_commit=False)
+    session.add_all([Member(username=f"user{i}", password="hashed", role=Role.USER) for i in range(5)])
+    session.commit()
+    yield ThreadedSession(session)
+    session.close()
+    engine.dispose()
+
+
+# 스레드 세션 스트리밍 조회 시 파티션 단위로 나눠 받는지 테스트
+async def test_stream_yields_partitions(db):
+    # Given
+    statement = select(Member.username).order_by(Member.id).execution_options(yield_per=2)
+
+    # When
+    result = await db.stream(statement)
+    partitions = [[row.username for row in rows] async for rows in result.partitions()]
+
+    # Then
+    assert partitions == [["user0", "user1"], ["user2", "user3"], ["user4"]]
+
+
+# DATABASE_ASYNC 설정에 따라 세션 종류를 선택하는지 테스트
+@pytest.mark.parametrize("database_async, session_class", [(True, AsyncSession), (False, ThreadedSession)])
+async def test_open_db_follows_database_async(database_async, session_class):
+    # When
+    with patch.object(db_module.settings, 'DATABASE_ASYNC', database_async):
+        async with open_db() as db:
+            # Then
+            assert isinstance(db, session_class)
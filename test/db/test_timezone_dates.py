@@ -0,0 +1,66 @@
+import httpx
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import NullPool
+
+from src.db.db import get_db
+from src.exam.cache import exam_cache
+from src.exam.model import Exam
+from src.member.model import Role
+from src.reservation.repository import ReservationRepository
+from src.reservation.schema import ReservationExportQuery
+
+
+@pytest.fixture
+async def async_sessions(engine):
+    async_engine = create_async_engine(engine.url.set(drivername="postgresql+asyncpg"), poolclass=NullPool)
+    yield async_sessionmaker(bind=async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False)
+    await async_engine.dispose()
+
+
+@pytest.fixture
+async def client(async_sessions):
+    from main import app
+
+    async def get_test_db():
+        async with async_sessions() as db:
+            yield db
+
+    app.dependency_overrides[get_db] = get_test_db
+    await exam_cache.invalidate()
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        yield client
+    app.dependency_overrides.pop(get_db)
+
+
+# asyncpg 엔진에서 UTC 표기(Z) 시험 일시를 생성하고 조회 필터로 쓸 수 있는지 테스트
+async def test_exam_dates_with_utc_suffix(client, engine, create_member, auth_headers):
+    # Given
+    headers = auth_headers(create_member(Role.ADMIN))
+
+    # When
+    created = await client.post("/admin/exams/", headers=headers,
+                                json={"date": "2031-12-01T18:00:00+09:00", "description": "tz", "max_people": 10})
+    listed = await client.get("/admin/exams/", headers=headers,
+                              params={"date_from": "2031-12-01T09:00:00Z", "date_to": "2031-12-01T09:00:01Z"})
+
+    # Then
+    assert created.status_code == 200
+    with Session(engine) as session:
+        assert session.get(Exam, created.json()["id"]).date.isoformat() == "2031-12-01T09:00:00"
+    assert [item["id"] for item in listed.json()["items"]] == [created.json()["id"]]
+
+
+# asyncpg 엔진에서 UTC 표기(Z) 기간으로 예약을 내보낼 수 있는지 테스트
+async def test_export_dates_with_utc_suffix(async_sessions):
+    # Given
+    query = ReservationExportQuery(date_from="2031-12-01T00:00:00Z", date_to="2031-12-02T00:00:00Z")
+
+    # When
+    async with async_sessions() as db:
+        rows = [row async for rows in ReservationRepository().stream_export_rows(
+            db, 100, **query.model_dump(exclude={"format"})) for row in rows]
+
+    # Then
+    assert rows == []
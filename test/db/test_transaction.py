@@ -0,0 +1,74 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.db.transaction import after_commit, transactional
+
+
+class Service:
+    def __init__(self):
+        self.callback = AsyncMock()
+
+    @transactional
+    async def outer(self, db, fail=False):
+        await after_commit(db, self.callback, "outer")
+        await self.inner(db)
+        if fail:
+            raise ValueError("fail")
+        return "done"
+
+    @transactional
+    async def inner(self, db):
+        await after_commit(db, self.callback, "inner")
+
+
+@pytest.fixture
+def db_session():
+    session = MagicMock(spec=AsyncSession)
+    session.info = {}
+    return session
+
+
+# 중첩 호출 시 최상위에서 한 번만 커밋하는지 테스트
+async def test_commits_once_at_outermost_scope(db_session):
+    # Given
+    service = Service()
+
+    # When
+    result = await service.outer(db_session)
+
+    # Then
+    assert result == "done"
+    db_session.commit.assert_awaited_once()
+    db_session.rollback.assert_not_awaited()
+    assert [call.args for call in service.callback.await_args_list] == [("outer",), ("inner",)]
+    assert db_session.info == {"transaction_depth": 0}
+
+
+# 예외 발생 시 롤백하고 커밋 후 콜백을 버리는지 테스트
+async def test_rolls_back_on_error(db_session):
+    # Given
+    service = Service()
+
+    # When
+    with pytest.raises(ValueError):
+        await service.outer(db_session, fail=True)
+
+    # Then
+    db_session.commit.assert_not_awaited()
+    db_session.rollback.assert_awaited_once()
+    service.callback.assert_not_awaited()
+    assert db_session.info == {"transaction_depth": 0}
+
+
+# 트랜잭션 밖에서는 콜백을 즉시 실행하는지 테스트
+async def test_after_commit_runs_immediately_outside_transaction(db_session):
+    # Given
+    callback = AsyncMock()
+
+    # When
+    await after_commit(db_session, callback, 1)
+
+    # Then
+    callback.assert_awaited_once_with(1)
@@ -1,26 +1,41 @@
-from datetime import datetime, timedelta
-from unittest.mock import MagicMock, patch
+from collections import namedtuple
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.exam.exception import ExamNotFound, ExamCapacityExceededError
+from src.core.cache.cache import InMemoryCacheBackend
+from src.exam.cache import ExamCache
+from src.exam.exception import ExamNotFound, ExamCapacityExceededError, ExamValidationError
 from src.exam.model import Exam
-from src.exam.schema import ExamCreate, ExamResponse
-from src.exam.service import ExamService
+from src.exam.schema import ExamCreate, ExamResponse, ExamListQuery, ExamPage
+from src.exam.service import ExamService, hot_exam_shards
 from src.member.model import Member
 
 
 @pytest.fixture
 def exam_service():
     service = ExamService()
-    service.repository = MagicMock()
+    service.repository = AsyncMock()
+    service.shard_repository = AsyncMock()
+    service.shard_repository.add_all = MagicMock()
+    service.cache = ExamCache(InMemoryCacheBackend(), ttl=60)
     return service
 
 
+@pytest.fixture(autouse=True)
+def clear_hot_exam_shards():
+    yield
+    hot_exam_shards.clear()
+
+
 @pytest.fixture
 def db_session():
-    return MagicMock(spec=Session)
+    session = MagicMock(spec=AsyncSession)
+    session.info = {}
+    session.begin_nested = AsyncMock(return_value=AsyncMock())
+    return session
 
 
 @pytest.fixture
@@ -39,32 +54,66 @@ def mock_exam():
     exam.date = datetime.now() + timedelta(days=10)
     exam.current_people = 10
     exam.max_people = 100
+    exam.hot_shards = 0
     exam.created_at = datetime.now()
     exam.modified_at = datetime.now()
     return exam
 
 
-# 모든 시험 목록 조회 테스트
-def test_get_all(exam_service, db_session, mock_exam):
+# 시험 목록 첫 페이지 조회 테스트
+async def test_get_page_json(exam_service, db_session):
     # Given
-    mock_exams = [mock_exam]
-    exam_service.repository.find_all.return_value = mock_exams
+    query = ExamListQuery(limit=1)
+    row_type = namedtuple("Row", ["date", "description", "current_people", "max_people", "id", "member_id",
+                                  "created_at"])
+    exam_date = datetime(2030, 1, 1, 10, 0)
+    created_at = datetime(2025, 3, 1, 9, 30, 15, 123456, tzinfo=timezone.utc)
+    rows = [row_type(exam_date, "Test Exam", 10, 100, 1, 1, created_at),
+            row_type(exam_date, "Next Exam", 0, 100, 2, 1, created_at)]
+    exam_service.repository.find_page_rows.return_value = rows
 
-    # ExamResponse.model_validate 모킹
-    mock_response = MagicMock(spec=ExamResponse)
+    # When
+    result = await exam_service.get_page_json(db_session, query)
 
-    with patch('src.exam.schema.ExamResponse.model_validate', return_value=mock_response):
-        # When
-        result = exam_service.get_all(db_session)
+    # Then
+    exam_service.repository.find_page_rows.assert_called_once_with(db_session, limit=2, after=None, date_from=None,
+                                                                   date_to=None, min_remaining=None)
+    expected = ExamPage(items=[ExamResponse.model_validate(rows[0]._asdict())],
+                        next_cursor=exam_service._encode_cursor(exam_date, 1))
+    assert result == expected.model_dump_json().encode()
 
-        # Then
-        exam_service.repository.find_all.assert_called_once_with(db_session)
-        assert len(result) == 1
-        assert result[0] == mock_response
+
+# 커서를 이용한 다음 페이지 조회 테스트
+async def test_get_page_json_with_cursor(exam_service, db_session, mock_exam):
+    # Given
+    cursor = exam_service._encode_cursor(mock_exam.date, mock_exam.id)
+    query = ExamListQuery(limit=10, cursor=cursor, min_remaining=5)
+    exam_service.repository.find_page_rows.return_value = []
+
+    # When
+    result = await exam_service.get_page_json(db_session, query)
+
+    # Then
+    kwargs = exam_service.repository.find_page_rows.call_args.kwargs
+    assert kwargs["after"] == (mock_exam.date, mock_exam.id)
+    assert kwargs["min_remaining"] == 5
+    assert result == b'{"items":[],"next_cursor":null}'
+
+
+# 잘못된 커서로 조회 실패 테스트
+async def test_get_page_invalid_cursor(exam_service, db_session):
+    # Given
+    query = ExamListQuery(cursor="invalid")
+
+    # When & Then
+    with pytest.raises(ExamValidationError):
+        await exam_service.get_page_json(db_session, query)
+
+    exam_service.repository.find_page_rows.assert_not_called()
 
 
 # ID로 시험 검색 성공 시나리오
-def test_get_by_id_success(exam_service, db_session, mock_exam):
+async def test_get_by_id_success(exam_service, db_session, mock_exam):
     # Given
     exam_id = 1
     exam_service.repository.find_by_id.return_value = mock_exam
@@ -74,7 +123,7 @@ def test_get_by_id_success(exam_service, db_session, mock_exam):
 
     with patch('src.exam.schema.ExamResponse.model_validate', return_value=mock_response):
         # When
-        result = exam_service.get_by_id(db_session, exam_id)
+        result = await exam_service.get_by_id(db_session, exam_id)
 
         # Then
         exam_service.repository.find_by_id.assert_called_once_with(db_session, exam_id)
@@ -82,20 +131,58 @@ def test_get_by_id_success(exam_service, db_session, mock_exam):
 
 
 # 존재하지 않는 ID로 시험 검색 실패 시나리오
-def test_get_by_id_not_found(exam_service, db_session):
+async def test_get_by_id_not_found(exam_service, db_session):
     # Given
     exam_id = 999
     exam_service.repository.find_by_id.return_value = None
 
     # When & Then
     with pytest.raises(ExamNotFound):
-        exam_service.get_by_id(db_session, exam_id)
+        await exam_service.get_by_id(db_session, exam_id)
 
     exam_service.repository.find_by_id.assert_called_once_with(db_session, exam_id)
 
 
+# 시험 상세 캐시 적중 테스트
+async def test_get_json_by_id_cached(exam_service, db_session, mock_exam):
+    # Given
+    exam_id = 1
+    exam_service.repository.find_by_id.return_value = mock_exam
+
+    # When
+    first = await exam_service.get_json_by_id(db_session, exam_id)
+    second = await exam_service.get_json_by_id(db_session, exam_id)
+
+    # Then
+    exam_service.repository.find_by_id.assert_called_once_with(db_session, exam_id)
+    assert first == second
+    assert exam_service.cache.stats()["hits"] == 1
+
+
+# 인원 변경 시 시험 캐시 무효화 테스트
+async def test_update_people_invalidates_cache(exam_service, db_session, mock_exam):
+    # Given
+    exam_id = 1
+    query = ExamListQuery()
+    exam_service.repository.find_by_id.return_value = mock_exam
+    exam_service.repository.find_page_rows.return_value = []
+    exam_service.repository.add_people.return_value = mock_exam
+
+    await exam_service.get_json_by_id(db_session, exam_id)
+    await exam_service.get_page_json(db_session, query)
+
+    # When
+    await exam_service.update_people(db_session, exam_id, 1)
+    await exam_service.get_json_by_id(db_session, exam_id)
+    await exam_service.get_page_json(db_session, query)
+
+    # Then
+    assert exam_service.repository.find_by_id.call_count == 2
+    assert exam_service.repository.find_page_rows.call_count == 2
+
+
 # 회원 ID로 시험 목록 조회 테스트
-def test_get_by_member_id(exam_service, db_session, mock_exam):
+async def test_get_by_member_id(exam_service, db_session, mock_exam):
     # Given
     member_id = 1
     mock_exams = [mock_exam]
@@ -106,7 +193,7 @@ def test_get_by_member_id(exam_service, db_session, mock_exam):
 
     with patch('src.exam.schema.ExamResponse.model_validate', return_value=mock_response):
         # When
-        result = exam_service.get_by_member_id(db_session, member_id)
+        result = await exam_service.get_by_member_id(db_session, member_id)
 
         # Then
         exam_service.repository.find_by_member_id.assert_called_once_with(db_session, member_id)
@@ -115,7 +202,7 @@ def test_get_by_member_id(exam_service, db_session, mock_exam):
 
 
 # 신규 시험 생성 성공 시나리오
-def test_create_success(exam_service, db_session, test_member):
+async def test_create_success(exam_service, db_session, test_member):
     # Given
     exam_date = datetime.now() + timedelta(days=7)
     exam_create = ExamCreate(
@@ -141,7 +228,7 @@ def test_create_success(exam_service, db_session, test_member):
 
     with patch('src.exam.schema.ExamResponse.model_validate', return_value=mock_response):
         # When
-        result = exam_service.create(db_session, test_member, exam_create)
+        result = await exam_service.create(db_session, test_member, exam_create)
 
         # Then
         exam_service.repository.save.assert_called_once()
@@ -149,7 +236,7 @@ def test_create_success(exam_service, db_session, test_member):
 
 
 # 인원 수용량 초과 시 생성 실패 시나리오
-def test_create_capacity_exceeded(exam_service, db_session, test_member):
+async def test_create_capacity_exceeded(exam_service, db_session, test_member):
     # Given
     exam_create = ExamCreate(
         date=datetime.now() + timedelta(days=7),
@@ -160,20 +247,20 @@ def test_create_capacity_exceeded(exam_service, db_session, test_member):
 
     # When & Then
     with pytest.raises(ExamCapacityExceededError):
-        exam_service.create(db_session, test_member, exam_create)
+        await exam_service.create(db_session, test_member, exam_create)
 
     exam_service.repository.save.assert_not_called()
 
 
 # 시험 삭제 성공 시나리오
-def test_delete_success(exam_service, db_session, mock_exam):
+async def test_delete_success(exam_service, db_session, mock_exam):
     # Given
     exam_id = 1
     exam_service.repository.find_by_id.return_value = mock_exam
     exam_service.repository.delete.return_value = True
 
     # When
-    exam_service.delete(db_session, exam_id)
+    await exam_service.delete(db_session, exam_id)
 
     # Then
     exam_service.repository.find_by_id.assert_called_once_with(db_session, exam_id)
@@ -181,69 +268,192 @@ def test_delete_success(exam_service, db_session, mock_exam):
 
 
 # 존재하지 않는 시험 삭제 시나리오
-def test_delete_not_found(exam_service, db_session):
+async def test_delete_not_found(exam_service, db_session):
     # Given
     exam_id = 999
     exam_service.repository.find_by_id.return_value = None
 
     # When & Then
     with pytest.raises(ExamNotFound):
-        exam_service.delete(db_session, exam_id)
+        await exam_service.delete(db_session, exam_id)
 
     exam_service.repository.find_by_id.assert_called_once_with(db_session, exam_id)
     exam_service.repository.delete.assert_not_called()
 
 
 # 인원 업데이트 성공 시나리오
-def test_update_people_success(exam_service, db_session, mock_exam):
+async def test_update_people_success(exam_service, db_session, mock_exam):
     # Given
     exam_id = 1
     people_to_add = 5
-    mock_exam.current_people = 10
-    mock_exam.max_people = 100
+    mock_exam.current_people = 15
 
-    exam_service.repository.find_by_id.return_value = mock_exam
-    exam_service.repository.save.return_value = mock_exam
+    exam_service.repository.add_people.return_value = mock_exam
 
     # When
-    result = exam_service.update_people(db_session, exam_id, people_to_add)
+    result = await exam_service.update_people(db_session, exam_id, people_to_add)
 
     # Then
-    exam_service.repository.find_by_id.assert_called_once_with(db_session, exam_id)
-    assert mock_exam.current_people == 15  # 10 + 5
-    exam_service.repository.save.assert_called_once_with(db_session, mock_exam)
+    exam_service.repository.add_people.assert_called_once_with(db_session, exam_id, people_to_add)
+    exam_service.repository.find_by_id.assert_not_called()
+    exam_service.repository.save.assert_not_called()
     assert result == mock_exam
 
 
 # 존재하지 않는 시험 인원 업데이트 시나리오
-def test_update_people_not_found(exam_service, db_session):
+async def test_update_people_not_found(exam_service, db_session):
     # Given
     exam_id = 999
     people_to_add = 5
 
+    exam_service.repository.add_people.return_value = None
     exam_service.repository.find_by_id.return_value = None
 
     # When & Then
     with pytest.raises(ExamNotFound):
-        exam_service.update_people(db_session, exam_id, people_to_add)
+        await exam_service.update_people(db_session, exam_id, people_to_add)
 
+    exam_service.repository.add_people.assert_called_once_with(db_session, exam_id, people_to_add)
     exam_service.repository.find_by_id.assert_called_once_with(db_session, exam_id)
-    exam_service.repository.save.assert_not_called()
 
 
 # 용량 초과 시 인원 업데이트 실패 시나리오
-def test_update_people_capacity_exceeded(exam_service, db_session, mock_exam):
+async def test_update_people_capacity_exceeded(exam_service, db_session, mock_exam):
     # Given
     exam_id = 1
     people_to_add = 100  # 추가하면 용량 초과
-    mock_exam.current_people = 10
-    mock_exam.max_people = 50
 
+    exam_service.repository.add_people.return_value = None
     exam_service.repository.find_by_id.return_value = mock_exam
 
     # When & Then
     with pytest.raises(ExamCapacityExceededError):
-        exam_service.update_people(db_session, exam_id, people_to_add)
+        await exam_service.update_people(db_session, exam_id, people_to_add)
 
-    exam_service.repository.find_by_id.assert_called_once_with(db_session, exam_id)
+    exam_service.repository.add_people.assert_called_once_with(db_session, exam_id, people_to_add)
     exam_service.repository.save.assert_not_called()
+
+
+# 인원 감소 시 음수가 되는 경우 실패 시나리오
+async def test_update_people_negative(exam_service, db_session, mock_exam):
+    # Given
+    exam_id = 1
+    people_to_remove = -100
+
+    exam_service.repository.add_people.return_value = None
+    exam_service.repository.find_by_id.return_value = mock_exam
+
+    # When & Then
+    with pytest.raises(ExamValidationError):
+        await exam_service.update_people(db_session, exam_id, people_to_remove)
+
+
+# 핫 모드 시험 인원 업데이트 시 샤드 차감 시나리오
+async def test_update_people_hot_exam(exam_service, db_session):
+    # Given
+    exam_id = 1
+    hot_exam_shards[exam_id] = 4
+    exam_service.shard_repository.take.return_value = 10
+
+    # When
+    await exam_service.update_people(db_session, exam_id, 2)
+
+    # Then
+    exam_service.shard_repository.take.assert_called_once()
+    exam_service.repository.add_people.assert_not_called()
+    db_session.begin_nested.return_value.commit.assert_awaited_once()
+    db_session.commit.assert_awaited_once()
+
+
+# 핫 모드 정보가 없는 워커에서 핫 시험 인원 업데이트 시나리오
+async def test_update_people_discovers_hot_exam(exam_service, db_session, mock_exam):
+    # Given
+    exam_id = 1
+    mock_exam.hot_shards = 4
+    exam_service.repository.add_people.return_value = None
+    exam_service.repository.find_by_id.return_value = mock_exam
+    exam_service.shard_repository.take.return_value = 10
+
+    # When
+    await exam_service.update_people(db_session, exam_id, 2)
+
+    # Then
+    assert hot_exam_shards[exam_id] == 4
+    exam_service.shard_repository.take.assert_called_once()
+
+
+# 모든 샤드 소진 시 용량 초과 시나리오
+async def test_update_people_hot_exam_capacity_exceeded(exam_service, db_session):
+    # Given
+    exam_id = 1
+    hot_exam_shards[exam_id] = 4
+    exam_service.shard_repository.take.return_value = None
+    exam_service.shard_repository.find_available.return_value = []
+    exam_service.shard_repository.take_rebalanced.return_value = False
+
+    # When & Then
+    with pytest.raises(ExamCapacityExceededError):
+        await exam_service.update_people(db_session, exam_id, 2)
+
+    exam_service.repository.add_people.assert_not_called()
+    assert db_session.begin_nested.await_count == 2
+    assert db_session.begin_nested.return_value.rollback.await_count == 2
+    db_session.rollback.assert_awaited_once()
+    db_session.commit.assert_not_awaited()
+
+
+# 핫 모드 활성화 시 잔여 좌석 분할 시나리오
+async def test_enable_hot_mode(exam_service, db_session, mock_exam):
+    # Given
+    exam_id = 1
+    mock_exam.hot_shards = 0
+    mock_exam.current_people = 10
+    mock_exam.max_people = 100
+    exam_service.repository.find_by_id_for_update.return_value = mock_exam
+    exam_service.repository.save.return_value = mock_exam
+
+    with patch('src.exam.schema.ExamResponse.model_validate'):
+        # When
+        await exam_service.enable_hot_mode(db_session, exam_id, 4)
+
+    # Then
+    shards = exam_service.shard_repository.add_all.call_args.args[1]
+    assert [shard.remaining for shard in shards] == [23, 23, 22, 22]
+    assert mock_exam.hot_shards == 4
+    assert hot_exam_shards[exam_id] == 4
+
+
+# 핫 모드 비활성화 시 샤드 병합 시나리오
+async def test_disable_hot_mode(exam_service, db_session, mock_exam):
+    # Given
+    exam_id = 1
+    hot_exam_shards[exam_id] = 4
+    mock_exam.hot_shards = 4
+    mock_exam.max_people = 100
+    exam_service.repository.find_by_id_for_update.return_value = mock_exam
+    exam_service.repository.save.return_value = mock_exam
+    exam_service.shard_repository.delete_all.return_value = 30
+
+    with patch('src.exam.schema.ExamResponse.model_validate'):
+        # When
+        await exam_service.disable_hot_mode(db_session, exam_id)
+
+    # Then
+    assert mock_exam.current_people == 70
+    assert mock_exam.hot_shards == 0
+    assert exam_id not in hot_exam_shards
+
+
+# 핫 모드 시험의 남은 좌석 잠금 조회 시나리오
+async def test_lock_remaining_seats_hot_exam(exam_service, db_session, mock_exam):
+    # Given
+    mock_exam.hot_shards = 4
+    exam_service.repository.find_by_id_for_update.return_value = mock_exam
+    exam_service.shard_repository.lock_remaining.return_value = 37
+
+    # When
+    remaining = await exam_service.lock_remaining_seats(db_session, 1)
+
+    # Then
+    assert remaining == 37
+    exam_service.shard_repository.lock_remaining.assert_awaited_once_with(db_session, 1)
@@ -0,0 +1,92 @@
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.member.importer import MemberImporter, read_records
+
+
+@pytest.fixture
+def importer():
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        importer = MemberImporter(executor, workers=2, batch_size=2)
+        importer.member_service = AsyncMock()
+        importer.member_service.find_existing_usernames.return_value = set()
+        importer.member_service.create_many.side_effect = \
+            lambda db, members, hashed_passwords: [member.username for member in members]
+        yield importer
+
+
+@pytest.fixture(autouse=True)
+def session_factory():
+    session = MagicMock(__aenter__=AsyncMock(return_value=AsyncMock()), __aexit__=AsyncMock(return_value=False))
+    with patch('src.member.importer.open_db', return_value=session), \
+            patch('src.member.importer.hash_passwords', lambda passwords: [f"hashed:{p}" for p in passwords]):
+        yield
+
+
+# CSV 회원 파일 읽기 테스트
+def test_read_records_csv(tmp_path):
+    # Given
+    path = tmp_path / "members.csv"
+    path.write_text("username,password,role\nkim,pw1,USER\nlee,pw2,ADMIN\n")
+
+    # When
+    records = list(read_records(str(path)))
+
+    # Then
+    assert records == [
+        (2, {"username": "kim", "password": "pw1", "role": "USER"}),
+        (3, {"username": "lee", "password": "pw2", "role": "ADMIN"}),
+    ]
+
+
+# NDJSON 회원 파일 읽기 테스트
+def test_read_records_ndjson(tmp_path):
+    # Given
+    path = tmp_path / "members.txt"
+    path.write_text('{"username": "kim", "password": "pw1"}\n\n{"username": "lee", "password": "pw2"}\n')
+
+    # When
+    records = list(read_records(str(path), "ndjson"))
+
+    # Then
+    assert [record["username"] for _, record in records] == ["kim", "lee"]
+
+
+# 회원 일괄 등록 배치 처리 및 해싱 테스트
+async def test_import_batches_and_hashes(importer):
+    # Given
+    records = [(line, {"username": f"user{line}", "password": f"pw{line}"}) for line in range(5)]
+
+    # When
+    summary = await importer.run(iter(records))
+
+    # Then
+    assert importer.member_service.create_many.await_count == 3
+    members, hashed_passwords = importer.member_service.create_many.await_args_list[0].args[1:]
+    assert [member.username for member in members] == ["user0", "user1"]
+    assert hashed_passwords == ["hashed:pw0", "hashed:pw1"]
+    assert summary["created"] == 5
+
+
+# 기존 회원, 파일 내 중복, 잘못된 레코드 제외 테스트
+async def test_import_skips_existing_duplicate_and_invalid(importer):
+    # Given
+    importer.member_service.find_existing_usernames.return_value = {"kim"}
+    records = [
+        (1, {"username": "kim", "password": "pw"}),
+        (2, {"username": "lee", "password": "pw"}),
+        (3, {"username": "lee", "password": "other"}),
+        (4, {"username": "park"}),
+    ]
+
+    # When
+    summary = await importer.run(iter(records))
+
+    # Then
+    members = importer.member_service.create_many.await_args.args[1]
+    assert [member.username for member in members] == ["lee"]
+    assert {key: summary[key] for key in ("read", "created", "existing", "duplicate", "invalid")} == {
+        "read": 4, "created": 1, "existing": 1, "duplicate": 1, "invalid": 1,
+    }
@@ -1,8 +1,11 @@
-from unittest.mock import MagicMock, patch
+import hashlib
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.core.security.schema import TokenData
 from src.member.model import Member, Role
 from src.member.schema import MemberCreate, MemberUpdate, MemberResponse, LoginResponse
 from src.member.service import MemberService
@@ -11,13 +14,15 @@ from src.member.service import MemberService
 @pytest.fixture
 def member_service():
     service = MemberService()
-    service.repository = MagicMock()
+    service.repository = AsyncMock()
     return service
 
 
 @pytest.fixture
 def db_session():
-    return MagicMock(spec=Session)
+    session = MagicMock(spec=AsyncSession)
+    session.info = {}
+    return session
 
 
 # 비밀번호 해싱 테스트
@@ -29,8 +34,9 @@ def test_hash_password(member_service):
     hashed = member_service._hash_password(password)
 
     # Then
-    assert ":" in hashed
-    salt, hash_part = hashed.split(":")
+    algorithm, iterations, salt, hash_part = hashed.split("$")
+    assert algorithm == "pbkdf2_sha256"
+    assert int(iterations) > 0
     assert len(bytes.fromhex(salt)) == 32
     assert len(bytes.fromhex(hash_part)) > 0
 
@@ -62,8 +68,24 @@ def test_verify_password_failure(member_service):
     assert result is False
 
 
+# 기존 형식(salt:hash) 비밀번호 검증 테스트
+def test_verify_legacy_password(member_service):
+    # Given
+    password = "test_password"
+    salt = bytes(32)
+    pw_hash = hashlib.pbkdf2_hmac('sha256', password.encode('utf-8'), salt, 100000)
+    hashed = salt.hex() + ':' + pw_hash.hex()
+
+    # When
+    result = member_service._verify_password(hashed, password)
+
+    # Then
+    assert result is True
+    assert member_service._verify_password(hashed, "wrong_password") is False
+
+
 # ID로 회원 조회 성공 테스트
-def test_get_by_id_success(member_service, db_session):
+async def test_get_by_id_success(member_service, db_session):
     # Given
     member_id = 1
     mock_member = MagicMock(spec=Member)
@@ -74,7 +96,7 @@ def test_get_by_id_success(member_service, db_session):
     member_service.repository.find_by_id.return_value = mock_member
 
     # When
-    result = member_service._get_by_id(db_session, member_id)
+    result = await member_service._get_by_id(db_session, member_id)
 
     # Then
     member_service.repository.find_by_id.assert_called_once_with(db_session, member_id)
@@ -84,13 +106,13 @@ def test_get_by_id_success(member_service, db_session):
 
 
 # ID로 회원 조회 실패 테스트
-def test_get_by_id_not_found(member_service, db_session):
+async def test_get_by_id_not_found(member_service, db_session):
     # Given
     member_id = 999
     member_service.repository.find_by_id.return_value = None
 
     # When
-    result = member_service._get_by_id(db_session, member_id)
+    result = await member_service._get_by_id(db_session, member_id)
 
     # Then
     member_service.repository.find_by_id.assert_called_once_with(db_session, member_id)
@@ -98,7 +120,7 @@ def test_get_by_id_not_found(member_service, db_session):
 
 
 # 사용자명으로 회원 조회 테스트
-def test_get_by_username(member_service, db_session):
+async def test_get_by_username(member_service, db_session):
     # Given
     username = "test_user"
     mock_member = MagicMock(spec=Member)
@@ -107,7 +129,7 @@ def test_get_by_username(member_service, db_session):
     member_service.repository.find_by_username.return_value = mock_member
 
     # When
-    result = member_service._get_by_username(db_session, username)
+    result = await member_service._get_by_username(db_session, username)
 
     # Then
     member_service.repository.find_by_username.assert_called_once_with(db_session, username)
@@ -115,7 +137,7 @@ def test_get_by_username(member_service, db_session):
 
 
 # 회원 생성 성공 테스트
-def test_create_success(member_service, db_session):
+async def test_create_success(member_service, db_session):
     # Given
     username = "new_user"
     password = "password123"
@@ -135,7 +157,7 @@ def test_create_success(member_service, db_session):
 
     # When
     with patch.object(member_service, '_hash_password', return_value="salt:hash"):
-        result = member_service.create(db_session, member_create)
+        result = await member_service.create(db_session, member_create)
 
     # Then
     member_service.repository.find_by_username.assert_called_once_with(db_session, username=username)
@@ -147,7 +169,7 @@ def test_create_success(member_service, db_session):
 
 
 # 회원 생성 실패(사용자명 중복) 테스트
-def test_create_username_exists(member_service, db_session):
+async def test_create_username_exists(member_service, db_session):
     # Given
     username = "existing_user"
     password = "password123"
@@ -160,7 +182,7 @@ def test_create_username_exists(member_service, db_session):
     member_service.repository.find_by_username.return_value = mock_existing_member
 
     # When
-    result = member_service.create(db_session, member_create)
+    result = await member_service.create(db_session, member_create)
 
     # Then
     member_service.repository.find_by_username.assert_called_once_with(db_session, username=username)
@@ -169,7 +191,7 @@ def test_create_username_exists(member_service, db_session):
 
 
 # 회원 정보 업데이트 성공 테스트
-def test_update_success(member_service, db_session):
+async def test_update_success(member_service, db_session):
     # Given
     member_id = 1
     new_username = "updated_user"
@@ -189,7 +211,7 @@ def test_update_success(member_service, db_session):
     member_service.repository.save.return_value = mock_updated_member
 
     # When
-    result = member_service.update(db_session, mock_member, member_update)
+    result = await member_service.update(db_session, mock_member, member_update)
 
     # Then
     member_service.repository.save.assert_called_once_with(db_session, mock_member)
@@ -199,7 +221,7 @@ def test_update_success(member_service, db_session):
 
 
 # 비밀번호 업데이트 테스트
-def test_update_with_password(member_service, db_session):
+async def test_update_with_password(member_service, db_session):
     # Given
     member_id = 1
     new_password = "new_password"
@@ -221,17 +243,20 @@ def test_update_with_password(member_service, db_session):
     hashed_password = "salt:hash"
 
     # When
-    with patch.object(member_service, '_hash_password', return_value=hashed_password):
-        result = member_service.update(db_session, mock_member, member_update)
+    with patch.object(member_service, '_hash_password', return_value=hashed_password), \
+            patch('src.member.service.revocation_list') as revocation_list:
+        result = await member_service.update(db_session, mock_member, member_update)
 
     # Then
     assert mock_member.password == hashed_password
+    assert mock_member.tokens_valid_after <= datetime.now(timezone.utc)
     member_service.repository.save.assert_called_once_with(db_session, mock_member)
+    revocation_list.revoke_member.assert_called_once_with(member_id)
     assert result is not None
 
 
 # 회원 삭제 성공 테스트
-def test_delete_success(member_service, db_session):
+async def test_delete_success(member_service, db_session):
     # Given
     member_id = 1
 
@@ -244,7 +269,7 @@ def test_delete_success(member_service, db_session):
     member_service.repository.delete.return_value = True
 
     # When
-    result = member_service.delete(db_session, member_id)
+    result = await member_service.delete(db_session, member_id)
 
     # Then
     member_service.repository.find_by_id.assert_called_once_with(db_session, member_id)
@@ -252,8 +277,25 @@ def test_delete_success(member_service, db_session):
     assert result is True
 
 
+# 회원 삭제 시 발급된 토큰 폐기 테스트
+async def test_delete_revokes_tokens(member_service, db_session):
+    # Given
+    member_id = 1
+    mock_member = MagicMock(spec=Member)
+    mock_member.id = member_id
+    member_service.repository.find_by_id.return_value = mock_member
+    member_service.repository.delete.return_value = True
+
+    # When
+    with patch('src.member.service.revocation_list') as revocation_list:
+        await member_service.delete(db_session, member_id)
+
+    # Then
+    revocation_list.revoke_member.assert_called_once_with(member_id)
+
+
 # 존재하지 않는 회원 삭제 테스트
-def test_delete_member_not_found(member_service, db_session):
+async def test_delete_member_not_found(member_service, db_session):
     # Given
     member_id = 999
 
@@ -261,7 +303,7 @@ def test_delete_member_not_found(member_service, db_session):
     member_service.repository.find_by_id.return_value = None
 
     # When
-    result = member_service.delete(db_session, member_id)
+    result = await member_service.delete(db_session, member_id)
 
     # Then
     member_service.repository.find_by_id.assert_called_once_with(db_session, member_id)
@@ -269,8 +311,30 @@ def test_delete_member_not_found(member_service, db_session):
     assert result is False
 
 
+# 비밀번호 해싱을 기다리는 동안 DB 커넥션을 반환하는지 테스트
+async def test_login_releases_connection_before_hashing(member_service, db_session):
+    # Given
+    member_login = MagicMock()
+    member_login.username = "test_user"
+    member_login.password = "password123"
+    member_service.repository.find_by_username.return_value = MagicMock(spec=Member, password="salt:hash")
+    commits_at_hashing = []
+
+    async def run(func, *args):
+        commits_at_hashing.append(db_session.commit.await_count)
+        return False
+
+    # When
+    with patch('src.member.service.password_hashing_pool.run', side_effect=run):
+        result = await member_service.login(db_session, member_login)
+
+    # Then
+    assert result is None
+    assert commits_at_hashing == [1]
+
+
 # 로그인 성공 테스트
-def test_login_success(member_service, db_session):
+async def test_login_success(member_service, db_session):
     # Given
     username = "test_user"
     password = "password123"
@@ -288,20 +352,62 @@ def test_login_success(member_service, db_session):
     member_service.repository.find_by_username.return_value = mock_member
 
     # 비밀번호 검증 모킹
-    with patch.object(member_service, '_verify_password', return_value=True):
+    with patch.object(member_service, '_verify_password', return_value=True), \
+            patch.object(member_service, '_schedule_rehash') as schedule_rehash:
         token = "test.jwt.token"
         with patch('src.core.security.security.create_access_token', return_value=token):
             # When
-            result = member_service.login(db_session, member_login)
+            result = await member_service.login(db_session, member_login)
 
     # Then
     member_service.repository.find_by_username.assert_called_once_with(db_session, username)
+    schedule_rehash.assert_called_once_with(1, "salt:hash", password)
     assert result is not None
     assert isinstance(result, LoginResponse)
 
 
+# 최신 해시로 로그인 시 재해싱하지 않는지 테스트
+async def test_login_current_hash_skips_rehash(member_service, db_session):
+    # Given
+    password = "password123"
+    member_login = MagicMock()
+    member_login.username = "test_user"
+    member_login.password = password
+
+    mock_member = MagicMock(spec=Member)
+    mock_member.id = 1
+    mock_member.username = "test_user"
+    mock_member.password = member_service._hash_password(password)
+    mock_member.role = Role.USER
+    member_service.repository.find_by_username.return_value = mock_member
+
+    # When
+    with patch.object(member_service, '_schedule_rehash') as schedule_rehash:
+        result = await member_service.login(db_session, member_login)
+
+    # Then
+    schedule_rehash.assert_not_called()
+    assert isinstance(result, LoginResponse)
+
+
+# 재해싱 결과를 이전 해시가 그대로일 때만 저장하는지 테스트
+async def test_rehash_password(member_service, db_session):
+    # Given
+    member_service.repository.update_password.return_value = True
+
+    # When
+    result = await member_service.rehash_password(db_session, 1, "salt:hash", "pbkdf2_sha256$1$00$00")
+
+    # Then
+    member_service.repository.update_password.assert_called_once_with(
+        db_session, 1, "salt:hash", "pbkdf2_sha256$1$00$00"
+    )
+    db_session.commit.assert_awaited_once()
+    assert result is True
+
+
 # 로그인 실패(잘못된 비밀번호) 테스트
-def test_login_wrong_password(member_service, db_session):
+async def test_login_wrong_password(member_service, db_session):
     # Given
     username = "test_user"
     password = "wrong_password"
@@ -320,7 +426,7 @@ def test_login_wrong_password(member_service, db_session):
     # 비밀번호 검증 실패 모킹
     with patch.object(member_service, '_verify_password', return_value=False):
         # When
-        result = member_service.login(db_session, member_login)
+        result = await member_service.login(db_session, member_login)
 
     # Then
     member_service.repository.find_by_username.assert_called_once_with(db_session, username)
@@ -328,7 +434,7 @@ def test_login_wrong_password(member_service, db_session):
 
 
 # 로그인 실패(존재하지 않는 사용자) 테스트
-def test_login_user_not_found(member_service, db_session):
+async def test_login_user_not_found(member_service, db_session):
     # Given
     username = "nonexistent_user"
     password = "password123"
@@ -341,8 +447,43 @@ def test_login_user_not_found(member_service, db_session):
     member_service.repository.find_by_username.return_value = None
 
     # When
-    result = member_service.login(db_session, member_login)
+    result = await member_service.login(db_session, member_login)
 
     # Then
     member_service.repository.find_by_username.assert_called_once_with(db_session, username)
     assert result is None
+
+
+# 회원 일괄 생성 테스트
+async def test_create_many(member_service, db_session):
+    # Given
+    members = [MemberCreate(username="kim", password="pw1"), MemberCreate(username="lee", password="pw2", role="ADMIN")]
+    member_service.repository.insert_many.return_value = ["kim"]
+
+    # When
+    created = await member_service.create_many(db_session, members, ["hash1", "hash2"])
+
+    # Then
+    assert created == ["kim"]
+    member_service.repository.insert_many.assert_awaited_once_with(db_session, [
+        {"username": "kim", "password": "hash1", "role": "USER"},
+        {"username": "lee", "password": "hash2", "role": "ADMIN"},
+    ])
+    db_session.commit.assert_awaited_once()
+
+
+# 로그아웃 시 토큰을 DB 거부 목록에 저장하고 커밋 후 캐시에 반영하는지 테스트
+async def test_logout_persists_revoked_token(member_service, db_session):
+    # Given
+    token_data = TokenData(id=1, username="test_user", role="USER", iat=1000, exp=4600)
+
+    with patch('src.member.service.decode_token', return_value=token_data), \
+            patch('src.member.service.revocation_list') as revocation_list:
+        # When
+        await member_service.logout(db_session, "token")
+
+    # Then
+    member_service.repository.revoke_token.assert_awaited_once_with(
+        db_session, 1, hashlib.sha256(b"token").digest(), datetime.fromtimestamp(4600, timezone.utc))
+    db_session.commit.assert_awaited_once()
+    revocation_list.revoke_token.assert_called_once_with("token", 1)
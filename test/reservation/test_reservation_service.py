@@ -1,29 +1,42 @@
-from datetime import datetime, timedelta
-from unittest.mock import MagicMock, patch
+from collections import namedtuple
+from datetime import datetime, timedelta, timezone
+import json
+from typing import List
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
-from sqlalchemy.orm import Session
+from prometheus_client import REGISTRY
+from pydantic import TypeAdapter
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.exam.exception import ExamCapacityExceededError
 from src.exam.model import Exam
 from src.member.model import Member
 from src.member.schema import Role
 from src.reservation.exception import ReservationNotFound, NotAllowed, ReservationValidationFailed
 from src.reservation.model import Reservation, Status
-from src.reservation.schema import ReservationCreate, ReservationResponse, ReservationUpdate, ReservationUpdateStatus
+from src.reservation.schema import ExportFormat, ReservationCreate, ReservationExportQuery, ReservationResponse, \
+    ReservationStatusBatch, ReservationUpdate, ReservationUpdateStatus
 from src.reservation.service import ReservationService
 
 
 @pytest.fixture
 def reservation_service():
     service = ReservationService()
-    service.repository = MagicMock()
-    service.exam_service = MagicMock()
+    service.repository = AsyncMock()
+    service.exam_service = AsyncMock()
     return service
 
 
 @pytest.fixture
 def db_session():
-    return MagicMock(spec=Session)
+    session = MagicMock(spec=AsyncSession)
+    session.info = {}
+    return session
+
+
+def reservation_events(event: str) -> float:
+    return REGISTRY.get_sample_value("reservation_events_total", {"event": event}) or 0.0
 
 
 @pytest.fixture
@@ -68,7 +81,7 @@ def mock_reservation():
 
 
 # 예약 생성 성공 시나리오
-def test_create_success(reservation_service, db_session, test_member, mock_exam):
+async def test_create_success(reservation_service, db_session, test_member, mock_exam):
     # Given
     reservation_create = ReservationCreate(
         exam_id=1,
@@ -87,18 +100,20 @@ def test_create_success(reservation_service, db_session, test_member, mock_exam)
     mock_saved_reservation.status = Status.PENDING
 
     reservation_service.repository.save.return_value = mock_saved_reservation
+    created = reservation_events("created")
 
     # When
-    result = reservation_service.create(db_session, test_member, reservation_create)
+    result = await reservation_service.create(db_session, test_member, reservation_create)
 
     # Then
     reservation_service.exam_service.get_by_id.assert_called_once_with(db_session, reservation_create.exam_id)
     reservation_service.repository.save.assert_called_once()
     assert result == mock_saved_reservation
+    assert reservation_events("created") == created + 1
 
 
 # 날짜 제한으로 인한 예약 생성 실패 시나리오
-def test_create_validation_failed(reservation_service, db_session, test_member, mock_exam):
+async def test_create_validation_failed(reservation_service, db_session, test_member, mock_exam):
     # Given
     reservation_create = ReservationCreate(
         exam_id=1,
@@ -110,17 +125,19 @@ def test_create_validation_failed(reservation_service, db_session, test_member,
 
     # exam_service.get_by_id 모킹
     reservation_service.exam_service.get_by_id.return_value = mock_exam
+    validation_failed = reservation_events("validation_failed")
 
     # When & Then
     with pytest.raises(ReservationValidationFailed):
-        reservation_service.create(db_session, test_member, reservation_create)
+        await reservation_service.create(db_session, test_member, reservation_create)
 
     reservation_service.exam_service.get_by_id.assert_called_once_with(db_session, reservation_create.exam_id)
     reservation_service.repository.save.assert_not_called()
+    assert reservation_events("validation_failed") == validation_failed + 1
 
 
 # 인원 초과로 인한 예약 생성 실패 시나리오
-def test_create_people_exceeded(reservation_service, db_session, test_member, mock_exam):
+async def test_create_people_exceeded(reservation_service, db_session, test_member, mock_exam):
     # Given
     reservation_create = ReservationCreate(
         exam_id=1,
@@ -134,14 +151,14 @@ def test_create_people_exceeded(reservation_service, db_session, test_member, mo
 
     # When & Then
     with pytest.raises(ReservationValidationFailed):
-        reservation_service.create(db_session, test_member, reservation_create)
+        await reservation_service.create(db_session, test_member, reservation_create)
 
     reservation_service.exam_service.get_by_id.assert_called_once_with(db_session, reservation_create.exam_id)
     reservation_service.repository.save.assert_not_called()
 
 
 # 사용자 본인 예약 조회 성공 시나리오
-def test_get_by_id_success_own(reservation_service, db_session, test_member, mock_reservation):
+async def test_get_by_id_success_own(reservation_service, db_session, test_member, mock_reservation):
     # Given
     reservation_id = 1
     mock_reservation.member_id = test_member.id
@@ -153,7 +170,7 @@ def test_get_by_id_success_own(reservation_service, db_session, test_member, moc
 
     with patch('src.reservation.schema.ReservationResponse.model_validate', return_value=mock_response):
         # When
-        result = reservation_service.get_by_id(db_session, test_member, reservation_id)
+        result = await reservation_service.get_by_id(db_session, test_member, reservation_id)
 
         # Then
         reservation_service.repository.find_by_id.assert_called_once_with(db_session, reservation_id)
@@ -161,7 +178,7 @@ def test_get_by_id_success_own(reservation_service, db_session, test_member, moc
 
 
 # 관리자의 타인 예약 조회 성공 시나리오
-def test_get_by_id_success_admin(reservation_service, db_session, test_admin, mock_reservation):
+async def test_get_by_id_success_admin(reservation_service, db_session, test_admin, mock_reservation):
     # Given
     reservation_id = 1
     mock_reservation.member_id = 3  # 다른 회원의 예약
@@ -173,7 +190,7 @@ def test_get_by_id_success_admin(reservation_service, db_session, test_admin, mo
 
     with patch('src.reservation.schema.ReservationResponse.model_validate', return_value=mock_response):
         # When
-        result = reservation_service.get_by_id(db_session, test_admin, reservation_id)
+        result = await reservation_service.get_by_id(db_session, test_admin, reservation_id)
 
         # Then
         reservation_service.repository.find_by_id.assert_called_once_with(db_session, reservation_id)
@@ -181,20 +198,20 @@ def test_get_by_id_success_admin(reservation_service, db_session, test_admin, mo
 
 
 # 존재하지 않는 예약 조회 실패 시나리오
-def test_get_by_id_not_found(reservation_service, db_session, test_member):
+async def test_get_by_id_not_found(reservation_service, db_session, test_member):
     # Given
     reservation_id = 999
     reservation_service.repository.find_by_id.return_value = None
 
     # When & Then
     with pytest.raises(ReservationNotFound):
-        reservation_service.get_by_id(db_session, test_member, reservation_id)
+        await reservation_service.get_by_id(db_session, test_member, reservation_id)
 
     reservation_service.repository.find_by_id.assert_called_once_with(db_session, reservation_id)
 
 
 # 권한 없는 예약 조회 실패 시나리오
-def test_get_by_id_not_allowed(reservation_service, db_session, test_member, mock_reservation):
+async def test_get_by_id_not_allowed(reservation_service, db_session, test_member, mock_reservation):
     # Given
     reservation_id = 1
     mock_reservation.member_id = 999  # 다른 회원의 예약
@@ -203,52 +220,33 @@ def test_get_by_id_not_allowed(reservation_service, db_session, test_member, moc
 
     # When & Then
     with pytest.raises(NotAllowed):
-        reservation_service.get_by_id(db_session, test_member, reservation_id)
+        await reservation_service.get_by_id(db_session, test_member, reservation_id)
 
     reservation_service.repository.find_by_id.assert_called_once_with(db_session, reservation_id)
 
 
-# 사용자의 모든 예약 목록 조회 테스트
-def test_get_all(reservation_service, db_session, test_member, mock_reservation):
-    # Given
-    mock_reservations = [mock_reservation]
-    reservation_service.repository.find_by_member_id.return_value = mock_reservations
-
-    # ReservationResponse.model_validate 모킹
-    mock_response = MagicMock(spec=ReservationResponse)
-
-    with patch('src.reservation.schema.ReservationResponse.model_validate', return_value=mock_response):
-        # When
-        result = reservation_service.get_all(db_session, test_member)
-
-        # Then
-        reservation_service.repository.find_by_member_id.assert_called_once_with(db_session, test_member.id)
-        assert len(result) == 1
-        assert result[0] == mock_response
-
-
-# 특정 회원 예약 목록 조회 테스트
-def test_get_all_by_member_id(reservation_service, db_session, mock_reservation):
+# 회원 예약 목록 JSON 직렬화 테스트
+async def test_get_all_json_by_member_id(reservation_service, db_session):
     # Given
     member_id = 1
-    mock_reservations = [mock_reservation]
-    reservation_service.repository.find_by_member_id.return_value = mock_reservations
+    row_type = namedtuple("Row", ["id", "status", "people", "created_at", "modified_at"])
+    created_at = datetime(2025, 3, 1, 9, 30, 15, 123456, tzinfo=timezone.utc)
+    rows = [row_type(1, Status.PENDING, 5, created_at, created_at)]
+    reservation_service.repository.find_rows_by_member_id.return_value = rows
 
-    # ReservationResponse.model_validate 모킹
-    mock_response = MagicMock(spec=ReservationResponse)
-
-    with patch('src.reservation.schema.ReservationResponse.model_validate', return_value=mock_response):
-        # When
-        result = reservation_service.get_all_by_member_id(db_session, member_id)
+    # When
+    result = await reservation_service.get_all_json_by_member_id(db_session, member_id)
 
-        # Then
-        reservation_service.repository.find_by_member_id.assert_called_once_with(db_session, member_id)
-        assert len(result) == 1
-        assert result[0] == mock_response
+    # Then
+    reservation_service.repository.find_rows_by_member_id.assert_called_once_with(db_session, member_id)
+    expected = TypeAdapter(List[ReservationResponse]).dump_json(
+        [ReservationResponse.model_validate(row._asdict()) for row in rows]
+    )
+    assert result == expected
 
 
 # 사용자 본인 예약 수정 성공 시나리오
-def test_update_success_own(reservation_service, db_session, test_member, mock_reservation):
+async def test_update_success_own(reservation_service, db_session, test_member, mock_reservation):
     # Given
     reservation_update = ReservationUpdate(
         id=1,
@@ -268,7 +266,7 @@ def test_update_success_own(reservation_service, db_session, test_member, mock_r
 
     with patch('src.reservation.schema.ReservationResponse.model_validate', return_value=mock_response):
         # When
-        result = reservation_service.update(db_session, test_member, reservation_update)
+        result = await reservation_service.update(db_session, test_member, reservation_update)
 
         # Then
         reservation_service.repository.find_by_id.assert_called_once_with(
@@ -281,7 +279,7 @@ def test_update_success_own(reservation_service, db_session, test_member, mock_r
 
 
 # 관리자의 타인 예약 수정 성공 시나리오
-def test_update_success_admin(reservation_service, db_session, test_admin, mock_reservation):
+async def test_update_success_admin(reservation_service, db_session, test_admin, mock_reservation):
     # Given
     reservation_update = ReservationUpdate(
         id=1,
@@ -300,7 +298,7 @@ def test_update_success_admin(reservation_service, db_session, test_admin, mock_
 
     with patch('src.reservation.schema.ReservationResponse.model_validate', return_value=mock_response):
         # When
-        result = reservation_service.update(db_session, test_admin, reservation_update)
+        result = await reservation_service.update(db_session, test_admin, reservation_update)
 
         # Then
         reservation_service.repository.find_by_id.assert_called_once_with(
@@ -313,7 +311,7 @@ def test_update_success_admin(reservation_service, db_session, test_admin, mock_
 
 
 # 존재하지 않는 예약 수정 실패 시나리오
-def test_update_not_found(reservation_service, db_session, test_member):
+async def test_update_not_found(reservation_service, db_session, test_member):
     # Given
     reservation_update = ReservationUpdate(
         id=1,
@@ -324,7 +322,7 @@ def test_update_not_found(reservation_service, db_session, test_member):
 
     # When & Then
     with pytest.raises(ReservationNotFound):
-        reservation_service.update(db_session, test_member, reservation_update)
+        await reservation_service.update(db_session, test_member, reservation_update)
 
     reservation_service.repository.find_by_id.assert_called_once_with(
         db_session,
@@ -334,7 +332,7 @@ def test_update_not_found(reservation_service, db_session, test_member):
 
 
 # 권한 없는 예약 수정 실패 시나리오
-def test_update_not_allowed(reservation_service, db_session, test_member, mock_reservation):
+async def test_update_not_allowed(reservation_service, db_session, test_member, mock_reservation):
     # Given
     reservation_update = ReservationUpdate(
         id=1,
@@ -347,7 +345,7 @@ def test_update_not_allowed(reservation_service, db_session, test_member, mock_r
 
     # When & Then
     with pytest.raises(NotAllowed):
-        reservation_service.update(db_session, test_member, reservation_update)
+        await reservation_service.update(db_session, test_member, reservation_update)
 
     reservation_service.repository.find_by_id.assert_called_once_with(
         db_session,
@@ -357,7 +355,7 @@ def test_update_not_allowed(reservation_service, db_session, test_member, mock_r
 
 
 # 예약 상태 확정 변경 시나리오
-def test_update_status_confirmed(reservation_service, db_session, mock_reservation):
+async def test_update_status_confirmed(reservation_service, db_session, mock_reservation):
     # Given
     reservation_update_status = ReservationUpdateStatus(
         id=1,
@@ -368,7 +366,7 @@ def test_update_status_confirmed(reservation_service, db_session, mock_reservati
     mock_reservation.exam_id = 1
     mock_reservation.people = 5
 
-    reservation_service.repository.find_by_id.return_value = mock_reservation
+    reservation_service.repository.find_by_id_for_update.return_value = mock_reservation
 
     # 저장 메서드 모킹
     mock_updated_reservation = MagicMock(spec=Reservation)
@@ -380,19 +378,20 @@ def test_update_status_confirmed(reservation_service, db_session, mock_reservati
 
     with patch('src.reservation.schema.ReservationResponse.model_validate', return_value=mock_response):
         # When
-        result = reservation_service.update_status(db_session, reservation_update_status)
+        result = await reservation_service.update_status(db_session, reservation_update_status)
 
         # Then
-        reservation_service.repository.find_by_id.assert_called_once_with(db_session, reservation_update_status.id)
+        reservation_service.repository.find_by_id_for_update.assert_called_once_with(db_session, reservation_update_status.id)
         assert mock_reservation.status == Status.CONFIRMED
         reservation_service.exam_service.update_people.assert_called_once_with(db_session, mock_reservation.exam_id,
                                                                                mock_reservation.people)
         reservation_service.repository.save.assert_called_once_with(db_session, mock_reservation)
+        db_session.commit.assert_awaited_once()
         assert result == mock_response
 
 
 # 예약 상태 거부 변경 시나리오
-def test_update_status_denied(reservation_service, db_session, mock_reservation):
+async def test_update_status_denied(reservation_service, db_session, mock_reservation):
     # Given
     reservation_update_status = ReservationUpdateStatus(
         id=1,
@@ -401,7 +400,7 @@ def test_update_status_denied(reservation_service, db_session, mock_reservation)
 
     mock_reservation.status = Status.PENDING
 
-    reservation_service.repository.find_by_id.return_value = mock_reservation
+    reservation_service.repository.find_by_id_for_update.return_value = mock_reservation
 
     # 저장 메서드 모킹
     mock_updated_reservation = MagicMock(spec=Reservation)
@@ -413,55 +412,320 @@ def test_update_status_denied(reservation_service, db_session, mock_reservation)
 
     with patch('src.reservation.schema.ReservationResponse.model_validate', return_value=mock_response):
         # When
-        result = reservation_service.update_status(db_session, reservation_update_status)
+        result = await reservation_service.update_status(db_session, reservation_update_status)
 
         # Then
-        reservation_service.repository.find_by_id.assert_called_once_with(db_session, reservation_update_status.id)
+        reservation_service.repository.find_by_id_for_update.assert_called_once_with(db_session, reservation_update_status.id)
         assert mock_reservation.status == Status.DENIED
         reservation_service.exam_service.update_people.assert_not_called()  # DENIED 상태에서는 호출 안 함
         reservation_service.repository.save.assert_called_once_with(db_session, mock_reservation)
         assert result == mock_response
 
 
+# 이미 확정된 예약 재확정 시 인원 중복 반영 방지 시나리오
+async def test_update_status_already_confirmed(reservation_service, db_session, mock_reservation):
+    # Given
+    reservation_update_status = ReservationUpdateStatus(
+        id=1,
+        status=Status.CONFIRMED
+    )
+
+    mock_reservation.status = Status.CONFIRMED
+    reservation_service.repository.find_by_id_for_update.return_value = mock_reservation
+
+    with patch('src.reservation.schema.ReservationResponse.model_validate'):
+        # When
+        await reservation_service.update_status(db_session, reservation_update_status)
+
+    # Then
+    reservation_service.exam_service.update_people.assert_not_called()
+
+
+# 확정된 예약 거절 시 인원 반환 시나리오
+async def test_update_status_confirmed_to_denied(reservation_service, db_session, mock_reservation):
+    # Given
+    reservation_update_status = ReservationUpdateStatus(
+        id=1,
+        status=Status.DENIED
+    )
+
+    mock_reservation.status = Status.CONFIRMED
+    mock_reservation.exam_id = 1
+    mock_reservation.people = 5
+    reservation_service.repository.find_by_id_for_update.return_value = mock_reservation
+
+    with patch('src.reservation.schema.ReservationResponse.model_validate'):
+        # When
+        await reservation_service.update_status(db_session, reservation_update_status)
+
+    # Then
+    reservation_service.exam_service.update_people.assert_called_once_with(db_session, 1, -5)
+
+
 # 존재하지 않는 예약 상태 변경 실패 시나리오
-def test_update_status_not_found(reservation_service, db_session):
+async def test_update_status_not_found(reservation_service, db_session):
     # Given
     reservation_update_status = ReservationUpdateStatus(
         id=999,
         status=Status.CONFIRMED
     )
 
-    reservation_service.repository.find_by_id.return_value = None
+    reservation_service.repository.find_by_id_for_update.return_value = None
 
     # When & Then
     with pytest.raises(ReservationNotFound):
-        reservation_service.update_status(db_session, reservation_update_status)
+        await reservation_service.update_status(db_session, reservation_update_status)
 
-    reservation_service.repository.find_by_id.assert_called_once_with(db_session, reservation_update_status.id)
+    reservation_service.repository.find_by_id_for_update.assert_called_once_with(db_session, reservation_update_status.id)
     reservation_service.repository.save.assert_not_called()
 
 
+StatusRow = namedtuple("StatusRow", ["id", "exam_id", "people", "status"])
+PendingRow = namedtuple("PendingRow", ["id", "exam_id", "people", "status", "created_at"])
+
+
+# 예약 상태 일괄 변경 시 시험별 인원 반영 시나리오
+async def test_update_status_batch_groups_by_exam(reservation_service, db_session):
+    # Given
+    batch = ReservationStatusBatch(items=[
+        ReservationUpdateStatus(id=1, status=Status.CONFIRMED),
+        ReservationUpdateStatus(id=2, status=Status.CONFIRMED),
+        ReservationUpdateStatus(id=3, status=Status.CONFIRMED),
+        ReservationUpdateStatus(id=4, status=Status.DENIED),
+    ])
+    reservation_service.repository.find_status_rows_for_update.return_value = [
+        StatusRow(1, 10, 5, Status.PENDING),
+        StatusRow(2, 10, 3, Status.PENDING),
+        StatusRow(3, 20, 2, Status.PENDING),
+        StatusRow(4, 20, 4, Status.CONFIRMED),
+    ]
+
+    # When
+    content = json.loads(await reservation_service.update_status_batch(db_session, batch))
+
+    # Then
+    assert reservation_service.exam_service.update_people.await_args_list == [
+        ((db_session, 10, 8),),
+        ((db_session, 20, -2),),
+    ]
+    reservation_service.repository.update_statuses.assert_any_await(db_session, [1, 2, 3], Status.CONFIRMED)
+    reservation_service.repository.update_statuses.assert_any_await(db_session, [4], Status.DENIED)
+    assert content["updated"] == 4
+    assert [result["result"] for result in content["results"]] == ["UPDATED"] * 4
+    db_session.commit.assert_awaited_once()
+
+
+# 예약 상태 일괄 변경 시 정원 초과분만 실패 처리 시나리오
+async def test_update_status_batch_capacity_exceeded(reservation_service, db_session):
+    # Given
+    batch = ReservationStatusBatch(items=[
+        ReservationUpdateStatus(id=1, status=Status.CONFIRMED),
+        ReservationUpdateStatus(id=2, status=Status.CONFIRMED),
+        ReservationUpdateStatus(id=3, status=Status.CONFIRMED),
+    ])
+    reservation_service.repository.find_status_rows_for_update.return_value = [
+        StatusRow(1, 10, 5, Status.PENDING),
+        StatusRow(2, 10, 4, Status.PENDING),
+        StatusRow(3, 10, 1, Status.PENDING),
+    ]
+    reservation_service.exam_service.update_people.side_effect = [ExamCapacityExceededError(), None]
+    reservation_service.exam_service.lock_remaining_seats.return_value = 6
+    confirmed, capacity_exceeded = reservation_events("confirmed"), reservation_events("capacity_exceeded")
+
+    # When
+    content = json.loads(await reservation_service.update_status_batch(db_session, batch))
+
+    # Then
+    reservation_service.exam_service.update_people.assert_awaited_with(db_session, 10, 6)
+    reservation_service.repository.update_statuses.assert_awaited_once_with(db_session, [1, 3], Status.CONFIRMED)
+    assert [result["result"] for result in content["results"]] == ["UPDATED", "CAPACITY_EXCEEDED", "UPDATED"]
+    assert content["failed"] == 1
+    assert reservation_events("confirmed") == confirmed + 2
+    assert reservation_events("capacity_exceeded") == capacity_exceeded + 1
+
+
+# 예약 상태 일괄 변경 시 없는 예약, 중복, 동일 상태 처리 시나리오
+async def test_update_status_batch_skips_invalid_items(reservation_service, db_session):
+    # Given
+    batch = ReservationStatusBatch(items=[
+        ReservationUpdateStatus(id=1, status=Status.CONFIRMED),
+        ReservationUpdateStatus(id=1, status=Status.DENIED),
+        ReservationUpdateStatus(id=999, status=Status.CONFIRMED),
+    ])
+    reservation_service.repository.find_status_rows_for_update.return_value = [
+        StatusRow(1, 10, 5, Status.CONFIRMED),
+    ]
+
+    # When
+    content = json.loads(await reservation_service.update_status_batch(db_session, batch))
+
+    # Then
+    reservation_service.repository.find_status_rows_for_update.assert_awaited_once_with(db_session, [1, 999])
+    reservation_service.exam_service.update_people.assert_not_called()
+    reservation_service.repository.update_statuses.assert_not_called()
+    assert [result["result"] for result in content["results"]] == ["UNCHANGED", "DUPLICATE", "NOT_FOUND"]
+    assert (content["updated"], content["unchanged"], content["failed"]) == (0, 1, 2)
+
+
+# 대기 예약 선착순 자동 확정 및 정원 초과분 거절 시나리오
+async def test_allocate_pending_confirms_in_order_and_denies_rest(reservation_service, db_session):
+    # Given
+    now = datetime.now(timezone.utc)
+    rows = [PendingRow(id, 10, people, Status.PENDING, now + timedelta(seconds=id)) for id, people in
+            [(1, 3), (2, 4), (3, 2)]]
+    reservation_service.repository.try_lock_allocation.return_value = True
+    reservation_service.repository.find_watermark.return_value = None
+    reservation_service.repository.find_pending_rows_for_update.return_value = rows
+    reservation_service.exam_service.update_people.side_effect = [ExamCapacityExceededError(), None]
+    reservation_service.exam_service.lock_remaining_seats.return_value = 5
+    confirmed, denied = reservation_events("confirmed"), reservation_events("denied")
+
+    # When
+    allocated = await reservation_service.allocate_pending(db_session, 10, 500, timedelta(seconds=1))
+
+    # Then
+    assert allocated == 3
+    reservation_service.exam_service.update_people.assert_awaited_with(db_session, 10, 5)
+    reservation_service.repository.update_statuses.assert_any_await(db_session, [1, 3], Status.CONFIRMED)
+    reservation_service.repository.update_statuses.assert_any_await(db_session, [2], Status.DENIED)
+    reservation_service.repository.advance_watermark.assert_awaited_once_with(db_session, 10, rows[-1].created_at,
+                                                                              3, 2, 1)
+    db_session.commit.assert_awaited_once()
+    assert reservation_events("confirmed") == confirmed + 2
+    assert reservation_events("denied") == denied + 1
+
+
+# 워터마크 이후 대기 예약부터 이어서 처리하는 시나리오
+async def test_allocate_pending_resumes_after_watermark(reservation_service, db_session):
+    # Given
+    watermark_at = datetime.now(timezone.utc)
+    reservation_service.repository.try_lock_allocation.return_value = True
+    reservation_service.repository.find_watermark.return_value = MagicMock(reservation_created_at=watermark_at,
+                                                                           reservation_id=7)
+    reservation_service.repository.find_pending_rows_for_update.return_value = []
+
+    # When
+    allocated = await reservation_service.allocate_pending(db_session, 10, 500, timedelta(seconds=1))
+
+    # Then
+    assert allocated == 0
+    reservation_service.repository.find_pending_rows_for_update.assert_awaited_once_with(
+        db_session, 10, 500, timedelta(seconds=1), (watermark_at, 7))
+    reservation_service.repository.advance_watermark.assert_not_called()
+
+
+# 다른 워커가 처리 중인 시험 건너뛰기 시나리오
+async def test_allocate_pending_skips_locked_exam(reservation_service, db_session):
+    # Given
+    reservation_service.repository.try_lock_allocation.return_value = False
+
+    # When
+    allocated = await reservation_service.allocate_pending(db_session, 10, 500, timedelta(seconds=1))
+
+    # Then
+    assert allocated == 0
+    reservation_service.repository.find_pending_rows_for_update.assert_not_called()
+
+
+ExportRow = namedtuple("ExportRow", ["id", "exam_id", "username", "status", "created_at"])
+
+
+def stream_partitions(*partitions):
+    async def stream(db, yield_per, **filters):
+        for rows in partitions:
+            yield rows
+
+    return MagicMock(side_effect=stream)
+
+
+async def collect(chunks) -> bytes:
+    return b"".join([chunk async for chunk in chunks])
+
+
+# 시험별 예약 NDJSON 스트리밍 내보내기 시나리오
+async def test_export_ndjson_streams_partitions(reservation_service, db_session):
+    # Given
+    created_at = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    reservation_service.repository.stream_export_rows = stream_partitions(
+        [ExportRow(1, 10, "a", Status.CONFIRMED, created_at)],
+        [ExportRow(2, 10, "b", Status.PENDING, created_at)],
+    )
+    query = ReservationExportQuery(exam_id=10)
+
+    with patch('src.reservation.service.open_db', return_value=MagicMock(
+            __aenter__=AsyncMock(return_value=db_session), __aexit__=AsyncMock(return_value=False))):
+        # When
+        content = await collect(reservation_service.export(query))
+
+    # Then
+    lines = [json.loads(line) for line in content.splitlines()]
+    assert [line["id"] for line in lines] == [1, 2]
+    assert lines[0]["status"] == "CONFIRMED"
+    assert lines[0]["created_at"] == "2026-01-01T00:00:00Z"
+    reservation_service.repository.stream_export_rows.assert_called_once_with(
+        db_session, 1000, exam_id=10, date_from=None, date_to=None, status=None)
+
+
+# 예약 CSV 내보내기 시 헤더 포함 시나리오
+async def test_export_csv_writes_header_first(reservation_service, db_session):
+    # Given
+    created_at = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    reservation_service.repository.export_columns = MagicMock(return_value=list(ExportRow._fields))
+    reservation_service.repository.stream_export_rows = stream_partitions(
+        [ExportRow(1, 10, "a,b", Status.CONFIRMED, created_at)],
+    )
+    query = ReservationExportQuery(date_from=datetime(2026, 1, 1), format=ExportFormat.CSV)
+
+    with patch('src.reservation.service.open_db', return_value=MagicMock(
+            __aenter__=AsyncMock(return_value=db_session), __aexit__=AsyncMock(return_value=False))):
+        # When
+        content = await collect(reservation_service.export(query))
+
+    # Then
+    assert content.decode().splitlines() == [
+        "id,exam_id,username,status,created_at",
+        '1,10,"a,b",CONFIRMED,2026-01-01T00:00:00+00:00',
+    ]
+
+
+# 필터 없는 예약 내보내기 요청 실패 시나리오
+def test_export_query_requires_filter():
+    # When & Then
+    with pytest.raises(ValueError):
+        ReservationExportQuery(format=ExportFormat.CSV)
+
+
+# 예약 상태를 대기중으로 되돌리는 요청 실패 시나리오
+def test_update_status_rejects_pending():
+    # When & Then
+    with pytest.raises(ValueError):
+        ReservationUpdateStatus(id=1, status=Status.PENDING)
+
+    with pytest.raises(ValueError):
+        ReservationStatusBatch(items=[{"id": 1, "status": "CONFIRMED"}, {"id": 2, "status": "PENDING"}])
+
+
 # 대기중인 본인 예약 삭제 성공 시나리오
-def test_delete_success_own_pending(reservation_service, db_session, test_member, mock_reservation):
+async def test_delete_success_own_pending(reservation_service, db_session, test_member, mock_reservation):
     # Given
     reservation_id = 1
     mock_reservation.member_id = test_member.id
     mock_reservation.status = Status.PENDING
 
-    reservation_service.repository.find_by_id.return_value = mock_reservation
+    reservation_service.repository.find_by_id_for_update.return_value = mock_reservation
     reservation_service.repository.delete.return_value = True
 
     # When
-    reservation_service.delete(db_session, test_member, reservation_id)
+    await reservation_service.delete(db_session, test_member, reservation_id)
 
     # Then
-    reservation_service.repository.find_by_id.assert_called_once_with(db_session, reservation_id)
+    reservation_service.repository.find_by_id_for_update.assert_called_once_with(db_session, reservation_id)
     reservation_service.repository.delete.assert_called_once_with(db_session, mock_reservation)
     reservation_service.exam_service.update_people.assert_not_called()  # PENDING 상태에서는 호출 안 함
 
 
 # 확정된 본인 예약 삭제 성공 시나리오
-def test_delete_success_own_confirmed(reservation_service, db_session, test_member, mock_reservation):
+async def test_delete_success_own_confirmed(reservation_service, db_session, test_member, mock_reservation):
     # Given
     reservation_id = 1
     mock_reservation.member_id = test_member.id
@@ -469,63 +733,63 @@ def test_delete_success_own_confirmed(reservation_service, db_session, test_memb
     mock_reservation.exam_id = 1
     mock_reservation.people = 5
 
-    reservation_service.repository.find_by_id.return_value = mock_reservation
+    reservation_service.repository.find_by_id_for_update.return_value = mock_reservation
     reservation_service.repository.delete.return_value = True
 
     # When
-    reservation_service.delete(db_session, test_member, reservation_id)
+    await reservation_service.delete(db_session, test_member, reservation_id)
 
     # Then
-    reservation_service.repository.find_by_id.assert_called_once_with(db_session, reservation_id)
+    reservation_service.repository.find_by_id_for_update.assert_called_once_with(db_session, reservation_id)
     reservation_service.repository.delete.assert_called_once_with(db_session, mock_reservation)
     reservation_service.exam_service.update_people.assert_called_once_with(db_session, mock_reservation.exam_id,
                                                                            -mock_reservation.people)
 
 
 # 관리자의 타인 예약 삭제 성공 시나리오
-def test_delete_success_admin(reservation_service, db_session, test_admin, mock_reservation):
+async def test_delete_success_admin(reservation_service, db_session, test_admin, mock_reservation):
     # Given
     reservation_id = 1
     mock_reservation.member_id = 999  # 다른 회원의 예약
     mock_reservation.status = Status.PENDING
 
-    reservation_service.repository.find_by_id.return_value = mock_reservation
+    reservation_service.repository.find_by_id_for_update.return_value = mock_reservation
     reservation_service.repository.delete.return_value = True
 
     # When
-    reservation_service.delete(db_session, test_admin, reservation_id)
+    await reservation_service.delete(db_session, test_admin, reservation_id)
 
     # Then
-    reservation_service.repository.find_by_id.assert_called_once_with(db_session, reservation_id)
+    reservation_service.repository.find_by_id_for_update.assert_called_once_with(db_session, reservation_id)
     reservation_service.repository.delete.assert_called_once_with(db_session, mock_reservation)
 
 
 # 존재하지 않는 예약 삭제 시나리오
-def test_delete_not_found(reservation_service, db_session, test_member):
+async def test_delete_not_found(reservation_service, db_session, test_member):
     # Given
     reservation_id = 999
-    reservation_service.repository.find_by_id.return_value = None
+    reservation_service.repository.find_by_id_for_update.return_value = None
 
     # When
-    result = reservation_service.delete(db_session, test_member, reservation_id)
+    result = await reservation_service.delete(db_session, test_member, reservation_id)
 
     # Then
-    reservation_service.repository.find_by_id.assert_called_once_with(db_session, reservation_id)
+    reservation_service.repository.find_by_id_for_update.assert_called_once_with(db_session, reservation_id)
     reservation_service.repository.delete.assert_not_called()
     assert isinstance(result, ReservationNotFound)
 
 
 # 권한 없는 예약 삭제 실패 시나리오
-def test_delete_not_allowed(reservation_service, db_session, test_member, mock_reservation):
+async def test_delete_not_allowed(reservation_service, db_session, test_member, mock_reservation):
     # Given
     reservation_id = 1
     mock_reservation.member_id = 999  # 다른 회원의 예약
 
-    reservation_service.repository.find_by_id.return_value = mock_reservation
+    reservation_service.repository.find_by_id_for_update.return_value = mock_reservation
 
     # When & Then
     with pytest.raises(NotAllowed):
-        reservation_service.delete(db_session, test_member, reservation_id)
+        await reservation_service.delete(db_session, test_member, reservation_id)
 
-    reservation_service.repository.find_by_id.assert_called_once_with(db_session, reservation_id)
+    reservation_service.repository.find_by_id_for_update.assert_called_once_with(db_session, reservation_id)
     reservation_service.repository.delete.assert_not_called()